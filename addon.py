@@ -3,18 +3,29 @@
 import bpy
 import mathutils
 import json
+import base64
 import threading
 import socket
 import time
+import queue
 import requests
 import tempfile
 import traceback
 import os
 import shutil
 import zipfile
+import zlib
+import hashlib
+import posixpath
+import struct
+import stat
+import errno
+import numpy as np
+from urllib.parse import unquote, urlparse, parse_qs
 from bpy.props import StringProperty, IntProperty, BoolProperty, EnumProperty
 import io
-from contextlib import redirect_stdout, suppress
+import mimetypes
+from contextlib import contextmanager, redirect_stdout, suppress
 
 bl_info = {
     "name": "Blender MCP",
@@ -28,14 +39,1276 @@ bl_info = {
 
 RODIN_FREE_TRIAL_KEY = "k9TcfFoEhNd9cCPP2guHAHHHkctZHIRhZDywZ1euGUXwihbYLpOjQhofby80NJez"
 
+# Size limit of the downloaded Poly Haven files kept in the asset cache
+ASSET_CACHE_MAX_BYTES = 4 * 1024 * 1024 * 1024
+
+# Size limit of the extracted Sketchfab models kept in the asset cache
+SKETCHFAB_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+# Written after a model is fully extracted; its presence marks a usable cache entry
+SKETCHFAB_MANIFEST = "blendermcp_manifest.json"
+
+# How long Sketchfab search responses are reused, and how many are kept
+SKETCHFAB_SEARCH_TTL = 600
+SKETCHFAB_SEARCH_CACHE_SIZE = 128
+
+# Imports are never decimated below this fraction of their faces
+MIN_DECIMATE_RATIO = 0.01
+# (level, ratio of LOD0 faces) of the generated levels of detail
+LOD_RATIOS = [(1, 0.5), (2, 0.25)]
+
+# Resolution used for the first, fast pass of progressive texture loading
+PROGRESSIVE_PREVIEW_RESOLUTION = "1k"
+
+# Quality tier requested from Hyper3D Rodin; part of the generation cache key
+RODIN_TIER = "Sketch"
+
+# Tracked Rodin jobs are polled with exponential backoff between these delays, in seconds
+RODIN_POLL_INITIAL = 2.0
+RODIN_POLL_MAX = 30.0
+# Jobs still unfinished after this many seconds are given up
+RODIN_JOB_TIMEOUT = 1800
+# Longest single wait_for_generation call, in seconds
+RODIN_WAIT_MAX = 600
+# Error codes and messages of job creations refused for lack of credits; HTTP 402 counts as well
+RODIN_QUOTA_ERRORS = ("insufficient_fund", "insufficient fund", "insufficient_credit", "insufficient credit",
+                      "insufficient balance", "exhausted balance")
+# Batch items refused by the API's rate limit are retried this often, with doubling delays from
+# RODIN_RATE_LIMIT_BACKOFF up to RODIN_POLL_MAX seconds
+RODIN_RATE_LIMIT_RETRIES = 5
+RODIN_RATE_LIMIT_BACKOFF = 5.0
+
+
+def _resolution_value(resolution):
+    """Turn a Poly Haven resolution string like '4k' into a sortable number"""
+    try:
+        return int(str(resolution).lower().rstrip("k"))
+    except ValueError:
+        return 0
+
+
+class AssetCache:
+    """On-disk cache for downloaded asset files, shared by all integrations"""
+
+    def __init__(self, root):
+        self.root = root
+
+    def path(self, *parts):
+        """Return the cache path for the given parts, creating parent directories"""
+        file_path = os.path.join(self.root, *parts)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        return file_path
+
+    def find(self, *parts):
+        """Return the cache path for the given parts if it has been downloaded, else None"""
+        file_path = os.path.join(self.root, *parts)
+        return file_path if os.path.exists(file_path) else None
+
+    def fetch(self, url, *parts, timeout=60):
+        """Return the cached file for url, downloading it first if it is missing"""
+        file_path = self.path(*parts)
+        if os.path.exists(file_path):
+            # Refresh the modification time so recently used files are kept longest
+            with suppress(OSError):
+                os.utime(file_path)
+            return file_path
+
+        response = requests.get(url, stream=True, timeout=timeout)
+        response.raise_for_status()
+
+        # Write to a temporary name first so a failed download never looks cached
+        partial_path = f"{file_path}.{threading.get_ident()}.part"
+        try:
+            with open(partial_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+            os.replace(partial_path, file_path)
+        finally:
+            with suppress(OSError):
+                os.unlink(partial_path)
+        return file_path
+
+    def trim_dirs(self, *parts, depth=1, max_bytes, keep=()):
+        """Delete whole least recently used directories, depth levels below parts, to fit max_bytes"""
+        directory = os.path.join(self.root, *parts)
+        if not os.path.isdir(directory):
+            return []
+
+        entry_dirs = [directory]
+        for _ in range(depth):
+            entry_dirs = [
+                os.path.join(parent, name)
+                for parent in entry_dirs
+                for name in os.listdir(parent)
+                if os.path.isdir(os.path.join(parent, name))
+            ]
+
+        entries = []
+        total = 0
+        for entry_dir in entry_dirs:
+            size = 0
+            for dirpath, _, filenames in os.walk(entry_dir):
+                for filename in filenames:
+                    with suppress(OSError):
+                        size += os.path.getsize(os.path.join(dirpath, filename))
+            entries.append((os.path.getmtime(entry_dir), size, entry_dir))
+            total += size
+
+        removed = []
+        for _, size, entry_dir in sorted(entries):
+            if total <= max_bytes:
+                break
+            if os.path.abspath(entry_dir) in {os.path.abspath(k) for k in keep}:
+                continue
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+            removed.append(entry_dir)
+        return removed
+
+    def trim(self, *parts, max_bytes, keep=()):
+        """Delete the least recently used files under parts until they fit in max_bytes"""
+        directory = os.path.join(self.root, *parts)
+        if not os.path.isdir(directory):
+            return []
+
+        entries = []
+        total = 0
+        for dirpath, _, filenames in os.walk(directory):
+            for filename in filenames:
+                file_path = os.path.join(dirpath, filename)
+                with suppress(OSError):
+                    stat = os.stat(file_path)
+                    entries.append((stat.st_mtime, stat.st_size, file_path))
+                    total += stat.st_size
+
+        removed = []
+        for _, size, file_path in sorted(entries):
+            if total <= max_bytes:
+                break
+            if os.path.abspath(file_path) in keep or file_path.endswith(".part"):
+                continue
+            with suppress(OSError):
+                os.unlink(file_path)
+                total -= size
+                removed.append(file_path)
+        return removed
+
+
+asset_cache = AssetCache(
+    os.environ.get("BLENDERMCP_CACHE_DIR") or os.path.join(tempfile.gettempdir(), "blendermcp_cache")
+)
+
+
+def _encode_png(pixels):
+    """Encode an (height, width, 3 or 4) uint8 array as PNG bytes, rows top to bottom"""
+    height, width, channels = pixels.shape
+    color_type = {3: 2, 4: 6}[channels]
+    # Filter type 0 (none) in front of every row
+    raw = np.concatenate([np.zeros((height, 1), dtype=np.uint8), pixels.reshape(height, -1)], axis=1)
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, color_type, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw.tobytes(), 6))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _resample_axis(pixels, size, axis):
+    """Box-filter an array down to `size` samples along `axis`, weighting partially covered pixels"""
+    count = pixels.shape[axis]
+    if count == size:
+        return pixels
+    values = np.moveaxis(pixels, axis, 0).astype(np.float64)
+    # Area average through the integral of each row, sampled at fractional pixel edges
+    integral = np.concatenate([np.zeros((1,) + values.shape[1:]), np.cumsum(values, axis=0)])
+    edges = np.linspace(0.0, count, size + 1)
+    lower = np.minimum(np.floor(edges).astype(np.int64), count)
+    upper = np.minimum(lower + 1, count)
+    fraction = (edges - lower).reshape((-1,) + (1,) * (values.ndim - 1))
+    at_edges = integral[lower] + (integral[upper] - integral[lower]) * fraction
+    return np.moveaxis((at_edges[1:] - at_edges[:-1]) * (size / count), 0, axis)
+
+
+def _resize_pixels(pixels, width, height):
+    """Resize an (height, width, channels) uint8 array with an area-averaging filter"""
+    if pixels.shape[:2] == (height, width):
+        return pixels
+    resized = _resample_axis(_resample_axis(pixels, height, 0), width, 1)
+    return np.clip(np.rint(resized), 0, 255).astype(np.uint8)
+
+
+def _encode_image(pixels, format="png", quality=85):
+    """
+    Encode an (height, width, 3) uint8 array in memory.
+
+    PNG is written directly; JPEG and WebP go through Pillow, and fall back to
+    PNG when Pillow isn't installed in Blender's Python. Returns (bytes, format).
+    """
+    format = format.lower()
+    if format == "jpg":
+        format = "jpeg"
+    if format in ("jpeg", "webp"):
+        try:
+            from PIL import Image
+        except ImportError:
+            format = "png"
+        else:
+            output = io.BytesIO()
+            Image.fromarray(pixels, "RGB").save(output, format=format.upper(), quality=int(quality))
+            return output.getvalue(), format
+    elif format != "png":
+        raise ValueError(f"Unsupported image format: {format}")
+    return _encode_png(pixels), "png"
+
+
+# Viewport shading settings that change what a screenshot shows
+SCREENSHOT_SHADING_PROPS = (
+    "type", "light", "color_type", "single_color", "studio_light", "use_scene_lights",
+    "use_scene_world", "show_xray", "show_shadows", "show_cavity", "show_backface_culling",
+)
+# Directions from the target to the camera of each render_views view
+RENDER_VIEW_DIRECTIONS = {
+    "front": (0.0, -1.0, 0.0),
+    "back": (0.0, 1.0, 0.0),
+    "right": (1.0, 0.0, 0.0),
+    "side": (1.0, 0.0, 0.0),
+    "left": (-1.0, 0.0, 0.0),
+    "top": (0.0, 0.0, 1.0),
+    "bottom": (0.0, 0.0, -1.0),
+    "iso": (1.0, -1.0, 1.0),
+}
+# Preview render profiles from cheapest to best. render_preview picks the best one
+# predicted to finish within the target latency. simplify_subdivision None leaves
+# Simplify off, texture_limit 0 leaves textures at full size.
+PREVIEW_PROFILES = [
+    {"resolution_percentage": 25, "samples": 4, "max_bounces": 2, "simplify_subdivision": 0, "texture_limit": 512},
+    {"resolution_percentage": 35, "samples": 8, "max_bounces": 2, "simplify_subdivision": 1, "texture_limit": 1024},
+    {"resolution_percentage": 50, "samples": 8, "max_bounces": 3, "simplify_subdivision": 1, "texture_limit": 1024},
+    {"resolution_percentage": 50, "samples": 16, "max_bounces": 4, "simplify_subdivision": 2, "texture_limit": 2048},
+    {"resolution_percentage": 75, "samples": 16, "max_bounces": 4, "simplify_subdivision": 2, "texture_limit": 2048},
+    {"resolution_percentage": 75, "samples": 32, "max_bounces": 6, "simplify_subdivision": 3, "texture_limit": 0},
+    {"resolution_percentage": 100, "samples": 32, "max_bounces": 8, "simplify_subdivision": None, "texture_limit": 0},
+    {"resolution_percentage": 100, "samples": 64, "max_bounces": 8, "simplify_subdivision": None, "texture_limit": 0},
+    {"resolution_percentage": 100, "samples": 128, "max_bounces": 12, "simplify_subdivision": None, "texture_limit": 0},
+]
+# Render times kept per scene and engine to calibrate the profile choice
+PREVIEW_CALIBRATION_SAMPLES = 8
+# Frames kept for diff_score comparisons
+SCREENSHOT_HISTORY = 32
+
+# Bumped on every depsgraph update and frame change, so screenshots can tell
+# whether the scene may look different since the last capture
+_scene_version = 0
+
+
+@bpy.app.handlers.persistent
+def _bump_scene_version(*args):
+    global _scene_version
+    _scene_version += 1
+
+
+# Modification time of the .blend file when it was last loaded or saved, so instances
+# can tell whether they have the same version of a file open
+_file_version = None
+
+
+@bpy.app.handlers.persistent
+def _record_file_version(*args):
+    global _file_version
+    _file_version = None
+    if bpy.data.filepath and os.path.exists(bpy.data.filepath):
+        _file_version = os.path.getmtime(bpy.data.filepath)
+
+
+def _image_signature(pixels, size=64):
+    """Small blurred luminance thumbnail of an (height, width, 3) uint8 array, for diffs"""
+    height, width = pixels.shape[:2]
+    scale = min(1.0, size / max(width, height))
+    small = _resize_pixels(pixels, max(1, int(width * scale)), max(1, int(height * scale)))
+    return (small.astype(np.float32) @ np.array([0.2126, 0.7152, 0.0722], dtype=np.float32)) / 255.0
+
+
+def _signature_diff(current, previous):
+    """(diff_score, changed_fraction) between two signatures, both 0 for identical images"""
+    if current.shape != previous.shape:
+        return 1.0, 1.0
+    delta = np.abs(current - previous)
+    return round(float(delta.mean()), 4), round(float((delta > 0.05).mean()), 4)
+
+
+class AssetLibrary:
+    """Local library of imported and generated assets saved as .blend files, with a JSON index"""
+
+    INDEX = "index.json"
+
+    def __init__(self, root):
+        self.root = root
+        self._index = None
+
+    @staticmethod
+    def key(source_id):
+        """File name stem for a source id; readable, but unique even after sanitizing"""
+        readable = "".join(c if c.isalnum() or c in "-_" else "_" for c in source_id)[:48]
+        return f"{readable}_{hashlib.sha1(source_id.encode('utf-8')).hexdigest()[:8]}"
+
+    def path(self, *parts):
+        file_path = os.path.join(self.root, *parts)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        return file_path
+
+    def entries(self):
+        """Index entries by source id, read from disk on first use"""
+        if self._index is None:
+            try:
+                with open(os.path.join(self.root, self.INDEX), "r", encoding="utf-8") as f:
+                    self._index = json.load(f).get("assets", {})
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def get(self, source_id):
+        """Return the entry of source_id if its .blend file still exists, else None"""
+        entry = self.entries().get(source_id)
+        if entry is None or not os.path.exists(os.path.join(self.root, entry["file"])):
+            return None
+        return entry
+
+    def find(self, source_id=None, name=None):
+        if source_id:
+            return self.get(source_id)
+        if name:
+            for entry_source_id, entry in self.entries().items():
+                if entry["name"].lower() == name.lower():
+                    return self.get(entry_source_id)
+        return None
+
+    def put(self, entry):
+        self.entries()[entry["source_id"]] = entry
+        self._write_index()
+
+    def _write_index(self):
+        index_path = self.path(self.INDEX)
+        partial_path = f"{index_path}.{threading.get_ident()}.part"
+        with open(partial_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "assets": self._index}, f, indent=1)
+        os.replace(partial_path, index_path)
+
+
+asset_library = AssetLibrary(
+    os.environ.get("BLENDERMCP_LIBRARY_DIR") or os.path.join(os.path.expanduser("~"), "blendermcp_library")
+)
+
+# Datablock codes in .blend files, by the bpy.data collection they end up in
+BLEND_ID_CODES = {
+    b"OB": "objects", b"ME": "meshes", b"MA": "materials", b"TE": "textures", b"IM": "images",
+    b"WO": "worlds", b"LA": "lights", b"CA": "cameras", b"GR": "collections", b"NT": "node_groups",
+    b"AC": "actions", b"SC": "scenes", b"CU": "curves", b"CV": "hair_curves", b"AR": "armatures",
+    b"LT": "lattices", b"MB": "metaballs", b"GD": "grease_pencils", b"GP": "grease_pencils_v3",
+    b"PT": "pointclouds", b"VO": "volumes", b"SO": "sounds", b"VF": "fonts", b"TX": "texts",
+    b"PA": "particles", b"LP": "lightprobes", b"SK": "speakers", b"MC": "movieclips", b"MS": "masks",
+    b"LS": "linestyles", b"PL": "palettes", b"CF": "cache_files", b"BR": "brushes",
+}
+
+# Object.type values, as in DNA_object_types.h
+BLEND_OBJECT_TYPES = {
+    0: "EMPTY", 1: "MESH", 2: "CURVE", 3: "SURFACE", 4: "FONT", 5: "META", 10: "LIGHT", 11: "CAMERA",
+    12: "SPEAKER", 13: "LIGHT_PROBE", 22: "LATTICE", 25: "ARMATURE", 26: "GPENCIL", 27: "CURVES",
+    28: "POINTCLOUD", 29: "VOLUME", 30: "GREASEPENCIL",
+}
+
+# How often search_blend_library refreshes the index of the configured folders, in seconds
+BLEND_INDEX_RESCAN_INTERVAL = 300
+
+
+class BlendUnsupported(Exception):
+    """The .blend file can't be read without Blender (unknown header or compression)"""
+
+
+def _open_blend_file(filepath):
+    """Open a .blend file for reading, decompressing gzip (before 3.0) or zstd (3.0+) files"""
+    f = open(filepath, "rb")
+    magic = f.read(4)
+    f.seek(0)
+    if magic == b"BLEN":
+        return f
+    if magic[:2] == b"\x1f\x8b":
+        import gzip
+        f.close()
+        return gzip.open(filepath, "rb")
+    if magic == b"\x28\xb5\x2f\xfd":
+        try:
+            import zstandard
+        except ImportError:
+            f.close()
+            raise BlendUnsupported("zstd compressed")
+        return zstandard.ZstdDecompressor().stream_reader(f, closefd=True)
+    f.close()
+    raise BlendUnsupported("not a .blend file")
+
+
+def _skip_bytes(f, count):
+    try:
+        f.seek(count, os.SEEK_CUR)
+    except (OSError, io.UnsupportedOperation):
+        while count > 0:
+            chunk = f.read(min(count, 1024 * 1024))
+            if not chunk:
+                break
+            count -= len(chunk)
+
+
+def _parse_sdna(data, endian, pointer_size):
+    """Return {struct name: {field name: (offset, type name)}} from the DNA1 block"""
+    def align(position):
+        return (position + 3) & ~3
+
+    position = 8  # "SDNA" "NAME"
+    (count,) = struct.unpack_from(endian + "i", data, position)
+    position += 4
+    names = []
+    for _ in range(count):
+        end = data.index(b"\0", position)
+        names.append(data[position:end].decode("utf-8", "replace"))
+        position = end + 1
+
+    position = align(position) + 4  # "TYPE"
+    (count,) = struct.unpack_from(endian + "i", data, position)
+    position += 4
+    types = []
+    for _ in range(count):
+        end = data.index(b"\0", position)
+        types.append(data[position:end].decode("utf-8", "replace"))
+        position = end + 1
+
+    position = align(position) + 4  # "TLEN"
+    lengths = struct.unpack_from(endian + f"{len(types)}h", data, position)
+    position = align(position + 2 * len(types)) + 4  # "STRC"
+    (count,) = struct.unpack_from(endian + "i", data, position)
+    position += 4
+
+    structs = {}
+    for _ in range(count):
+        struct_type, field_count = struct.unpack_from(endian + "hh", data, position)
+        position += 4
+        fields = {}
+        offset = 0
+        for _ in range(field_count):
+            field_type, field_name = struct.unpack_from(endian + "hh", data, position)
+            position += 4
+            name = names[field_name]
+            array_size = 1
+            for dimension in name.split("[")[1:]:
+                array_size *= int(dimension.rstrip("]"))
+            base_name = name.split("[")[0].lstrip("*").strip("()*")
+            size = pointer_size if name.startswith(("*", "(")) else lengths[field_type]
+            fields[base_name] = (offset, types[field_type])
+            offset += size * array_size
+        structs[types[struct_type]] = fields
+    return structs
+
+
+def _read_blend_datablocks(filepath):
+    """List the datablocks of a .blend file by reading its block headers, without Blender.
+
+    Returns {"datablocks": {collection: [names]}, "object_types": {name: type}}.
+    """
+    with _open_blend_file(filepath) as f:
+        header = f.read(12)
+        if len(header) < 12 or not header.startswith(b"BLENDER") or header[7:8] not in (b"_", b"-"):
+            raise BlendUnsupported("unknown .blend header")
+        pointer_size = 8 if header[7:8] == b"-" else 4
+        endian = "<" if header[8:9] == b"v" else ">"
+        bhead = struct.Struct(endian + "4si" + ("Q" if pointer_size == 8 else "I") + "ii")
+
+        # The SDNA that describes the ID layout is stored last, so keep the start of every ID block
+        id_blocks = []
+        sdna = None
+        while True:
+            raw = f.read(bhead.size)
+            if len(raw) < bhead.size:
+                break
+            code, length, _, _, _ = bhead.unpack(raw)
+            if code == b"ENDB":
+                break
+            if code == b"DNA1":
+                sdna = f.read(length)
+            elif code[2:] == b"\0\0" and code[:2] in BLEND_ID_CODES:
+                head = f.read(min(length, 1024))
+                id_blocks.append((code[:2], head))
+                _skip_bytes(f, length - len(head))
+            else:
+                _skip_bytes(f, length)
+
+    if sdna is None:
+        raise BlendUnsupported("no SDNA block")
+    structs = _parse_sdna(sdna, endian, pointer_size)
+    name_offset = structs["ID"]["name"][0]
+    type_offset = structs.get("Object", {}).get("type", (None,))[0]
+
+    datablocks = {}
+    object_types = {}
+    for code, head in id_blocks:
+        raw_name = head[name_offset:name_offset + 258].split(b"\0", 1)[0]
+        # The first two characters repeat the ID code
+        name = raw_name[2:].decode("utf-8", "replace")
+        collection = BLEND_ID_CODES[code]
+        datablocks.setdefault(collection, []).append(name)
+        if code == b"OB" and type_offset is not None and type_offset + 2 <= len(head):
+            (object_type,) = struct.unpack_from(endian + "h", head, type_offset)
+            object_types[name] = BLEND_OBJECT_TYPES.get(object_type, str(object_type))
+    return {"datablocks": datablocks, "object_types": object_types}
+
+
+# Run by a background Blender process for files the header reader can't handle
+BLEND_INDEX_SCRIPT = """
+import bpy, json, sys
+path = sys.argv[sys.argv.index("--") + 1]
+datablocks = {}
+with bpy.data.libraries.load(path) as (data_from, data_to):
+    for attr in dir(data_from):
+        names = getattr(data_from, attr)
+        if isinstance(names, list) and names:
+            datablocks[attr] = [str(name) for name in names]
+    data_to.objects = list(data_from.objects)
+object_types = {obj.name: obj.type for obj in data_to.objects if obj is not None}
+print("BLENDERMCP_INDEX" + json.dumps({"datablocks": datablocks, "object_types": object_types}))
+"""
+
+
+def _read_blend_datablocks_subprocess(filepath, blender_binary, timeout=120):
+    import subprocess
+    completed = subprocess.run(
+        [blender_binary, "-b", "--factory-startup", "--python-expr", BLEND_INDEX_SCRIPT, "--", filepath],
+        capture_output=True, text=True, timeout=timeout
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith("BLENDERMCP_INDEX"):
+            return json.loads(line[len("BLENDERMCP_INDEX"):])
+    raise RuntimeError(f"Blender could not read the file (exit code {completed.returncode})")
+
+
+class BlendIndex:
+    """Incremental on-disk index of the datablocks in folders of .blend files.
+
+    Scans run on a worker thread and only re-read files whose size or mtime changed.
+    """
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.lock = threading.Lock()
+        self._files = None
+        self._thread = None
+        self.status = {"running": False, "folders": [], "scanned": 0, "total": 0, "updated": 0,
+                       "errors": 0, "last_scan": None}
+
+    def files(self):
+        with self.lock:
+            if self._files is None:
+                try:
+                    with open(self.index_path, "r", encoding="utf-8") as f:
+                        self._files = json.load(f).get("files", {})
+                except (OSError, ValueError):
+                    self._files = {}
+            return dict(self._files)
+
+    def _save(self):
+        with self.lock:
+            snapshot = dict(self._files)
+        os.makedirs(os.path.dirname(self.index_path), exist_ok=True)
+        partial_path = f"{self.index_path}.{threading.get_ident()}.part"
+        with open(partial_path, "w", encoding="utf-8") as f:
+            json.dump({"version": 1, "files": snapshot}, f)
+        os.replace(partial_path, self.index_path)
+
+    def scan(self, folders, blender_binary):
+        """Start indexing folders on a worker thread, unless a scan is already running"""
+        if self._thread is not None and self._thread.is_alive():
+            return False
+        self.files()
+        self.status.update(running=True, folders=list(folders), scanned=0, total=0, updated=0, errors=0)
+        self._thread = threading.Thread(target=self._scan, args=(list(folders), blender_binary))
+        self._thread.daemon = True
+        self._thread.start()
+        return True
+
+    def _scan(self, folders, blender_binary):
+        try:
+            paths = []
+            for folder in folders:
+                for dirpath, _, filenames in os.walk(os.path.expanduser(folder)):
+                    paths.extend(os.path.join(dirpath, name) for name in filenames if name.lower().endswith(".blend"))
+            paths = [os.path.abspath(path) for path in paths]
+            self.status["total"] = len(paths)
+
+            current = set(paths)
+            with self.lock:
+                # Forget files that were deleted or are no longer in a configured folder
+                for path in [p for p in self._files if p not in current]:
+                    del self._files[path]
+                known = dict(self._files)
+
+            for path in paths:
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entry = known.get(path)
+                if entry and entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+                    self.status["scanned"] += 1
+                    continue
+
+                entry = {"mtime": stat.st_mtime, "size": stat.st_size}
+                try:
+                    try:
+                        entry.update(_read_blend_datablocks(path), method="header")
+                    except BlendUnsupported:
+                        entry.update(_read_blend_datablocks_subprocess(path, blender_binary), method="blender")
+                except Exception as e:
+                    entry.update(datablocks={}, object_types={}, error=str(e))
+                    self.status["errors"] += 1
+
+                with self.lock:
+                    self._files[path] = entry
+                self.status["scanned"] += 1
+                self.status["updated"] += 1
+                # Persist as we go, so an interrupted scan doesn't start over
+                if self.status["updated"] % 50 == 0:
+                    self._save()
+            self._save()
+        except Exception as e:
+            traceback.print_exc()
+            self.status["error"] = str(e)
+        finally:
+            self.status["running"] = False
+            self.status["last_scan"] = time.time()
+
+    def search(self, query="", datablock_type=None, object_type=None, limit=50):
+        """Datablocks whose name contains query, most recently modified files first"""
+        query = (query or "").lower()
+        matches = []
+        for path, entry in sorted(self.files().items(), key=lambda item: -item[1]["mtime"]):
+            for collection, names in entry.get("datablocks", {}).items():
+                if datablock_type and collection != datablock_type:
+                    continue
+                for name in names:
+                    if query and query not in name.lower() and query not in os.path.basename(path).lower():
+                        continue
+                    match_type = entry.get("object_types", {}).get(name) if collection == "objects" else None
+                    if object_type and match_type != object_type.upper():
+                        continue
+                    matches.append({"file": path, "datablock_type": collection, "name": name, "object_type": match_type})
+                    if len(matches) >= limit:
+                        return matches
+        return matches
+
+
+blend_index = BlendIndex(os.path.join(asset_library.root, "blend_index.json"))
+
+# Output folders of render jobs, one subfolder per job
+RENDER_OUTPUT_DIR = os.environ.get("BLENDERMCP_RENDER_DIR") or os.path.join(os.path.expanduser("~"), "blendermcp_renders")
+# Largest side of the per-frame previews written next to the outputs
+RENDER_PREVIEW_SIZE = 512
+
+# Runs inside `blender -b <snapshot>`; reports progress as BLENDERMCP_RENDER lines on stdout
+RENDER_JOB_SCRIPT = """
+import bpy, json, os, sys, time
+params = json.loads(sys.argv[sys.argv.index("--") + 1])
+scene = bpy.context.scene
+render = scene.render
+
+def report(**event):
+    print("BLENDERMCP_RENDER" + json.dumps(event), flush=True)
+
+if params.get("engine"):
+    render.engine = params["engine"]
+if params.get("camera"):
+    scene.camera = bpy.data.objects[params["camera"]]
+for attr in ("resolution_x", "resolution_y", "resolution_percentage"):
+    if params.get(attr):
+        setattr(render, attr, params[attr])
+if params.get("samples"):
+    if render.engine == "CYCLES":
+        scene.cycles.samples = params["samples"]
+    elif render.engine.startswith("BLENDER_EEVEE"):
+        scene.eevee.taa_render_samples = params["samples"]
+render.image_settings.file_format = "PNG"
+
+last_stats = [0.0]
+def on_stats(*args):
+    if time.time() - last_stats[0] > 1.0:
+        last_stats[0] = time.time()
+        report(event="stats", text=str(args[0]) if args else "")
+bpy.app.handlers.render_stats.append(on_stats)
+
+output_dir = params["output_dir"]
+for frame in range(params["frame_start"], params["frame_end"] + 1, params["frame_step"]):
+    scene.frame_set(frame)
+    output = os.path.join(output_dir, "frame_%04d.png" % frame)
+    render.filepath = output
+    report(event="frame_start", frame=frame)
+    started = time.time()
+    bpy.ops.render.render(write_still=True)
+    seconds = time.time() - started
+
+    preview = os.path.join(output_dir, "preview_%04d.png" % frame)
+    image = bpy.data.images.load(output)
+    width, height = image.size
+    scale = min(1.0, params["preview_size"] / max(width, height, 1))
+    if scale < 1.0:
+        image.scale(max(1, int(width * scale)), max(1, int(height * scale)))
+    image.filepath_raw = preview
+    image.file_format = "PNG"
+    image.save()
+    bpy.data.images.remove(image)
+    report(event="frame", frame=frame, seconds=round(seconds, 3), output=output, preview=preview)
+report(event="done")
+"""
+
+class MultipartFileStream:
+    """multipart/form-data body that reads its files while it is being sent.
+
+    Fields are (name, text) or (name, (filename, file path)). The total size is known
+    upfront, so requests sends it with a Content-Length rather than chunked.
+    """
+
+    def __init__(self, fields):
+        boundary = f"blendermcp-{os.urandom(12).hex()}"
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._parts = []
+        for name, value in fields:
+            if isinstance(value, tuple):
+                filename, file_path = value
+                content_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+                self._parts.append((
+                    f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                    f'Content-Type: {content_type}\r\n\r\n'
+                ).encode("utf-8"))
+                self._parts.append(file_path)
+                self._parts.append(b"\r\n")
+            else:
+                self._parts.append(
+                    f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n{value}\r\n'.encode("utf-8")
+                )
+        self._parts.append(f"--{boundary}--\r\n".encode("utf-8"))
+        self._length = sum(len(part) if isinstance(part, bytes) else os.path.getsize(part) for part in self._parts)
+        self._index = 0
+        self._current = None
+
+    def __len__(self):
+        return self._length
+
+    def read(self, size=-1):
+        chunks = []
+        remaining = size if size is not None and size >= 0 else None
+        while self._index < len(self._parts) and (remaining is None or remaining > 0):
+            if self._current is None:
+                part = self._parts[self._index]
+                self._current = io.BytesIO(part) if isinstance(part, bytes) else open(part, "rb")
+            chunk = self._current.read(-1 if remaining is None else remaining)
+            if not chunk:
+                self._current.close()
+                self._current = None
+                self._index += 1
+                continue
+            chunks.append(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(1024 * 1024)
+            if not chunk:
+                return
+            yield chunk
+
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+# Arrays smaller than this together go in the binary frame even if shared memory was asked for
+SHARED_MEMORY_MIN_BYTES = 256 * 1024
+# Offsets of arrays in a segment or binary frame are aligned to this
+ARRAY_ALIGNMENT = 64
+
+
+def _array_layout(arrays):
+    """Aligned offsets of arrays packed one after the other, and the total size"""
+    layout = {}
+    offset = 0
+    for key, array in arrays.items():
+        offset = -(-offset // ARRAY_ALIGNMENT) * ARRAY_ALIGNMENT
+        layout[key] = {"offset": offset, "dtype": array.dtype.str, "shape": list(array.shape)}
+        offset += array.nbytes
+    return layout, offset
+
+
+class SharedArrayStore:
+    """Shared memory segments holding the arrays of responses, for clients on the same machine.
+
+    Each response gets one segment, owned by the client that asked for it. Segments live until the
+    client releases them with release_shared_memory, or until it disconnects.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.segments = {}
+        self.clients = set()
+
+    def open_client(self, client_id):
+        with self.lock:
+            self.clients.add(client_id)
+
+    def store(self, client_id, arrays):
+        """Copy arrays into a new segment; returns the segment name and the layout of the arrays,
+        or None if the client is gone already"""
+        with self.lock:
+            if client_id not in self.clients:
+                return None
+        layout, size = _array_layout(arrays)
+        segment = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        try:
+            for key, array in arrays.items():
+                spec = layout[key]
+                target = np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf, offset=spec["offset"])
+                target[...] = array
+                del target
+        except Exception:
+            segment.close()
+            segment.unlink()
+            raise
+        with self.lock:
+            if client_id in self.clients:
+                self.segments[segment.name] = (client_id, segment)
+                return segment.name, layout
+        # Disconnected meanwhile
+        segment.close()
+        segment.unlink()
+        return None
+
+    def release(self, client_id, names):
+        """Free segments of a client; returns how many were freed"""
+        freed = 0
+        for name in names:
+            with self.lock:
+                owner, segment = self.segments.get(name, (None, None))
+                if segment is None or owner != client_id:
+                    continue
+                del self.segments[name]
+            segment.close()
+            with suppress(FileNotFoundError):
+                segment.unlink()
+            freed += 1
+        return freed
+
+    def release_client(self, client_id):
+        """Free every segment of a client that disconnected"""
+        with self.lock:
+            self.clients.discard(client_id)
+            names = [name for name, (owner, _) in self.segments.items() if owner == client_id]
+        return self.release(client_id, names)
+
+
+shared_arrays = SharedArrayStore()
+
+
+def _frame_response(response, shared_memory_client=None):
+    """
+    Serialize a response for the socket.
+
+    A result carrying raw bytes under "binary" is sent as the JSON header with
+    "binary_length" set, followed directly by the bytes, so images don't go
+    through base64 or a temporary file.
+
+    numpy arrays among the result's values are replaced by
+    {"__array__": {"offset", "dtype", "shape"}} descriptions. The data goes in the
+    binary frame, or into a shared memory segment named by "segment" when the
+    client asked for shared memory (shared_memory_client is its id) and the
+    arrays are large enough to be worth it.
+    """
+    result = response.get("result")
+    if isinstance(result, dict):
+        arrays = {key: value for key, value in result.items() if isinstance(value, np.ndarray)}
+        if arrays:
+            arrays = {key: np.ascontiguousarray(array) for key, array in arrays.items()}
+            layout, size = _array_layout(arrays)
+            result = dict(result)
+            stored = None
+            if shared_memory_client is not None and shared_memory is not None and size >= SHARED_MEMORY_MIN_BYTES:
+                stored = shared_arrays.store(shared_memory_client, arrays)
+            if stored is not None:
+                segment, layout = stored
+                for key, spec in layout.items():
+                    result[key] = {"__array__": dict(spec, segment=segment)}
+            else:
+                binary = bytearray(size)
+                for key, array in arrays.items():
+                    spec = layout[key]
+                    binary[spec["offset"]:spec["offset"] + array.nbytes] = array.tobytes()
+                    result[key] = {"__array__": spec}
+                result["binary"] = bytes(binary)
+            response = dict(response, result=result)
+
+    binary = result.get("binary") if isinstance(result, dict) else None
+    if not isinstance(binary, (bytes, bytearray)):
+        return json.dumps(response).encode('utf-8')
+    result = {k: v for k, v in result.items() if k != "binary"}
+    header = dict(response, result=result, binary_length=len(binary))
+    return json.dumps(header).encode('utf-8') + bytes(binary)
+
+
+class DeferredResult:
+    """Handler result computed on a worker thread and finished in Blender's main thread.
+
+    work() runs on the worker thread and must not touch bpy. finish(value) runs from a
+    timer on the main thread and returns the command result, or another DeferredResult.
+    """
+
+    def __init__(self, work, finish=None, poll_interval=0.05):
+        self.finish = finish or (lambda value: value)
+        self.poll_interval = poll_interval
+        self._done = threading.Event()
+        self._value = None
+        self._error = None
+
+        worker = threading.Thread(target=self._run, args=(work,))
+        worker.daemon = True
+        worker.start()
+
+    def _run(self, work):
+        try:
+            self._value = work()
+        except Exception as e:
+            traceback.print_exc()
+            self._error = e
+        finally:
+            self._done.set()
+
+    def resolve(self, on_response):
+        """Wait for the worker without blocking Blender, then pass the response to on_response"""
+        def poll():
+            if not self._done.is_set():
+                return self.poll_interval
+            try:
+                if self._error is not None:
+                    raise self._error
+                result = self.finish(self._value)
+                if isinstance(result, DeferredResult):
+                    result.resolve(on_response)
+                    return None
+                response = {"status": "success", "result": result}
+            except Exception as e:
+                traceback.print_exc()
+                response = {"status": "error", "message": str(e)}
+            on_response(response)
+            return None
+
+        bpy.app.timers.register(poll, first_interval=0.0)
+
+
+# Extensions that only add material detail, so the threaded glTF import can safely ignore them
+GLTF_IGNORED_EXTENSIONS = {"KHR_materials_emissive_strength"}
+
+GLTF_COMPONENT_TYPES = {
+    5120: np.int8,
+    5121: np.uint8,
+    5122: np.int16,
+    5123: np.uint16,
+    5125: np.uint32,
+    5126: np.float32,
+}
+GLTF_TYPE_SIZES = {"SCALAR": 1, "VEC2": 2, "VEC3": 3, "VEC4": 4, "MAT2": 4, "MAT3": 9, "MAT4": 16}
+
+# glTF is Y up, Blender is Z up: (x, y, z) -> (x, -z, y)
+GLTF_AXIS_CONVERSION = np.array([
+    [1.0, 0.0, 0.0, 0.0],
+    [0.0, 0.0, -1.0, 0.0],
+    [0.0, 1.0, 0.0, 0.0],
+    [0.0, 0.0, 0.0, 1.0],
+])
+
+
+class GltfUnsupported(Exception):
+    """The file uses a glTF feature the threaded importer doesn't handle"""
+
+
+def _read_gltf_container(filepath):
+    """Return the JSON document and the binary chunk (or None) of a .gltf or .glb file"""
+    with open(filepath, "rb") as f:
+        data = f.read()
+
+    if data[:4] != b"glTF":
+        return json.loads(data.decode("utf-8")), None
+
+    _, version, length = struct.unpack_from("<4sII", data, 0)
+    if version != 2:
+        raise GltfUnsupported(f"GLB version {version}")
+
+    document, binary = None, None
+    offset = 12
+    while offset + 8 <= min(length, len(data)):
+        chunk_length, chunk_type = struct.unpack_from("<II", data, offset)
+        chunk = data[offset + 8:offset + 8 + chunk_length]
+        if chunk_type == 0x4E4F534A:  # JSON
+            document = json.loads(chunk.decode("utf-8"))
+        elif chunk_type == 0x004E4942 and binary is None:  # BIN
+            binary = chunk
+        offset += 8 + chunk_length
+
+    if document is None:
+        raise ValueError("GLB file has no JSON chunk")
+    return document, binary
+
+
+def _read_gltf_uri(uri, base_dir):
+    if uri.startswith("data:"):
+        header, _, payload = uri.partition(",")
+        if header.endswith(";base64"):
+            return base64.b64decode(payload)
+        return unquote(payload).encode("utf-8")
+    with open(os.path.join(base_dir, unquote(uri)), "rb") as f:
+        return f.read()
+
+
+def _check_gltf_supported(document):
+    extensions = set(document.get("extensionsUsed", [])) | set(document.get("extensionsRequired", []))
+    unsupported = extensions - GLTF_IGNORED_EXTENSIONS
+    if unsupported:
+        raise GltfUnsupported(f"extensions {sorted(unsupported)}")
+    for feature in ("skins", "animations", "cameras"):
+        if document.get(feature):
+            raise GltfUnsupported(feature)
+    for mesh in document.get("meshes", []):
+        for primitive in mesh.get("primitives", []):
+            if primitive.get("mode", 4) != 4:
+                raise GltfUnsupported("non-triangle primitives")
+            if primitive.get("targets"):
+                raise GltfUnsupported("morph targets")
+    for accessor in document.get("accessors", []):
+        if "sparse" in accessor:
+            raise GltfUnsupported("sparse accessors")
+
+
+def _read_gltf_accessor(document, buffers, index):
+    """Read an accessor into a (count, components) float32 or integer array"""
+    accessor = document["accessors"][index]
+    dtype = np.dtype(GLTF_COMPONENT_TYPES[accessor["componentType"]]).newbyteorder("<")
+    components = GLTF_TYPE_SIZES[accessor["type"]]
+    count = accessor["count"]
+
+    if "bufferView" not in accessor:
+        values = np.zeros((count, components), dtype=dtype)
+    else:
+        view = document["bufferViews"][accessor["bufferView"]]
+        buffer = buffers[view["buffer"]]
+        offset = view.get("byteOffset", 0) + accessor.get("byteOffset", 0)
+        item_size = dtype.itemsize * components
+        stride = view.get("byteStride") or item_size
+        if stride == item_size:
+            values = np.frombuffer(buffer, dtype=dtype, count=count * components, offset=offset)
+            values = values.reshape(count, components)
+        else:
+            # Interleaved vertex data
+            rows = np.frombuffer(buffer, dtype=np.uint8, count=stride * (count - 1) + item_size, offset=offset)
+            values = np.lib.stride_tricks.as_strided(
+                rows, shape=(count, item_size), strides=(stride, 1)
+            ).copy().view(dtype).reshape(count, components)
+
+    if accessor.get("normalized") and dtype.kind in "iu":
+        limit = float(np.iinfo(dtype).max)
+        return np.maximum(values.astype(np.float32) / limit, -1.0)
+    if dtype.kind == "f":
+        return values.astype(np.float32)
+    return values
+
+
+def _gltf_node_matrix(node):
+    if "matrix" in node:
+        matrix = np.array(node["matrix"], dtype=np.float64).reshape(4, 4).T
+    else:
+        x, y, z, w = node.get("rotation", [0.0, 0.0, 0.0, 1.0])
+        rotation = np.array([
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ])
+        matrix = np.identity(4)
+        matrix[:3, :3] = rotation * np.array(node.get("scale", [1.0, 1.0, 1.0]))
+        matrix[:3, 3] = node.get("translation", [0.0, 0.0, 0.0])
+    return GLTF_AXIS_CONVERSION @ matrix @ GLTF_AXIS_CONVERSION.T
+
+
+def _read_gltf_mesh(document, buffers, mesh):
+    """Merge the primitives of a glTF mesh into flat arrays ready for foreach_set"""
+    positions, normals, uvs, indices, material_indices = [], [], [], [], []
+    materials = []
+    vertex_offset = 0
+
+    for primitive in mesh.get("primitives", []):
+        attributes = primitive["attributes"]
+        if "POSITION" not in attributes:
+            continue
+        position = _read_gltf_accessor(document, buffers, attributes["POSITION"])
+        count = len(position)
+        positions.append(position)
+        normals.append(
+            _read_gltf_accessor(document, buffers, attributes["NORMAL"]) if "NORMAL" in attributes else None
+        )
+        uvs.append(
+            _read_gltf_accessor(document, buffers, attributes["TEXCOORD_0"]) if "TEXCOORD_0" in attributes else None
+        )
+
+        if "indices" in primitive:
+            index = _read_gltf_accessor(document, buffers, primitive["indices"]).ravel().astype(np.int32)
+        else:
+            index = np.arange(count, dtype=np.int32)
+        indices.append(index + vertex_offset)
+        vertex_offset += count
+
+        material = primitive.get("material")
+        if material not in materials:
+            materials.append(material)
+        material_indices.append(np.full(len(index) // 3, materials.index(material), dtype=np.int32))
+
+    if not positions:
+        return None
+
+    vertices = np.concatenate(positions)
+    result = {
+        "name": mesh.get("name", "Mesh"),
+        "vertices": vertices[:, [0, 2, 1]] * np.array([1.0, -1.0, 1.0], dtype=np.float32),
+        "indices": np.concatenate(indices),
+        "material_indices": np.concatenate(material_indices),
+        "materials": materials,
+        "normals": None,
+        "uvs": None,
+    }
+    if all(n is not None for n in normals):
+        n = np.concatenate(normals)
+        result["normals"] = n[:, [0, 2, 1]] * np.array([1.0, -1.0, 1.0], dtype=np.float32)
+    if any(uv is not None for uv in uvs):
+        uv = np.concatenate([
+            uv if uv is not None else np.zeros((len(p), 2), dtype=np.float32)
+            for uv, p in zip(uvs, positions)
+        ])
+        # glTF UVs start at the top left, Blender's at the bottom left
+        result["uvs"] = np.column_stack([uv[:, 0], 1.0 - uv[:, 1]]).astype(np.float32)
+    return result
+
+
+def _parse_gltf(filepath):
+    """Parse a .gltf or .glb file into NumPy arrays. Runs on a worker thread, so never touches bpy."""
+    document, binary = _read_gltf_container(filepath)
+    _check_gltf_supported(document)
+    base_dir = os.path.dirname(filepath)
+
+    buffers = []
+    for buffer in document.get("buffers", []):
+        if "uri" in buffer:
+            buffers.append(_read_gltf_uri(buffer["uri"], base_dir))
+        elif binary is not None:
+            buffers.append(binary)
+        else:
+            raise ValueError("glTF buffer has no data")
+
+    images = []
+    for i, image in enumerate(document.get("images", [])):
+        if "bufferView" in image:
+            view = document["bufferViews"][image["bufferView"]]
+            start = view.get("byteOffset", 0)
+            data = bytes(buffers[view["buffer"]][start:start + view["byteLength"]])
+        else:
+            data = _read_gltf_uri(image["uri"], base_dir)
+        images.append({"name": image.get("name") or f"Image_{i}", "data": data})
+
+    if document.get("scenes"):
+        roots = document["scenes"][document.get("scene", 0)].get("nodes", [])
+    else:
+        children = {child for node in document.get("nodes", []) for child in node.get("children", [])}
+        roots = [i for i in range(len(document.get("nodes", []))) if i not in children]
+    nodes = [
+        {
+            "name": node.get("name") or f"Node_{i}",
+            "mesh": node.get("mesh"),
+            "matrix": _gltf_node_matrix(node),
+            "children": node.get("children", []),
+        }
+        for i, node in enumerate(document.get("nodes", []))
+    ]
+
+    return {
+        "meshes": [_read_gltf_mesh(document, buffers, mesh) for mesh in document.get("meshes", [])],
+        "materials": document.get("materials", []),
+        "textures": document.get("textures", []),
+        "images": images,
+        "nodes": nodes,
+        "roots": roots,
+    }
+
+
 class BlenderMCPServer:
-    def __init__(self, host='localhost', port=9876):
+    def __init__(self, host='localhost', port=9876, socket_path=None):
         self.host = host
         self.port = port
+        # Unix domain socket served next to TCP, for clients on the same host
+        self.socket_path = socket_path
         self.running = False
         self.socket = None
+        self.unix_socket = None
         self.server_thread = None
-    
+        self.unix_server_thread = None
+
+        # Progressive texture loading: jobs by asset id, plus finished downloads
+        # handed from the worker threads to the main thread
+        self.texture_upgrades = {}
+        self._texture_upgrade_queue = queue.Queue()
+        self._texture_upgrade_timer_running = False
+
+        # Packed AO/roughness/metallic images by texture set digest
+        self._packed_channel_cache = {}
+
+        # Objects created by the first import of each asset, by source id
+        self.imported_assets = {}
+
+        # Rodin jobs by job id, polled by one worker thread each; auto-imports are
+        # handed to the main thread through the queue
+        self.rodin_jobs = {}
+        self._rodin_job_events = {}
+        self._rodin_import_queue = queue.Queue()
+        self._rodin_import_timer_running = False
+        # Batches of Rodin jobs by batch id
+        self.rodin_batches = {}
+        self._rodin_batch_events = {}
+
+        # Observed (work, seconds) of preview renders by (scene name, engine)
+        self._preview_calibration = {}
+
+        # Render jobs by job id, run one at a time by a worker thread in background
+        # Blender processes
+        self.render_jobs = {}
+        self._render_queue = queue.Queue()
+        self._render_processes = {}
+        self._render_lock = threading.Lock()
+        self._render_worker = None
+
+        # Last viewport capture: its state key, frame id, pixels and encodings by
+        # (max_size, format, quality), plus signatures of recent frames for diffs
+        self._screenshot_key = None
+        self._screenshot_frame_id = 0
+        self._screenshot_pixels = None
+        self._screenshot_encoded = {}
+        self._screenshot_signatures = {}
+
+        # Sketchfab search responses by normalized query, shared with prefetch threads
+        self._sketchfab_search_cache = {}
+        self._sketchfab_search_lock = threading.Lock()
+        self._sketchfab_prefetching = set()
+
     def start(self):
         if self.running:
             print("Server is already running")
@@ -59,6 +1332,45 @@ class BlenderMCPServer:
         except Exception as e:
             print(f"Failed to start server: {str(e)}")
             self.stop()
+            return
+
+        if self.socket_path:
+            self._start_unix_socket()
+
+    def _start_unix_socket(self):
+        """Also listen on the Unix domain socket; TCP keeps working if that isn't possible"""
+        if not hasattr(socket, "AF_UNIX"):
+            print("Unix domain sockets are not supported here, using TCP only")
+            return
+        try:
+            # Remove a socket file left behind by a Blender that didn't shut down cleanly,
+            # but never take the socket away from another Blender that is still listening on it
+            with suppress(FileNotFoundError):
+                if stat.S_ISSOCK(os.stat(self.socket_path).st_mode):
+                    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    try:
+                        probe.connect(self.socket_path)
+                    except ConnectionRefusedError:
+                        os.remove(self.socket_path)
+                    else:
+                        raise OSError(errno.EADDRINUSE, "Another server is listening on this socket")
+                    finally:
+                        probe.close()
+            self.unix_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.unix_socket.bind(self.socket_path)
+            # Only the current user may send commands
+            os.chmod(self.socket_path, 0o600)
+            self.unix_socket.listen(1)
+
+            self.unix_server_thread = threading.Thread(target=self._server_loop, args=(self.unix_socket,))
+            self.unix_server_thread.daemon = True
+            self.unix_server_thread.start()
+            print(f"BlenderMCP server also listening on {self.socket_path}")
+        except Exception as e:
+            print(f"Failed to listen on {self.socket_path}, using TCP only: {str(e)}")
+            if self.unix_socket:
+                self.unix_socket.close()
+                self.unix_socket = None
             
     def stop(self):
         self.running = False
@@ -70,28 +1382,42 @@ class BlenderMCPServer:
             except:
                 pass
             self.socket = None
-        
-        # Wait for thread to finish
-        if self.server_thread:
+        if self.unix_socket:
             try:
-                if self.server_thread.is_alive():
-                    self.server_thread.join(timeout=1.0)
+                self.unix_socket.close()
+                os.remove(self.socket_path)
             except:
                 pass
-            self.server_thread = None
+            self.unix_socket = None
         
-        print("BlenderMCP server stopped")
-    
-    def _server_loop(self):
-        """Main server loop in a separate thread"""
-        print("Server thread started")
-        self.socket.settimeout(1.0)  # Timeout to allow for stopping
+        # Wait for threads to finish
+        for thread in (self.server_thread, self.unix_server_thread):
+            try:
+                if thread and thread.is_alive():
+                    thread.join(timeout=1.0)
+            except:
+                pass
+        self.server_thread = None
+        self.unix_server_thread = None
+
+        # Don't leave background renders running
+        for job_id, job in list(self.render_jobs.items()):
+            if job["status"] in ("queued", "running"):
+                self.cancel_render(job_id)
+        
+        print("BlenderMCP server stopped")
+    
+    def _server_loop(self, listener=None):
+        """Main server loop in a separate thread, for the TCP socket or the given listening socket"""
+        print("Server thread started")
+        listener = listener or self.socket
+        listener.settimeout(1.0)  # Timeout to allow for stopping
         
         while self.running:
             try:
                 # Accept new connection
                 try:
-                    client, address = self.socket.accept()
+                    client, address = listener.accept()
                     print(f"Connected to client: {address}")
                     
                     # Handle client in a separate thread
@@ -120,6 +1446,9 @@ class BlenderMCPServer:
         print("Client handler started")
         client.settimeout(None)  # No timeout
         buffer = b''
+        # Owner of the shared memory segments sent to this client
+        client_id = object()
+        shared_arrays.open_client(client_id)
         
         try:
             while self.running:
@@ -135,16 +1464,30 @@ class BlenderMCPServer:
                         # Try to parse command
                         command = json.loads(buffer.decode('utf-8'))
                         buffer = b''
-                        
+
+                        if command.get("type") == "release_shared_memory":
+                            # Doesn't touch bpy, so no need to wait for the main thread
+                            freed = shared_arrays.release(client_id, command.get("params", {}).get("names", []))
+                            client.sendall(json.dumps({"status": "success", "result": {"released": freed}}).encode('utf-8'))
+                            continue
+
+                        shared_memory_client = client_id if command.get("shared_memory") else None
+
+                        def send_response(response, shared_memory_client=shared_memory_client):
+                            try:
+                                client.sendall(_frame_response(response, shared_memory_client))
+                            except:
+                                print("Failed to send response - client disconnected")
+
                         # Execute command in Blender's main thread
                         def execute_wrapper():
                             try:
                                 response = self.execute_command(command)
-                                response_json = json.dumps(response)
-                                try:
-                                    client.sendall(response_json.encode('utf-8'))
-                                except:
-                                    print("Failed to send response - client disconnected")
+                                if isinstance(response, DeferredResult):
+                                    # Finished later by a timer, once the worker thread is done
+                                    response.resolve(send_response)
+                                else:
+                                    send_response(response)
                             except Exception as e:
                                 print(f"Error executing command: {str(e)}")
                                 traceback.print_exc()
@@ -169,6 +1512,8 @@ class BlenderMCPServer:
         except Exception as e:
             print(f"Error in client handler: {str(e)}")
         finally:
+            # Segments nobody will release anymore
+            shared_arrays.release_client(client_id)
             try:
                 client.close()
             except:
@@ -198,11 +1543,29 @@ class BlenderMCPServer:
         handlers = {
             "get_scene_info": self.get_scene_info,
             "get_object_info": self.get_object_info,
+            "get_instance_info": self.get_instance_info,
+            "get_mesh_data": self.get_mesh_data,
+            "get_object_transforms": self.get_object_transforms,
             "get_viewport_screenshot": self.get_viewport_screenshot,
             "execute_code": self.execute_code,
             "get_polyhaven_status": self.get_polyhaven_status,
             "get_hyper3d_status": self.get_hyper3d_status,
             "get_sketchfab_status": self.get_sketchfab_status,
+            "get_texture_memory_report": self.get_texture_memory_report,
+            "set_texture_budget": self.set_texture_budget,
+            "pack_material_channels": self.pack_material_channels,
+            "set_polygon_budget": self.set_polygon_budget,
+            "save_to_library": self.save_to_library,
+            "load_from_library": self.load_from_library,
+            "list_library_assets": self.list_library_assets,
+            "index_blend_library": self.index_blend_library,
+            "search_blend_library": self.search_blend_library,
+            "render_views": self.render_views,
+            "render_preview": self.render_preview,
+            "render_scene": self.render_scene,
+            "get_render_status": self.get_render_status,
+            "get_render_result": self.get_render_result,
+            "cancel_render": self.cancel_render,
         }
         
         # Add Polyhaven handlers only if enabled
@@ -212,6 +1575,7 @@ class BlenderMCPServer:
                 "search_polyhaven_assets": self.search_polyhaven_assets,
                 "download_polyhaven_asset": self.download_polyhaven_asset,
                 "set_texture": self.set_texture,
+                "get_texture_upgrade_status": self.get_texture_upgrade_status,
             }
             handlers.update(polyhaven_handlers)
         
@@ -221,6 +1585,9 @@ class BlenderMCPServer:
                 "create_rodin_job": self.create_rodin_job,
                 "poll_rodin_job_status": self.poll_rodin_job_status,
                 "import_generated_asset": self.import_generated_asset,
+                "wait_for_generation": self.wait_for_generation,
+                "create_rodin_batch": self.create_rodin_batch,
+                "wait_for_rodin_batch": self.wait_for_rodin_batch,
             }
             handlers.update(polyhaven_handlers)
             
@@ -237,6 +1604,9 @@ class BlenderMCPServer:
             try:
                 print(f"Executing handler for {cmd_type}")
                 result = handler(**params)
+                if isinstance(result, DeferredResult):
+                    print(f"Handler for {cmd_type} continues on a worker thread")
+                    return result
                 print(f"Handler execution complete")
                 return {"status": "success", "result": result}
             except Exception as e:
@@ -341,62 +1711,277 @@ class BlenderMCPServer:
         
         return obj_info
     
-    def get_viewport_screenshot(self, max_size=800, filepath=None, format="png"):
+    def get_instance_info(self):
+        """The open .blend file and whether it has unsaved changes, to tell instances and replicas apart"""
+        if _file_version is None:
+            # The file was opened before the addon was enabled
+            _record_file_version()
+        return {
+            "filepath": bpy.data.filepath,
+            "is_dirty": bpy.data.is_dirty,
+            "file_version": _file_version,
+            "scene": bpy.context.scene.name,
+            "port": bpy.context.scene.blendermcp_port,
+            "blender_version": bpy.app.version_string,
+        }
+
+    def get_mesh_data(self, object_name, world_space=True, attributes=None):
         """
-        Capture a screenshot of the current 3D viewport and save it to the specified path.
-        
+        Mesh buffers of an object with its modifiers applied, as arrays.
+
+        Parameters:
+        - object_name: Mesh, curve or other object that evaluates to a mesh
+        - world_space: Transform positions and normals by the object's world matrix
+        - attributes: Any of "positions" (float32, V x 3), "triangles" (int32 vertex
+          indices, T x 3), "normals" (float32 vertex normals, V x 3) and "uvs"
+          (float32 UVs of the active layer per triangle corner, T x 3 x 2); all by default
+
+        The arrays travel in the binary frame, or in shared memory when the client asks for it.
+        """
+        attributes = set(attributes or ("positions", "triangles", "normals", "uvs"))
+        obj = bpy.data.objects.get(object_name)
+        if obj is None:
+            return {"error": f"Object not found: {object_name}"}
+        evaluated = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
+        try:
+            mesh = evaluated.to_mesh()
+        except RuntimeError:
+            mesh = None
+        if mesh is None:
+            return {"error": f"{object_name} has no mesh data"}
+
+        try:
+            mesh.calc_loop_triangles()
+            vertex_count, triangle_count = len(mesh.vertices), len(mesh.loop_triangles)
+            matrix = np.array(obj.matrix_world, dtype=np.float32)
+            result = {"name": obj.name, "vertex_count": vertex_count, "triangle_count": triangle_count,
+                      "world_space": bool(world_space)}
+
+            positions = np.empty(vertex_count * 3, dtype=np.float32)
+            mesh.vertices.foreach_get("co", positions)
+            positions = positions.reshape(-1, 3)
+            if world_space:
+                positions = positions @ matrix[:3, :3].T + matrix[:3, 3]
+            if vertex_count:
+                result["bounds"] = [positions.min(axis=0).tolist(), positions.max(axis=0).tolist()]
+            if "positions" in attributes:
+                result["positions"] = positions
+
+            if "triangles" in attributes:
+                triangles = np.empty(triangle_count * 3, dtype=np.int32)
+                mesh.loop_triangles.foreach_get("vertices", triangles)
+                result["triangles"] = triangles.reshape(-1, 3)
+
+            if "normals" in attributes:
+                normals = np.empty(vertex_count * 3, dtype=np.float32)
+                mesh.vertices.foreach_get("normal", normals)
+                normals = normals.reshape(-1, 3)
+                if world_space:
+                    # Normals transform by the inverse transpose; as row vectors that is n @ M^-1
+                    normals = normals @ np.linalg.inv(matrix[:3, :3])
+                    lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+                    normals /= np.where(lengths > 0, lengths, 1)
+                result["normals"] = normals.astype(np.float32)
+
+            if "uvs" in attributes and mesh.uv_layers.active is not None:
+                loop_uvs = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+                mesh.uv_layers.active.data.foreach_get("uv", loop_uvs)
+                loops = np.empty(triangle_count * 3, dtype=np.int32)
+                mesh.loop_triangles.foreach_get("loops", loops)
+                result["uvs"] = loop_uvs.reshape(-1, 2)[loops].reshape(-1, 3, 2)
+                result["uv_layer"] = mesh.uv_layers.active.name
+        finally:
+            evaluated.to_mesh_clear()
+        return result
+
+    def get_object_transforms(self, object_names=None):
+        """
+        World transforms of many objects at once, as columns: names and types as lists,
+        "matrices" (float32, N x 4 x 4), "locations" and "dimensions" (float32, N x 3).
+        All objects of the scene by default.
+        """
+        if object_names:
+            objects = [bpy.data.objects.get(name) for name in object_names]
+            missing = [name for name, obj in zip(object_names, objects) if obj is None]
+            if missing:
+                return {"error": f"Objects not found: {', '.join(missing)}"}
+        else:
+            objects = list(bpy.context.scene.objects)
+
+        count = len(objects)
+        matrices = np.empty(count * 16, dtype=np.float32)
+        dimensions = np.empty(count * 3, dtype=np.float32)
+        for index, obj in enumerate(objects):
+            matrices[index * 16:(index + 1) * 16] = np.array(obj.matrix_world, dtype=np.float32).ravel()
+            dimensions[index * 3:(index + 1) * 3] = obj.dimensions
+        matrices = matrices.reshape(-1, 4, 4)
+        return {
+            "count": count,
+            "names": [obj.name for obj in objects],
+            "types": [obj.type for obj in objects],
+            "matrices": matrices,
+            "locations": np.ascontiguousarray(matrices[:, :3, 3]),
+            "dimensions": dimensions.reshape(-1, 3),
+        }
+
+    @staticmethod
+    def _find_view3d():
+        """Return (window, region, space) of the first 3D viewport, or None"""
+        windows = [bpy.context.window] if bpy.context.window else []
+        windows += [w for w in bpy.context.window_manager.windows if w not in windows]
+        for window in windows:
+            for area in window.screen.areas:
+                if area.type != 'VIEW_3D':
+                    continue
+                for region in area.regions:
+                    if region.type == 'WINDOW':
+                        return window, region, area.spaces.active
+        return None
+
+    @staticmethod
+    def _capture_view3d(window, region, space):
+        """Draw a viewport into an offscreen buffer; returns a (height, width, 4) uint8 array, top row first"""
+        import gpu
+
+        width, height = region.width, region.height
+        region_3d = space.region_3d
+        offscreen = gpu.types.GPUOffScreen(width, height)
+        try:
+            offscreen.draw_view3d(
+                window.scene, window.view_layer, space, region,
+                region_3d.view_matrix, region_3d.window_matrix,
+                do_color_management=True,
+            )
+            with offscreen.bind():
+                framebuffer = gpu.state.active_framebuffer_get()
+                buffer = framebuffer.read_color(0, 0, width, height, 4, 0, 'UBYTE')
+        finally:
+            offscreen.free()
+        try:
+            pixels = np.frombuffer(buffer, dtype=np.uint8)
+        except TypeError:
+            # Older gpu.types.Buffer without the buffer protocol
+            pixels = np.array(buffer.to_list(), dtype=np.uint8)
+        # OpenGL rows start at the bottom
+        return pixels.reshape(height, width, 4)[::-1]
+
+    @staticmethod
+    def _viewport_state_key(window, region, space):
+        """
+        Everything a viewport capture depends on, or None if the viewport may still
+        change on its own (rendered shading refining, shaders compiling).
+        """
+        shading = space.shading
+        if shading.type == 'RENDERED':
+            return None
+        with suppress(AttributeError, TypeError):
+            if bpy.app.is_job_running('SHADER_COMPILATION'):
+                return None
+        region_3d = space.region_3d
+        return (
+            _scene_version,
+            window.scene.name,
+            window.view_layer.name,
+            window.scene.frame_current,
+            tuple(round(v, 6) for row in region_3d.view_matrix for v in row),
+            tuple(round(v, 6) for row in region_3d.window_matrix for v in row),
+            region.width,
+            region.height,
+            tuple(
+                tuple(value) if hasattr(value, "__len__") and not isinstance(value, str) else value
+                for value in (getattr(shading, prop, None) for prop in SCREENSHOT_SHADING_PROPS)
+            ),
+        )
+
+    def _screenshot_diff(self, frame_id, since_frame):
+        """diff_score and changed_fraction of a frame against an earlier one, if it is still known"""
+        current = self._screenshot_signatures.get(frame_id)
+        previous = self._screenshot_signatures.get(since_frame)
+        if since_frame is None or current is None or previous is None:
+            return {}
+        diff_score, changed_fraction = _signature_diff(current, previous)
+        return {"since_frame": since_frame, "diff_score": diff_score, "changed_fraction": changed_fraction}
+
+    def get_viewport_screenshot(self, max_size=800, filepath=None, format="png", quality=85,
+                                since_frame=None, use_cache=True):
+        """
+        Capture the current 3D viewport in memory.
+
         Parameters:
         - max_size: Maximum size in pixels for the largest dimension of the image
-        - filepath: Path where to save the screenshot file
-        - format: Image format (png, jpg, etc.)
-        
-        Returns success/error status
+        - filepath: Optional path to also write the encoded image to; without it the
+          bytes are returned in the response's binary frame
+        - format: png, jpeg or webp (jpeg and webp need Pillow, otherwise png is used)
+        - quality: Compression quality for jpeg and webp, 1-100
+        - since_frame: frame_id of an earlier screenshot. If the viewport hasn't changed
+          since, only {"unchanged": True} is returned; otherwise the result includes
+          diff_score (mean luminance change, 0-1) and changed_fraction against it
+        - use_cache: Reuse the last capture while the scene, view, viewport size and
+          shading are unchanged
+
+        The viewport is drawn into an offscreen buffer on the main thread; resizing
+        and encoding run on a worker thread.
         """
         try:
-            if not filepath:
-                return {"error": "No filepath provided"}
-            
-            # Find the active 3D viewport
-            area = None
-            for a in bpy.context.screen.areas:
-                if a.type == 'VIEW_3D':
-                    area = a
-                    break
-            
-            if not area:
+            view = self._find_view3d()
+            if not view:
                 return {"error": "No 3D viewport found"}
-            
-            # Take screenshot with proper context override
-            with bpy.context.temp_override(area=area):
-                bpy.ops.screen.screenshot_area(filepath=filepath)
-            
-            # Load and resize if needed
-            img = bpy.data.images.load(filepath)
-            width, height = img.size
-            
-            if max(width, height) > max_size:
-                scale = max_size / max(width, height)
-                new_width = int(width * scale)
-                new_height = int(height * scale)
-                img.scale(new_width, new_height)
-                
-                # Set format and save
-                img.file_format = format.upper()
-                img.save()
-                width, height = new_width, new_height
-            
-            # Cleanup Blender image data
-            bpy.data.images.remove(img)
-            
-            return {
+            key = self._viewport_state_key(*view)
+            if use_cache and key is not None and key == self._screenshot_key:
+                frame_id = self._screenshot_frame_id
+                if since_frame == frame_id:
+                    return {"success": True, "unchanged": True, "frame_id": frame_id}
+                cached = self._screenshot_encoded.get((max_size, format, quality))
+                if cached and not filepath:
+                    return dict(cached, cached=True, **self._screenshot_diff(frame_id, since_frame))
+                pixels = self._screenshot_pixels
+                new_frame = False
+            else:
+                pixels = self._capture_view3d(*view)
+                new_frame = True
+        except Exception as e:
+            return {"error": str(e)}
+
+        def encode():
+            height, width = pixels.shape[:2]
+            scale = min(1.0, max_size / max(width, height))
+            width, height = max(1, int(width * scale)), max(1, int(height * scale))
+            # Drop alpha, the viewport is opaque
+            rgb = np.ascontiguousarray(pixels[..., :3])
+            data, used_format = _encode_image(_resize_pixels(rgb, width, height), format, quality)
+            signature = _image_signature(rgb) if new_frame else None
+            return data, used_format, width, height, signature
+
+        def finish(encoded):
+            data, used_format, width, height, signature = encoded
+            if new_frame:
+                self._screenshot_frame_id += 1
+                self._screenshot_key = key
+                self._screenshot_pixels = pixels
+                self._screenshot_encoded = {}
+                self._screenshot_signatures[self._screenshot_frame_id] = signature
+                for old_frame in sorted(self._screenshot_signatures)[:-SCREENSHOT_HISTORY]:
+                    del self._screenshot_signatures[old_frame]
+            frame_id = self._screenshot_frame_id
+            result = {
                 "success": True,
                 "width": width,
                 "height": height,
-                "filepath": filepath
+                "format": used_format,
+                "size_bytes": len(data),
+                "frame_id": frame_id,
+                "binary": data,
             }
-            
-        except Exception as e:
-            return {"error": str(e)}
+            self._screenshot_encoded[(max_size, format, quality)] = result
+            result = dict(result, **self._screenshot_diff(frame_id, since_frame))
+            if filepath:
+                with open(filepath, "wb") as f:
+                    f.write(data)
+                del result["binary"]
+                result["filepath"] = filepath
+            return result
+
+        return DeferredResult(encode, finish)
     
     def execute_code(self, code):
         """Execute arbitrary Blender Python code"""
@@ -462,8 +2047,29 @@ class BlenderMCPServer:
         except Exception as e:
             return {"error": str(e)}
     
-    def download_polyhaven_asset(self, asset_id, asset_type, resolution="1k", file_format=None):
+    def download_polyhaven_asset(self, asset_id, asset_type, resolution="1k", file_format=None, progressive=False,
+                                 pack_channels=False, max_faces=None, generate_lods=False, reuse=True,
+                                 save_to_library=False):
         try:
+            # A model that was imported before is duplicated instead of downloaded again
+            if asset_type == "models" and reuse:
+                source_id = f"polyhaven:{asset_id}:{resolution}:{file_format or 'gltf'}"
+                duplicate = self._duplicate_imported_asset(source_id, max_faces)
+                if duplicate:
+                    return {
+                        "success": True,
+                        "message": f"Model {asset_id} added as a linked duplicate of the earlier import",
+                        **duplicate
+                    }
+                # Saved in an earlier session: appending from the library skips download and import
+                from_library = self._reuse_library_asset(source_id, max_faces, generate_lods)
+                if from_library:
+                    return {
+                        "success": True,
+                        "message": f"Model {asset_id} loaded from the asset library",
+                        **from_library
+                    }
+
             # First get the files information
             files_response = requests.get(f"https://api.polyhaven.com/files/{asset_id}")
             if files_response.status_code != 200:
@@ -481,87 +2087,21 @@ class BlenderMCPServer:
                     file_info = files_data["hdri"][resolution][file_format]
                     file_url = file_info["url"]
                     
-                    # For HDRIs, we need to save to a temporary file first
-                    # since Blender can't properly load HDR data directly from memory
-                    with tempfile.NamedTemporaryFile(suffix=f".{file_format}", delete=False) as tmp_file:
-                        # Download the file
-                        response = requests.get(file_url)
-                        if response.status_code != 200:
-                            return {"error": f"Failed to download HDRI: {response.status_code}"}
-                        
-                        tmp_file.write(response.content)
-                        tmp_path = tmp_file.name
+                    # Blender can't load HDR data from memory, so HDRIs live in the asset cache.
+                    # Applying the same HDRI again then needs no download at all.
+                    try:
+                        hdri_path = asset_cache.fetch(
+                            file_url, "polyhaven", "hdris", asset_id, resolution, f"{asset_id}.{file_format}"
+                        )
+                    except Exception as e:
+                        return {"error": f"Failed to download HDRI: {str(e)}"}
                     
                     try:
-                        # Create a new world if none exists
-                        if not bpy.data.worlds:
-                            bpy.data.worlds.new("World")
-                        
-                        world = bpy.data.worlds[0]
-                        world.use_nodes = True
-                        node_tree = world.node_tree
-                        
-                        # Clear existing nodes
-                        for node in node_tree.nodes:
-                            node_tree.nodes.remove(node)
-                        
-                        # Create nodes
-                        tex_coord = node_tree.nodes.new(type='ShaderNodeTexCoord')
-                        tex_coord.location = (-800, 0)
-                        
-                        mapping = node_tree.nodes.new(type='ShaderNodeMapping')
-                        mapping.location = (-600, 0)
-                        
-                        # Load the image from the temporary file
-                        env_tex = node_tree.nodes.new(type='ShaderNodeTexEnvironment')
-                        env_tex.location = (-400, 0)
-                        env_tex.image = bpy.data.images.load(tmp_path)
-                        
-                        # Use a color space that exists in all Blender versions
-                        if file_format.lower() == 'exr':
-                            # Try to use Linear color space for EXR files
-                            try:
-                                env_tex.image.colorspace_settings.name = 'Linear'
-                            except:
-                                # Fallback to Non-Color if Linear isn't available
-                                env_tex.image.colorspace_settings.name = 'Non-Color'
-                        else:  # hdr
-                            # For HDR files, try these options in order
-                            for color_space in ['Linear', 'Linear Rec.709', 'Non-Color']:
-                                try:
-                                    env_tex.image.colorspace_settings.name = color_space
-                                    break  # Stop if we successfully set a color space
-                                except:
-                                    continue
-                        
-                        background = node_tree.nodes.new(type='ShaderNodeBackground')
-                        background.location = (-200, 0)
-                        
-                        output = node_tree.nodes.new(type='ShaderNodeOutputWorld')
-                        output.location = (0, 0)
-                        
-                        # Connect nodes
-                        node_tree.links.new(tex_coord.outputs['Generated'], mapping.inputs['Vector'])
-                        node_tree.links.new(mapping.outputs['Vector'], env_tex.inputs['Vector'])
-                        node_tree.links.new(env_tex.outputs['Color'], background.inputs['Color'])
-                        node_tree.links.new(background.outputs['Background'], output.inputs['Surface'])
-                        
-                        # Set as active world
-                        bpy.context.scene.world = world
-                        
-                        # Clean up temporary file
-                        try:
-                            tempfile._cleanup()  # This will clean up all temporary files
-                        except:
-                            pass
-                        
-                        return {
-                            "success": True, 
-                            "message": f"HDRI {asset_id} imported successfully",
-                            "image_name": env_tex.image.name
-                        }
+                        result = self._apply_hdri(asset_id, hdri_path, file_format)
                     except Exception as e:
                         return {"error": f"Failed to set up HDRI in Blender: {str(e)}"}
+                    self._trim_asset_cache()
+                    return result
                 else:
                     return {"error": f"Requested resolution or format not available for this HDRI"}
                     
@@ -569,49 +2109,16 @@ class BlenderMCPServer:
                 if not file_format:
                     file_format = "jpg"  # Default format for textures
                 
-                downloaded_maps = {}
+                # In progressive mode the material is built from low resolution maps right
+                # away, and the requested resolution is swapped in once it has downloaded
+                load_resolution = resolution
+                if progressive and _resolution_value(resolution) > _resolution_value(PROGRESSIVE_PREVIEW_RESOLUTION):
+                    load_resolution = PROGRESSIVE_PREVIEW_RESOLUTION
+                else:
+                    progressive = False
                 
                 try:
-                    for map_type in files_data:
-                        if map_type not in ["blend", "gltf"]:  # Skip non-texture files
-                            if resolution in files_data[map_type] and file_format in files_data[map_type][resolution]:
-                                file_info = files_data[map_type][resolution][file_format]
-                                file_url = file_info["url"]
-                                
-                                # Use NamedTemporaryFile like we do for HDRIs
-                                with tempfile.NamedTemporaryFile(suffix=f".{file_format}", delete=False) as tmp_file:
-                                    # Download the file
-                                    response = requests.get(file_url)
-                                    if response.status_code == 200:
-                                        tmp_file.write(response.content)
-                                        tmp_path = tmp_file.name
-                                        
-                                        # Load image from temporary file
-                                        image = bpy.data.images.load(tmp_path)
-                                        image.name = f"{asset_id}_{map_type}.{file_format}"
-                                        
-                                        # Pack the image into .blend file
-                                        image.pack()
-                                        
-                                        # Set color space based on map type
-                                        if map_type in ['color', 'diffuse', 'albedo']:
-                                            try:
-                                                image.colorspace_settings.name = 'sRGB'
-                                            except:
-                                                pass
-                                        else:
-                                            try:
-                                                image.colorspace_settings.name = 'Non-Color'
-                                            except:
-                                                pass
-                                        
-                                        downloaded_maps[map_type] = image
-                                        
-                                        # Clean up temporary file
-                                        try:
-                                            os.unlink(tmp_path)
-                                        except:
-                                            pass
+                    downloaded_maps = self._load_polyhaven_texture_maps(asset_id, files_data, load_resolution, file_format)
                 
                     if not downloaded_maps:
                         return {"error": f"No texture maps found for the requested resolution and format"}
@@ -690,12 +2197,21 @@ class BlenderMCPServer:
                         
                         y_pos -= 250
                     
-                    return {
+                    result = {
                         "success": True, 
                         "message": f"Texture {asset_id} imported as material",
                         "material": mat.name,
                         "maps": list(downloaded_maps.keys())
                     }
+                    if progressive:
+                        result["progressive"] = self._start_texture_upgrade(asset_id, files_data, resolution, file_format)
+                    if pack_channels:
+                        result["channel_packing"] = self._pack_or_defer(asset_id, mat)
+                    self._trim_asset_cache()
+                    budget_mb = bpy.context.scene.blendermcp_texture_budget_mb
+                    if budget_mb:
+                        result["texture_budget"] = self._enforce_texture_budget(budget_mb * 1024 * 1024)
+                    return result
                 
                 except Exception as e:
                     return {"error": f"Failed to process textures: {str(e)}"}
@@ -743,33 +2259,44 @@ class BlenderMCPServer:
                                 else:
                                     print(f"Failed to download included file: {include_path}")
                         
-                        # Import the model into Blender
-                        if file_format == "gltf" or file_format == "glb":
-                            bpy.ops.import_scene.gltf(filepath=main_file_path)
-                        elif file_format == "fbx":
-                            bpy.ops.import_scene.fbx(filepath=main_file_path)
-                        elif file_format == "obj":
-                            bpy.ops.import_scene.obj(filepath=main_file_path)
-                        elif file_format == "blend":
-                            # For blend files, we need to append or link
-                            with bpy.data.libraries.load(main_file_path, link=False) as (data_from, data_to):
-                                data_to.objects = data_from.objects
-                            
-                            # Link the objects to the scene
-                            for obj in data_to.objects:
-                                if obj is not None:
-                                    bpy.context.collection.objects.link(obj)
-                        else:
+                        if file_format not in ("gltf", "glb", "fbx", "obj", "blend"):
                             return {"error": f"Unsupported model format: {file_format}"}
+
+                        # Import the model into Blender
+                        with self._import_staging() as staging:
+                            if file_format == "gltf" or file_format == "glb":
+                                bpy.ops.import_scene.gltf(filepath=main_file_path)
+                            elif file_format == "fbx":
+                                bpy.ops.import_scene.fbx(filepath=main_file_path)
+                            elif file_format == "obj":
+                                bpy.ops.import_scene.obj(filepath=main_file_path)
+                            elif file_format == "blend":
+                                # For blend files, we need to append or link
+                                with bpy.data.libraries.load(main_file_path, link=False) as (data_from, data_to):
+                                    data_to.objects = data_from.objects
+                                
+                                # Link the objects to the staging collection
+                                for obj in data_to.objects:
+                                    if obj is not None:
+                                        staging.objects.link(obj)
+                        objects = self._unstage_import(staging)
                         
                         # Get the names of imported objects
-                        imported_objects = [obj.name for obj in bpy.context.selected_objects]
+                        imported_objects = [obj.name for obj in objects]
+                        source_id = f"polyhaven:{asset_id}:{resolution}:{file_format}"
+                        # The library keeps the full detail model; the budget only applies to this scene
+                        library = self._save_import_to_library({}, source_id, objects) if save_to_library else {}
+                        polygons = self._apply_polygon_budget(objects, max_faces, generate_lods)
+                        self._register_imported_asset(source_id, objects)
                         
-                        return {
+                        result = {
                             "success": True, 
                             "message": f"Model {asset_id} imported successfully",
-                            "imported_objects": imported_objects
+                            "imported_objects": imported_objects,
+                            "polygons": polygons,
+                            **library
                         }
+                        return result
                     except Exception as e:
                         return {"error": f"Failed to import model: {str(e)}"}
                     finally:
@@ -785,7 +2312,327 @@ class BlenderMCPServer:
         except Exception as e:
             return {"error": f"Failed to download asset: {str(e)}"}
 
-    def set_texture(self, object_name, texture_id):
+    @staticmethod
+    def _find_hdri_nodes(node_tree):
+        """Return the environment texture node set up by _apply_hdri, if it is still wired up"""
+        env_tex = node_tree.nodes.get("BlenderMCP Environment")
+        if env_tex is None or env_tex.type != 'TEX_ENVIRONMENT':
+            return None
+        for link in env_tex.outputs['Color'].links:
+            background = link.to_node
+            if background.type == 'BACKGROUND' and background.outputs['Background'].is_linked:
+                return env_tex
+        return None
+
+    def _apply_hdri(self, asset_id, hdri_path, file_format):
+        """Use an HDRI as the world environment, reusing the loaded image and existing nodes"""
+        scene = bpy.context.scene
+        world = scene.world
+        if world is None:
+            # Create a new world if none exists
+            world = bpy.data.worlds[0] if bpy.data.worlds else bpy.data.worlds.new("World")
+        world.use_nodes = True
+        node_tree = world.node_tree
+
+        # Reuse the image if this HDRI was loaded before
+        image = bpy.data.images.load(hdri_path, check_existing=True)
+
+        env_tex = self._find_hdri_nodes(node_tree)
+        if env_tex is not None and env_tex.image == image and scene.world == world:
+            return {
+                "success": True,
+                "message": f"HDRI {asset_id} is already the world environment",
+                "image_name": image.name,
+                "reused": True
+            }
+
+        if env_tex is None:
+            # Clear existing nodes
+            for node in node_tree.nodes:
+                node_tree.nodes.remove(node)
+
+            # Create nodes
+            tex_coord = node_tree.nodes.new(type='ShaderNodeTexCoord')
+            tex_coord.location = (-800, 0)
+
+            mapping = node_tree.nodes.new(type='ShaderNodeMapping')
+            mapping.location = (-600, 0)
+
+            env_tex = node_tree.nodes.new(type='ShaderNodeTexEnvironment')
+            env_tex.name = "BlenderMCP Environment"
+            env_tex.location = (-400, 0)
+
+            background = node_tree.nodes.new(type='ShaderNodeBackground')
+            background.location = (-200, 0)
+
+            output = node_tree.nodes.new(type='ShaderNodeOutputWorld')
+            output.location = (0, 0)
+
+            # Connect nodes
+            node_tree.links.new(tex_coord.outputs['Generated'], mapping.inputs['Vector'])
+            node_tree.links.new(mapping.outputs['Vector'], env_tex.inputs['Vector'])
+            node_tree.links.new(env_tex.outputs['Color'], background.inputs['Color'])
+            node_tree.links.new(background.outputs['Background'], output.inputs['Surface'])
+
+        # Swap the image, and free the previous HDRI if nothing else uses it
+        previous_image = env_tex.image
+        env_tex.image = image
+        if previous_image is not None and previous_image != image and previous_image.users == 0:
+            bpy.data.images.remove(previous_image)
+
+        # Use a color space that exists in all Blender versions
+        if file_format.lower() == 'exr':
+            # Try to use Linear color space for EXR files
+            try:
+                image.colorspace_settings.name = 'Linear'
+            except:
+                # Fallback to Non-Color if Linear isn't available
+                image.colorspace_settings.name = 'Non-Color'
+        else:  # hdr
+            # For HDR files, try these options in order
+            for color_space in ['Linear', 'Linear Rec.709', 'Non-Color']:
+                try:
+                    image.colorspace_settings.name = color_space
+                    break  # Stop if we successfully set a color space
+                except:
+                    continue
+
+        # Set as active world
+        scene.world = world
+
+        return {
+            "success": True,
+            "message": f"HDRI {asset_id} imported successfully",
+            "image_name": image.name,
+            "reused": False
+        }
+
+    @staticmethod
+    def _trim_asset_cache():
+        """Keep the Poly Haven download cache under its size limit, sparing files still in use"""
+        in_use = {
+            os.path.abspath(bpy.path.abspath(img.filepath))
+            for img in bpy.data.images
+            if img.filepath and not img.packed_file
+        }
+        with suppress(Exception):
+            asset_cache.trim("polyhaven", max_bytes=ASSET_CACHE_MAX_BYTES, keep=in_use)
+
+    def _load_polyhaven_texture_maps(self, asset_id, files_data, resolution, file_format):
+        """Download (or reuse from the cache) every map of a texture set and load it into Blender"""
+        downloaded_maps = {}
+        for map_type in files_data:
+            if map_type in ["blend", "gltf"]:  # Skip non-texture files
+                continue
+            if resolution in files_data[map_type] and file_format in files_data[map_type][resolution]:
+                file_url = files_data[map_type][resolution][file_format]["url"]
+                try:
+                    file_path = asset_cache.fetch(
+                        file_url, "polyhaven", "textures", asset_id, resolution, f"{map_type}.{file_format}"
+                    )
+                except Exception as e:
+                    print(f"Failed to download {map_type} map for {asset_id}: {str(e)}")
+                    continue
+                downloaded_maps[map_type] = self._load_texture_image(asset_id, map_type, file_format, resolution, file_path)
+        return downloaded_maps
+
+    @staticmethod
+    def _load_texture_image(asset_id, map_type, file_format, resolution, file_path):
+        """Load a texture map from disk, named and tagged so it can be found again later"""
+        image = bpy.data.images.load(file_path)
+        image.name = f"{asset_id}_{map_type}.{file_format}"
+
+        # Pack the image into .blend file, unless it should keep referencing the cache
+        if bpy.context.scene.blendermcp_pack_textures:
+            image.pack()
+
+        # Set color space based on map type
+        if map_type.lower() in ['color', 'diffuse', 'albedo']:
+            try:
+                image.colorspace_settings.name = 'sRGB'
+            except:
+                pass
+        else:
+            try:
+                image.colorspace_settings.name = 'Non-Color'
+            except:
+                pass
+
+        # Remember where the image came from, used by progressive loading
+        image["blendermcp_asset_id"] = asset_id
+        image["blendermcp_map_type"] = map_type
+        image["blendermcp_resolution"] = resolution
+        return image
+
+    def _start_texture_upgrade(self, asset_id, files_data, resolution, file_format):
+        """Download the target resolution maps in the background and swap them in when ready"""
+        map_urls = {}
+        for map_type in files_data:
+            if map_type in ["blend", "gltf"]:
+                continue
+            if resolution in files_data[map_type] and file_format in files_data[map_type][resolution]:
+                map_urls[map_type] = files_data[map_type][resolution][file_format]["url"]
+
+        if not map_urls:
+            return {"status": "unavailable", "target_resolution": resolution}
+
+        self.texture_upgrades[asset_id] = {
+            "asset_id": asset_id,
+            "target_resolution": resolution,
+            "file_format": file_format,
+            "status": "downloading",
+            "pending_maps": sorted(map_urls),
+            "upgraded_maps": [],
+            "errors": {},
+            "started": time.time(),
+        }
+
+        worker = threading.Thread(
+            target=self._download_texture_upgrade,
+            args=(asset_id, map_urls, resolution, file_format),
+        )
+        worker.daemon = True
+        worker.start()
+
+        # Swapping images has to happen in Blender's main thread
+        if not self._texture_upgrade_timer_running:
+            self._texture_upgrade_timer_running = True
+            bpy.app.timers.register(self._process_texture_upgrades, first_interval=0.5)
+
+        return {
+            "status": "downloading",
+            "preview_resolution": PROGRESSIVE_PREVIEW_RESOLUTION,
+            "target_resolution": resolution,
+            "pending_maps": sorted(map_urls),
+        }
+
+    def _download_texture_upgrade(self, asset_id, map_urls, resolution, file_format):
+        """Worker thread: fetch the high resolution maps, without touching bpy"""
+        for map_type, file_url in map_urls.items():
+            try:
+                file_path = asset_cache.fetch(
+                    file_url, "polyhaven", "textures", asset_id, resolution, f"{map_type}.{file_format}"
+                )
+                self._texture_upgrade_queue.put((asset_id, map_type, file_path, None))
+            except Exception as e:
+                self._texture_upgrade_queue.put((asset_id, map_type, None, str(e)))
+
+    def _process_texture_upgrades(self):
+        """Timer callback that swaps finished downloads into the existing image texture nodes"""
+        upgraded = False
+        while True:
+            try:
+                asset_id, map_type, file_path, error = self._texture_upgrade_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            job = self.texture_upgrades.get(asset_id)
+            if job is None:
+                continue
+
+            if error is None:
+                try:
+                    self._swap_texture_image(asset_id, map_type, job["file_format"], job["target_resolution"], file_path)
+                    job["upgraded_maps"].append(map_type)
+                    upgraded = True
+                    print(f"Upgraded {asset_id} {map_type} map to {job['target_resolution']}")
+                except Exception as e:
+                    error = str(e)
+            if error is not None:
+                print(f"Failed to upgrade {asset_id} {map_type} map: {error}")
+                job["errors"][map_type] = error
+
+            if map_type in job["pending_maps"]:
+                job["pending_maps"].remove(map_type)
+            if not job["pending_maps"]:
+                job["status"] = "failed" if job["errors"] and not job["upgraded_maps"] else "complete"
+                job["finished"] = time.time()
+                # Channel packing waits for the final maps, so it packs the target resolution
+                for material_name in job.get("pack_materials", []):
+                    mat = bpy.data.materials.get(material_name)
+                    if mat:
+                        self._pack_material_channels(mat)
+
+        # Higher resolution maps may have pushed the scene over its texture budget
+        if upgraded and bpy.context.scene.blendermcp_texture_budget_mb:
+            self._enforce_texture_budget(bpy.context.scene.blendermcp_texture_budget_mb * 1024 * 1024)
+
+        if any(job["status"] == "downloading" for job in self.texture_upgrades.values()):
+            return 0.5
+        self._texture_upgrade_timer_running = False
+        return None
+
+    def _swap_texture_image(self, asset_id, map_type, file_format, resolution, file_path):
+        """Replace a loaded texture map with a new resolution, keeping every node that uses it"""
+        image_name = f"{asset_id}_{map_type}.{file_format}"
+        old_image = bpy.data.images.get(image_name)
+        new_image = self._load_texture_image(asset_id, map_type, file_format, resolution, file_path)
+        if old_image is not None and old_image != new_image:
+            # Point every ShaderNodeTexImage (and any other user) at the new image
+            old_image.user_remap(new_image)
+            bpy.data.images.remove(old_image)
+            new_image.name = image_name
+        return new_image
+
+    def get_texture_upgrade_status(self, asset_id=None):
+        """Report progressive texture loading jobs and the materials still waiting for an upgrade"""
+        jobs = []
+        for job_asset_id, job in self.texture_upgrades.items():
+            if asset_id and job_asset_id != asset_id:
+                continue
+
+            # Materials that still sample an image below the target resolution
+            upgrading_materials = set()
+            for mat in bpy.data.materials:
+                if not mat.use_nodes or not mat.node_tree:
+                    continue
+                for node in mat.node_tree.nodes:
+                    if node.type != 'TEX_IMAGE' or not node.image:
+                        continue
+                    if node.image.get("blendermcp_asset_id") != job_asset_id:
+                        continue
+                    if node.image.get("blendermcp_resolution") != job["target_resolution"]:
+                        upgrading_materials.add(mat.name)
+
+            jobs.append({
+                "asset_id": job_asset_id,
+                "status": job["status"],
+                "target_resolution": job["target_resolution"],
+                "pending_maps": list(job["pending_maps"]),
+                "upgraded_maps": list(job["upgraded_maps"]),
+                "errors": dict(job["errors"]),
+                "upgrading_materials": sorted(upgrading_materials),
+                "elapsed": round(job.get("finished", time.time()) - job["started"], 2),
+            })
+
+        if asset_id and not jobs:
+            return {"error": f"No progressive texture loading job found for: {asset_id}"}
+        return {"jobs": jobs}
+
+    def _prepare_progressive_texture(self, texture_id, resolution):
+        """Make sure a texture set is loaded and, if it is below resolution, being upgraded"""
+        loaded_images = [img for img in bpy.data.images if img.name.startswith(texture_id + "_")]
+        if not loaded_images:
+            result = self.download_polyhaven_asset(texture_id, "textures", resolution=resolution, progressive=True)
+            if "error" in result:
+                return result
+            return result.get("progressive", {"status": "complete", "target_resolution": resolution})
+
+        job = self.texture_upgrades.get(texture_id)
+        if job and job["status"] == "downloading" and job["target_resolution"] == resolution:
+            return {"status": "downloading", "target_resolution": resolution, "pending_maps": list(job["pending_maps"])}
+
+        loaded_resolutions = [img.get("blendermcp_resolution") for img in loaded_images]
+        if all(_resolution_value(res) >= _resolution_value(resolution) for res in loaded_resolutions if res):
+            return {"status": "complete", "target_resolution": resolution}
+
+        files_response = requests.get(f"https://api.polyhaven.com/files/{texture_id}")
+        if files_response.status_code != 200:
+            return {"error": f"Failed to get asset files: {files_response.status_code}"}
+        file_format = loaded_images[0].name.rsplit(".", 1)[-1]
+        return self._start_texture_upgrade(texture_id, files_response.json(), resolution, file_format)
+
+    def set_texture(self, object_name, texture_id, resolution=None, progressive=False, pack_channels=False):
         """Apply a previously downloaded Polyhaven texture to an object by creating a new material"""
         try:
             # Get the object
@@ -796,7 +2643,14 @@ class BlenderMCPServer:
             # Make sure object can accept materials
             if not hasattr(obj, 'data') or not hasattr(obj.data, 'materials'):
                 return {"error": f"Object {object_name} cannot accept materials"}
-            
+
+            # Progressive mode: download the texture set if needed, then upgrade it in the background
+            upgrade_info = None
+            if progressive:
+                upgrade_info = self._prepare_progressive_texture(texture_id, resolution or "1k")
+                if "error" in upgrade_info:
+                    return upgrade_info
+
             # Find all images related to this texture and ensure they're properly loaded
             texture_images = {}
             for img in bpy.data.images:
@@ -820,7 +2674,7 @@ class BlenderMCPServer:
                             pass
                     
                     # Ensure the image is packed
-                    if not img.packed_file:
+                    if not img.packed_file and bpy.context.scene.blendermcp_pack_textures:
                         img.pack()
                     
                     texture_images[map_type] = img
@@ -1037,6 +2891,9 @@ class BlenderMCPServer:
                     links.new(mix_node.outputs['Color'], principled.inputs['Base Color'])
                     print("Connected AO to mix with Base Color")
             
+            # Optionally merge the grayscale AO/roughness/metallic maps into one image
+            channel_packing = self._pack_or_defer(texture_id, new_mat) if pack_channels else None
+            
             # CRITICAL: Make sure to clear all existing materials from the object
             while len(obj.data.materials) > 0:
                 obj.data.materials.pop(index=0)
@@ -1075,33 +2932,1712 @@ class BlenderMCPServer:
                         "colorspace": node.image.colorspace_settings.name,
                         "connections": connections
                     })
-            
+            
+            result = {
+                "success": True,
+                "message": f"Created new material and applied texture {texture_id} to {object_name}",
+                "material": new_mat.name,
+                "maps": texture_maps,
+                "material_info": material_info
+            }
+            if upgrade_info:
+                result["progressive"] = upgrade_info
+            if channel_packing:
+                result["channel_packing"] = channel_packing
+            return result
+
+        except Exception as e:
+            print(f"Error in set_texture: {str(e)}")
+            traceback.print_exc()
+            return {"error": f"Failed to apply texture: {str(e)}"}
+
+    def get_polyhaven_status(self):
+        """Get the current status of PolyHaven integration"""
+        enabled = bpy.context.scene.blendermcp_use_polyhaven
+        if enabled:
+            return {"enabled": True, "message": "PolyHaven integration is enabled and ready to use."}
+        else:
+            return {
+                "enabled": False, 
+                "message": """PolyHaven integration is currently disabled. To enable it:
+                            1. In the 3D Viewport, find the BlenderMCP panel in the sidebar (press N if hidden)
+                            2. Check the 'Use assets from Poly Haven' checkbox
+                            3. Restart the connection to Claude"""
+        }
+
+    #region Texture budget
+    @staticmethod
+    def _image_memory(img):
+        """Decoded size in bytes of an image (byte images are stored as RGBA, float ones per channel)"""
+        width, height = img.size
+        if img.is_float:
+            return width * height * max(img.channels, 1) * 4
+        return width * height * 4
+
+    @staticmethod
+    def _get_view_projection():
+        """Return the view-projection matrix of the scene camera, or of the 3D viewport"""
+        scene = bpy.context.scene
+        if scene.camera:
+            render = scene.render
+            projection = scene.camera.calc_matrix_camera(
+                bpy.context.evaluated_depsgraph_get(),
+                x=render.resolution_x,
+                y=render.resolution_y,
+                scale_x=render.pixel_aspect_x,
+                scale_y=render.pixel_aspect_y,
+            )
+            return projection @ scene.camera.matrix_world.inverted()
+
+        for area in bpy.context.screen.areas if bpy.context.screen else []:
+            if area.type == 'VIEW_3D':
+                return area.spaces.active.region_3d.perspective_matrix.copy()
+        return None
+
+    @staticmethod
+    def _estimate_screen_coverage(obj, view_projection):
+        """Fraction of the frame covered by the object's projected bounding box"""
+        min_x = min_y = 1.0
+        max_x = max_y = -1.0
+        behind = 0
+        for corner in obj.bound_box:
+            clip = view_projection @ (obj.matrix_world @ mathutils.Vector((*corner, 1.0)))
+            if clip.w <= 0.0:
+                behind += 1
+                continue
+            x, y = clip.x / clip.w, clip.y / clip.w
+            min_x, max_x = min(min_x, x), max(max_x, x)
+            min_y, max_y = min(min_y, y), max(max_y, y)
+
+        if behind == 8:
+            return 0.0
+        if behind:
+            # The box crosses the camera plane, so it is (partly) right in front of the view
+            return 1.0
+
+        width = max(0.0, min(max_x, 1.0) - max(min_x, -1.0))
+        height = max(0.0, min(max_y, 1.0) - max(min_y, -1.0))
+        return (width * height) / 4.0
+
+    def _get_image_coverage(self):
+        """Map image name to the largest screen coverage of any object that uses it"""
+        view_projection = self._get_view_projection()
+
+        # Images used by each material's node tree
+        material_images = {}
+        for mat in bpy.data.materials:
+            if mat.use_nodes and mat.node_tree:
+                material_images[mat.name] = {
+                    node.image.name for node in mat.node_tree.nodes
+                    if node.type == 'TEX_IMAGE' and node.image
+                }
+
+        coverage = {}
+        for obj in bpy.context.scene.objects:
+            if not obj.material_slots or not obj.visible_get():
+                continue
+            obj_coverage = self._estimate_screen_coverage(obj, view_projection) if view_projection else 0.0
+            for slot in obj.material_slots:
+                if slot.material:
+                    for image_name in material_images.get(slot.material.name, ()):
+                        coverage[image_name] = max(coverage.get(image_name, 0.0), obj_coverage)
+
+        # The world environment is visible in every direction
+        world = bpy.context.scene.world
+        if world and world.use_nodes and world.node_tree:
+            for node in world.node_tree.nodes:
+                if node.type in ('TEX_ENVIRONMENT', 'TEX_IMAGE') and node.image:
+                    coverage[node.image.name] = 1.0
+
+        return coverage
+
+    def get_texture_memory_report(self):
+        """Report the decoded memory of every image, with the screen coverage used to prioritize it"""
+        coverage = self._get_image_coverage()
+        images = []
+        total = 0
+        for img in bpy.data.images:
+            if img.type != 'IMAGE':
+                continue  # Skip Render Result and Viewer Node
+            memory = self._image_memory(img)
+            total += memory
+            images.append({
+                "name": img.name,
+                "size": [img.size[0], img.size[1]],
+                "channels": img.channels,
+                "is_float": img.is_float,
+                "memory_mb": round(memory / (1024 * 1024), 2),
+                "packed": bool(img.packed_file),
+                "resolution": img.get("blendermcp_resolution"),
+                "screen_coverage": round(coverage.get(img.name, 0.0), 4),
+                "users": img.users,
+            })
+        images.sort(key=lambda item: item["memory_mb"], reverse=True)
+
+        budget_mb = bpy.context.scene.blendermcp_texture_budget_mb
+        return {
+            "total_memory_mb": round(total / (1024 * 1024), 2),
+            "budget_mb": budget_mb or None,
+            "over_budget": bool(budget_mb) and total > budget_mb * 1024 * 1024,
+            "images": images,
+        }
+
+    def _find_lower_resolution_variant(self, img):
+        """Find the next lower resolution of a downloaded texture map in the asset cache"""
+        asset_id = img.get("blendermcp_asset_id")
+        map_type = img.get("blendermcp_map_type")
+        resolution = img.get("blendermcp_resolution")
+        if not (asset_id and map_type and resolution):
+            return None
+
+        asset_dir = asset_cache.find("polyhaven", "textures", asset_id)
+        if not asset_dir:
+            return None
+        file_format = img.name.rsplit(".", 1)[-1]
+        lower = sorted(
+            (res for res in os.listdir(asset_dir) if _resolution_value(res) < _resolution_value(resolution)),
+            key=_resolution_value,
+            reverse=True,
+        )
+        for res in lower:
+            file_path = asset_cache.find("polyhaven", "textures", asset_id, res, f"{map_type}.{file_format}")
+            if file_path:
+                return res, file_path
+        return None
+
+    def _reduce_image(self, img, min_size=256):
+        """Lower an image's memory by one step; returns the (possibly replaced) image or None"""
+        variant = self._find_lower_resolution_variant(img)
+        if variant:
+            resolution, file_path = variant
+            return self._swap_texture_image(
+                img["blendermcp_asset_id"], img["blendermcp_map_type"],
+                img.name.rsplit(".", 1)[-1], resolution, file_path,
+            )
+
+        width, height = img.size
+        if max(width, height) // 2 < min_size:
+            return None
+        img.scale(max(width // 2, 1), max(height // 2, 1))
+        if img.packed_file:
+            img.pack()  # Repack so the .blend also shrinks
+        else:
+            # scale() only changes the loaded pixels, so write them out for the reduction to survive a reload
+            float_image = img.is_float
+            stem = os.path.splitext(bpy.path.basename(img.filepath) or img.name)[0]
+            # Cached maps share file names like Diffuse.jpg, so keep each source in its own folder
+            source = img.get("blendermcp_asset_id") or hashlib.sha1(
+                (bpy.path.abspath(img.filepath) or img.name).encode("utf-8")
+            ).hexdigest()[:16]
+            file_path = asset_cache.path(
+                "reduced", source, f"{stem}_{img.size[0]}x{img.size[1]}.{'exr' if float_image else 'png'}"
+            )
+            img.filepath_raw = file_path
+            img.file_format = 'OPEN_EXR' if float_image else 'PNG'
+            img.save()
+            img.filepath = file_path
+        return img
+
+    def _enforce_texture_budget(self, budget_bytes):
+        """Downscale images, lowest screen coverage first, until they fit in budget_bytes"""
+        images = [img for img in bpy.data.images if img.type == 'IMAGE' and img.size[0] > 0]
+        total = sum(self._image_memory(img) for img in images)
+        before = total
+        if total <= budget_bytes:
+            return {
+                "reduced": [],
+                "before_mb": round(before / (1024 * 1024), 2),
+                "after_mb": round(total / (1024 * 1024), 2),
+                "within_budget": True,
+            }
+
+        coverage = self._get_image_coverage()
+        images.sort(key=lambda img: (coverage.get(img.name, 0.0), -self._image_memory(img)))
+        names = [img.name for img in images]
+
+        reduced = {}
+        while total > budget_bytes:
+            progress = False
+            for i, name in enumerate(names):
+                img = bpy.data.images.get(name)
+                if img is None:
+                    continue
+                old_memory = self._image_memory(img)
+                new_img = self._reduce_image(img)
+                if new_img is None:
+                    continue
+                names[i] = new_img.name
+                total += self._image_memory(new_img) - old_memory
+                reduced[new_img.name] = [new_img.size[0], new_img.size[1]]
+                progress = True
+                if total <= budget_bytes:
+                    break
+            if not progress:
+                break  # Everything is already at its minimum size
+
+        return {
+            "reduced": [{"name": name, "size": size} for name, size in reduced.items()],
+            "before_mb": round(before / (1024 * 1024), 2),
+            "after_mb": round(total / (1024 * 1024), 2),
+            "within_budget": total <= budget_bytes,
+        }
+
+    def set_texture_budget(self, budget_mb, enforce=True):
+        """Set the scene texture memory budget in MB (0 disables it) and optionally enforce it now"""
+        if budget_mb < 0:
+            return {"error": "Texture budget must be zero or positive"}
+        bpy.context.scene.blendermcp_texture_budget_mb = int(budget_mb)
+
+        result = {"success": True, "budget_mb": int(budget_mb) or None}
+        if enforce and budget_mb:
+            result.update(self._enforce_texture_budget(int(budget_mb) * 1024 * 1024))
+        return result
+    #endregion
+
+    #region Channel packing
+    @staticmethod
+    def _linked_image_node(socket):
+        """Return the image texture node directly linked into a socket, if any"""
+        for link in socket.links:
+            if link.from_node.type == 'TEX_IMAGE' and link.from_node.image:
+                return link.from_node
+        return None
+
+    @staticmethod
+    def _read_grayscale(img, width, height):
+        """Read the first channel of an image as a flat float32 array at the given size"""
+        source = img
+        if tuple(img.size) != (width, height):
+            source = img.copy()
+            source.scale(width, height)
+        try:
+            pixels = np.empty(width * height * 4, dtype=np.float32)
+            source.pixels.foreach_get(pixels)
+            return pixels[0::4].copy()
+        finally:
+            if source is not img:
+                bpy.data.images.remove(source)
+
+    def _find_channel_sources(self, mat):
+        """Find the AO, roughness and metallic image nodes of a material, by how they are wired"""
+        nodes = mat.node_tree.nodes
+        principled = next((n for n in nodes if n.type == 'BSDF_PRINCIPLED'), None)
+        if principled is None:
+            return None, {}
+
+        sources = {}
+        rough_node = self._linked_image_node(principled.inputs['Roughness'])
+        if rough_node:
+            sources["roughness"] = rough_node
+        metal_node = self._linked_image_node(principled.inputs['Metallic'])
+        if metal_node:
+            sources["metallic"] = metal_node
+
+        for node in nodes:
+            if node.type != 'TEX_IMAGE' or not node.image or node in sources.values():
+                continue
+            map_type = str(node.image.get("blendermcp_map_type", "")).lower()
+            targets = [link.to_socket for link in node.outputs['Color'].links]
+            # AO multiplied into base color (set_texture), or glTF's occlusion output group
+            is_ao = map_type == "ao" or any(
+                (sock.node.type == 'MIX_RGB' and sock == sock.node.inputs[2]) or sock.name == "Occlusion"
+                for sock in targets
+            )
+            if is_ao:
+                sources["ao"] = node
+                break
+        return principled, sources
+
+    def _pack_channel_image(self, sources, principled):
+        """Pack grayscale maps into one RGB image (R = AO, G = roughness, B = metallic), cached per set"""
+        width = max(node.image.size[0] for node in sources.values())
+        height = max(node.image.size[1] for node in sources.values())
+
+        # The texture set is identified by its source images and their resolution
+        key_parts = [
+            f"{role}:{node.image.filepath or node.image.name}:{node.image.size[0]}x{node.image.size[1]}"
+            for role, node in sorted(sources.items())
+        ]
+        defaults = {
+            "roughness": float(principled.inputs['Roughness'].default_value),
+            "metallic": float(principled.inputs['Metallic'].default_value),
+        }
+        key_parts += [f"{role}={value:.3f}" for role, value in sorted(defaults.items()) if role not in sources]
+        digest = hashlib.sha1("|".join(key_parts).encode("utf-8")).hexdigest()[:16]
+        image_name = f"packed_arm_{digest}"
+
+        # Reuse the packed image if this set was packed before, in this file or on disk
+        cached = self._packed_channel_cache.get(digest)
+        if cached and bpy.data.images.get(cached):
+            return bpy.data.images[cached], True
+        cache_path = asset_cache.find("packed", f"{digest}.png")
+        if cache_path:
+            packed = bpy.data.images.load(cache_path, check_existing=True)
+            cached_hit = True
+        else:
+            pixels = np.ones((width * height, 4), dtype=np.float32)
+            for channel, role in enumerate(["ao", "roughness", "metallic"]):
+                if role in sources:
+                    pixels[:, channel] = self._read_grayscale(sources[role].image, width, height)
+                elif role in defaults:
+                    pixels[:, channel] = defaults[role]
+
+            packed = bpy.data.images.new(image_name, width, height, alpha=False)
+            packed.pixels.foreach_set(pixels.ravel())
+            packed.filepath_raw = asset_cache.path("packed", f"{digest}.png")
+            packed.file_format = 'PNG'
+            packed.save()
+            cached_hit = False
+
+        packed.name = image_name
+        try:
+            packed.colorspace_settings.name = 'Non-Color'
+        except:
+            pass
+        if bpy.context.scene.blendermcp_pack_textures and not packed.packed_file:
+            packed.pack()
+        self._packed_channel_cache[digest] = packed.name
+        return packed, cached_hit
+
+    def _pack_material_channels(self, mat):
+        """Replace a material's separate AO/roughness/metallic maps with one packed image"""
+        if not mat.use_nodes or not mat.node_tree:
+            return {"packed": False, "reason": "Material does not use nodes"}
+        principled, sources = self._find_channel_sources(mat)
+        if len(sources) < 2:
+            return {"packed": False, "reason": "Fewer than two grayscale maps to pack"}
+
+        packed, cached_hit = self._pack_channel_image(sources, principled)
+
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+        first = next(iter(sources.values()))
+
+        packed_node = nodes.new(type='ShaderNodeTexImage')
+        packed_node.location = (first.location.x, first.location.y)
+        packed_node.image = packed
+        # Keep the same texture coordinates as the maps being replaced
+        for link in first.inputs['Vector'].links:
+            links.new(link.from_socket, packed_node.inputs['Vector'])
+
+        try:
+            separate = nodes.new(type='ShaderNodeSeparateColor')
+        except RuntimeError:
+            separate = nodes.new(type='ShaderNodeSeparateRGB')
+        separate.location = (packed_node.location.x + 300, packed_node.location.y)
+        links.new(packed_node.outputs['Color'], separate.inputs[0])
+
+        # Move every link from the old maps to the matching channel
+        old_images = set()
+        for channel, role in enumerate(["ao", "roughness", "metallic"]):
+            node = sources.get(role)
+            if node is None:
+                continue
+            for link in list(node.outputs['Color'].links):
+                links.new(separate.outputs[channel], link.to_socket)
+            old_images.add(node.image)
+            nodes.remove(node)
+
+        # Free the grayscale images if nothing else samples them. Maps of a downloaded texture set are
+        # kept with a fake user, since set_texture looks them up again by texture_id
+        for img in old_images:
+            if img.get("blendermcp_asset_id"):
+                img.use_fake_user = True
+            elif img.users == 0:
+                bpy.data.images.remove(img)
+
+        return {
+            "packed": True,
+            "image": packed.name,
+            "channels": {"R": "ao", "G": "roughness", "B": "metallic"},
+            "replaced_maps": sorted(sources),
+            "cached": cached_hit,
+        }
+
+    def _pack_or_defer(self, asset_id, mat):
+        """Pack a material's channels now, or after its progressive texture upgrade finishes"""
+        job = self.texture_upgrades.get(asset_id)
+        if job and job["status"] == "downloading":
+            job.setdefault("pack_materials", []).append(mat.name)
+            return {"packed": False, "reason": "Deferred until the texture upgrade finishes"}
+        return self._pack_material_channels(mat)
+
+    def pack_material_channels(self, material_name):
+        """Pack a material's AO, roughness and metallic maps into one RGB texture"""
+        mat = bpy.data.materials.get(material_name)
+        if not mat:
+            return {"error": f"Material not found: {material_name}"}
+        result = self._pack_material_channels(mat)
+        result["material"] = mat.name
+        return result
+    #endregion
+
+    #region Polygon budget
+    @staticmethod
+    def _count_faces(objects):
+        """Number of polygons drawn for the given objects (instanced meshes count every time)"""
+        return sum(len(obj.data.polygons) for obj in objects if obj.type == 'MESH' and obj.data)
+
+    @staticmethod
+    def _decimated_mesh(obj, ratio):
+        """Return a new mesh datablock with obj's mesh reduced to ratio of its faces"""
+        modifier = obj.modifiers.new(name="BlenderMCP Decimate", type='DECIMATE')
+        modifier.decimate_type = 'COLLAPSE'
+        modifier.ratio = ratio
+        try:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            depsgraph.update()
+            mesh = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph))
+        finally:
+            obj.modifiers.remove(modifier)
+        return mesh
+
+    def _apply_polygon_budget(self, objects, max_faces=None, generate_lods=False):
+        """Decimate freshly imported objects to max_faces and the scene budget, optionally adding LODs"""
+        mesh_objects = [obj for obj in objects if obj.type == 'MESH' and obj.data]
+        faces_before = self._count_faces(mesh_objects)
+
+        # The scene budget only leaves room for what the rest of the scene doesn't use; None means no limit
+        target = max_faces or None
+        scene_budget = bpy.context.scene.blendermcp_max_scene_faces
+        if scene_budget:
+            imported = set(mesh_objects)
+            other_faces = self._count_faces(obj for obj in bpy.context.scene.objects if obj not in imported)
+            remaining = max(scene_budget - other_faces, 0)
+            target = remaining if target is None else min(target, remaining)
+
+        ratio = 1.0
+        if target is not None and faces_before > target:
+            ratio = max(target / faces_before, MIN_DECIMATE_RATIO)
+            # Decimate each mesh datablock once, even when several objects share it
+            replaced = {}
+            for obj in mesh_objects:
+                old_mesh = obj.data
+                if old_mesh.name not in replaced:
+                    new_mesh = self._decimated_mesh(obj, ratio)
+                    new_mesh["blendermcp_decimate_ratio"] = ratio
+                    replaced[old_mesh.name] = new_mesh
+                obj.data = replaced[old_mesh.name]
+            for old_name, new_mesh in replaced.items():
+                old_mesh = bpy.data.meshes.get(old_name)
+                if old_mesh and old_mesh.users == 0:
+                    bpy.data.meshes.remove(old_mesh)
+                new_mesh.name = old_name
+
+        result = {
+            "faces_before": faces_before,
+            "faces_after": self._count_faces(mesh_objects),
+            "decimated": ratio < 1.0,
+            "ratio": round(ratio, 4),
+        }
+        if scene_budget and target is not None and result["faces_after"] > target:
+            result["warning"] = "The scene polygon budget is exhausted; the import was reduced as far as allowed"
+
+        if generate_lods:
+            result["lods"] = self._generate_lods(mesh_objects)
+        return result
+
+    def _generate_lods(self, mesh_objects):
+        """Add hidden LOD1/LOD2 copies next to each mesh object, which stays as LOD0"""
+        lods = []
+        for obj in mesh_objects:
+            entry = {"LOD0": obj.name}
+            for level, ratio in LOD_RATIOS:
+                lod_obj = obj.copy()
+                lod_obj.data = self._decimated_mesh(obj, ratio)
+                lod_obj.name = f"{obj.name}_LOD{level}"
+                lod_obj.data.name = lod_obj.name
+                for collection in obj.users_collection:
+                    collection.objects.link(lod_obj)
+                lod_obj.hide_set(True)
+                lod_obj.hide_render = True
+                entry[f"LOD{level}"] = lod_obj.name
+            lods.append(entry)
+        return lods
+
+    def set_polygon_budget(self, max_scene_faces):
+        """Set the scene-wide polygon budget used by imports (0 disables it)"""
+        if max_scene_faces < 0:
+            return {"error": "Polygon budget must be zero or positive"}
+        scene = bpy.context.scene
+        scene.blendermcp_max_scene_faces = int(max_scene_faces)
+        return {
+            "success": True,
+            "max_scene_faces": int(max_scene_faces) or None,
+            "scene_faces": self._count_faces(scene.objects),
+        }
+    #endregion
+
+    #region Import staging
+    @contextmanager
+    def _import_staging(self):
+        """Make a temporary collection the import target, so everything an import creates ends up in it"""
+        view_layer = bpy.context.view_layer
+        previous = view_layer.active_layer_collection
+        staging = bpy.data.collections.new("BlenderMCP Staging")
+        bpy.context.scene.collection.children.link(staging)
+        view_layer.active_layer_collection = view_layer.layer_collection.children[staging.name]
+        try:
+            yield staging
+        except Exception:
+            # Don't leave a half-finished import behind
+            view_layer.active_layer_collection = previous
+            for obj in list(staging.all_objects):
+                bpy.data.objects.remove(obj)
+            bpy.data.collections.remove(staging)
+            raise
+        finally:
+            view_layer.active_layer_collection = previous
+
+    @staticmethod
+    def _collapse_empty_parents(objects):
+        """Remove empties that only carry one child, keeping the child's world transform"""
+        kept = list(objects)
+        for obj in list(kept):
+            if obj.type != 'EMPTY' or obj.instance_type != 'NONE' or len(obj.children) != 1:
+                continue
+            child = obj.children[0]
+            matrix_world = child.matrix_world.copy()
+            child.parent = obj.parent
+            child.matrix_parent_inverse.identity()
+            child.matrix_world = matrix_world
+            kept.remove(obj)
+            bpy.data.objects.remove(obj)
+        return kept
+
+    def _unstage_import(self, staging, name=None, destination=None, collapse=True):
+        """Clean up the objects of a staging collection and move them to their destination in one step.
+
+        Single-child empties are collapsed (unless collapse is False), a lone root object is renamed to name, and the
+        result is selected, as after a regular import. Returns the imported objects.
+        """
+        destination = destination or bpy.context.view_layer.active_layer_collection.collection
+        # Only the import is looked at, however large the scene is
+        bpy.context.view_layer.update()
+        objects = list(staging.all_objects)
+        if collapse:
+            objects = self._collapse_empty_parents(objects)
+
+        roots = [obj for obj in objects if obj.parent is None]
+        if name and len(roots) == 1:
+            try:
+                roots[0].name = name
+                if roots[0].data is not None:
+                    roots[0].data.name = name
+            except Exception:
+                print("Having issue with renaming, give up renaming.")
+
+        # Importers that create their own collections keep them, under the destination
+        for child in list(staging.children):
+            destination.children.link(child)
+            staging.children.unlink(child)
+        for obj in list(staging.objects):
+            destination.objects.link(obj)
+            staging.objects.unlink(obj)
+        bpy.data.collections.remove(staging)
+
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
+        for obj in objects:
+            obj.select_set(True)
+        if roots:
+            bpy.context.view_layer.objects.active = roots[0]
+        return objects
+    #endregion
+
+    #region Imported assets
+    def _register_imported_asset(self, source_id, objects):
+        """Remember the objects created by an import, so repeat requests can duplicate them"""
+        # A new import of the same source (e.g. with more detail) replaces the earlier template
+        for obj in bpy.data.objects:
+            if obj.get("blendermcp_source") == source_id and obj.library is None:
+                del obj["blendermcp_source"]
+        names = []
+        for obj in objects:
+            obj["blendermcp_source"] = source_id
+            names.append(obj.name)
+        self.imported_assets[source_id] = names
+
+    def _find_imported_asset(self, source_id):
+        """Return the objects of the first import of source_id that still exist, or None"""
+        names = self.imported_assets.get(source_id)
+        if names is None:
+            # Imports from an earlier session are recognized by their tag
+            names = [obj.name for obj in bpy.data.objects if obj.get("blendermcp_source") == source_id and obj.library is None]
+            if not names:
+                return None
+            self.imported_assets[source_id] = names
+
+        objects = [bpy.data.objects.get(name) for name in names]
+        if not objects or any(obj is None for obj in objects):
+            # The original was (partly) deleted, so it can't serve as a template anymore
+            del self.imported_assets[source_id]
+            return None
+        return objects
+
+    @staticmethod
+    def _is_decimated(objects):
+        """Whether any mesh of objects was reduced by the polygon budget"""
+        return any(
+            obj.type == 'MESH' and obj.data and obj.data.get("blendermcp_decimate_ratio", 1.0) < 1.0
+            for obj in objects
+        )
+
+    @staticmethod
+    def _has_detail_for(faces, decimated, max_faces):
+        """Whether an earlier copy with faces polygons can serve a request for max_faces (None: full detail)"""
+        return not decimated or (max_faces is not None and faces >= max_faces)
+
+    def _duplicate_imported_asset(self, source_id, max_faces=None):
+        """Create linked duplicates (shared mesh data) of an earlier import, keeping its hierarchy"""
+        objects = self._find_imported_asset(source_id)
+        if not objects:
+            return None
+        if not self._has_detail_for(self._count_faces(objects), self._is_decimated(objects), max_faces):
+            return None
+
+        collection = bpy.context.collection
+        copies = {}
+        for obj in objects:
+            # Object.copy() shares the data block, so no mesh, material or image is duplicated
+            copy = obj.copy()
+            # Only the first import is tagged, so later scans don't take duplicates for the template
+            if "blendermcp_source" in copy:
+                del copy["blendermcp_source"]
+            collection.objects.link(copy)
+            copies[obj] = copy
+        for obj, copy in copies.items():
+            if obj.parent in copies:
+                copy.parent = copies[obj.parent]
+                copy.matrix_parent_inverse = obj.matrix_parent_inverse.copy()
+
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
+        for copy in copies.values():
+            copy.select_set(True)
+
+        # Copies that don't fit the budget get their own decimated mesh, leaving the original untouched
+        polygons = self._apply_polygon_budget(list(copies.values()), max_faces)
+        return {
+            "imported_objects": [copy.name for copy in copies.values()],
+            "linked_duplicate": not polygons["decimated"],
+            "source_objects": [obj.name for obj in objects],
+            "polygons": polygons,
+        }
+    #endregion
+
+    #region Asset library
+    @staticmethod
+    def _library_thumbnail(objects, size=128):
+        """Front view of the objects' vertices, shaded by depth, as PNG bytes"""
+        points = []
+        for obj in objects:
+            if obj.type != 'MESH' or not obj.data or not obj.data.vertices:
+                continue
+            co = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+            obj.data.vertices.foreach_get("co", co)
+            matrix = np.array(obj.matrix_world, dtype=np.float32)
+            points.append(co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3])
+
+        pixels = np.zeros((size, size, 4), dtype=np.uint8)
+        if points:
+            p = np.concatenate(points)
+            if len(p) > 1000000:
+                p = p[::len(p) // 1000000 + 1]
+            low, high = p.min(axis=0), p.max(axis=0)
+            center = (low + high) / 2
+            scale = (size - 9) / (max(high[0] - low[0], high[2] - low[2]) or 1.0)
+            # Looking along +Y: x to the right, z up, nearer points brighter
+            x = ((p[:, 0] - center[0]) * scale + (size - 1) / 2).astype(np.int32)
+            y = ((center[2] - p[:, 2]) * scale + (size - 1) / 2).astype(np.int32)
+            depth = (p[:, 1] - low[1]) / ((high[1] - low[1]) or 1.0)
+            order = np.argsort(-depth)
+            pixels[y[order], x[order], :3] = (230 - 150 * depth[order]).astype(np.uint8)[:, None]
+            pixels[y[order], x[order], 3] = 255
+        return _encode_png(pixels)
+
+    @staticmethod
+    def _object_images(objects):
+        """Images sampled by the materials of objects, including inside node groups"""
+        images = set()
+        seen_trees = set()
+
+        def visit(tree):
+            # Material node trees are embedded and all share one name, so tell them apart by pointer
+            if tree is None or tree.as_pointer() in seen_trees:
+                return
+            seen_trees.add(tree.as_pointer())
+            for node in tree.nodes:
+                if getattr(node, "image", None) is not None:
+                    images.add(node.image)
+                if node.type == 'GROUP':
+                    visit(node.node_tree)
+
+        for obj in objects:
+            for slot in obj.material_slots:
+                if slot.material and slot.material.use_nodes:
+                    visit(slot.material.node_tree)
+        return images
+
+    def _save_to_library(self, source_id, objects, name=None):
+        """Write objects with their meshes, materials and images to a library .blend file and index it"""
+        objects = [obj for obj in objects if obj.library is None]
+        if not objects:
+            raise ValueError("No local objects to save")
+        key = asset_library.key(source_id)
+
+        blend_file = f"{key}.blend"
+        blend_path = asset_library.path(blend_file)
+        partial_path = asset_library.path(f"{key}.part.blend")
+        # Dependencies (mesh data, materials, images) are written along with the objects. Images are
+        # packed into the file, since they usually live in the asset cache, which gets trimmed
+        packed = []
+        try:
+            for img in self._object_images(objects):
+                if img.source == 'FILE' and not img.packed_file and os.path.exists(bpy.path.abspath(img.filepath)):
+                    img.pack()
+                    packed.append(img)
+            bpy.data.libraries.write(partial_path, set(objects), path_remap='ABSOLUTE', compress=True)
+        finally:
+            # The scene keeps using the files, as before
+            for img in packed:
+                with suppress(Exception):
+                    img.unpack(method='REMOVE')
+        os.replace(partial_path, blend_path)
+
+        thumbnail_file = os.path.join("thumbnails", f"{key}.png")
+        with open(asset_library.path(thumbnail_file), "wb") as f:
+            f.write(self._library_thumbnail(objects))
+
+        boxes = [self._get_aabb(obj) for obj in objects if obj.type == 'MESH']
+        bounds = None
+        if boxes:
+            bounds = [
+                [min(box[0][i] for box in boxes) for i in range(3)],
+                [max(box[1][i] for box in boxes) for i in range(3)],
+            ]
+
+        roots = [obj for obj in objects if obj.parent not in objects]
+        entry = {
+            "source_id": source_id,
+            "name": name or roots[0].name,
+            "file": blend_file,
+            "objects": [obj.name for obj in objects],
+            "faces": self._count_faces(objects),
+            "decimated": self._is_decimated(objects),
+            "bounds": bounds,
+            "thumbnail": thumbnail_file,
+            "saved": time.time(),
+        }
+        asset_library.put(entry)
+        return entry
+
+    def _save_import_to_library(self, result, source_id, objects):
+        """Save an import to the library, reporting problems without failing the import"""
+        try:
+            entry = self._save_to_library(source_id, objects)
+            result["library"] = {"source_id": source_id, "file": os.path.join(asset_library.root, entry["file"])}
+        except Exception as e:
+            traceback.print_exc()
+            result["library_error"] = str(e)
+        return result
+
+    def _load_library_asset(self, entry, link=False):
+        """Append (or link) only the objects of a library entry and their dependencies"""
+        blend_path = os.path.join(asset_library.root, entry["file"])
+        with self._import_staging() as staging:
+            with bpy.data.libraries.load(blend_path, link=link) as (data_from, data_to):
+                data_to.objects = [name for name in data_from.objects if name in entry["objects"]]
+            for obj in data_to.objects:
+                if obj is not None:
+                    staging.objects.link(obj)
+        # Linked objects can't be edited, so they are taken as they are
+        return self._unstage_import(staging, collapse=not link)
+
+    def _reuse_library_asset(self, source_id, max_faces=None, generate_lods=False):
+        """Import source_id from the library if it was saved there, else return None"""
+        entry = asset_library.get(source_id)
+        if entry is None or not self._has_detail_for(entry["faces"], entry.get("decimated", False), max_faces):
+            return None
+        objects = self._load_library_asset(entry)
+        polygons = self._apply_polygon_budget(objects, max_faces, generate_lods)
+        self._register_imported_asset(source_id, objects)
+        return {
+            "imported_objects": [obj.name for obj in objects],
+            "from_library": True,
+            "polygons": polygons,
+        }
+
+    def save_to_library(self, object_names, source_id=None, name=None):
+        """Save scene objects to the local asset library"""
+        try:
+            objects = [bpy.data.objects.get(object_name) for object_name in object_names]
+            missing = [n for n, obj in zip(object_names, objects) if obj is None]
+            if missing:
+                return {"error": f"Objects not found: {', '.join(missing)}"}
+            if not objects:
+                return {"error": "No objects given"}
+
+            source_id = source_id or f"scene:{name or objects[0].name}"
+            entry = self._save_to_library(source_id, objects, name)
+            return {"success": True, **entry, "file": os.path.join(asset_library.root, entry["file"])}
+        except Exception as e:
+            traceback.print_exc()
+            return {"error": f"Failed to save to library: {str(e)}"}
+
+    def load_from_library(self, source_id=None, name=None, link=False):
+        """Append or link an asset from the local asset library"""
+        try:
+            entry = asset_library.find(source_id, name)
+            if entry is None:
+                return {"error": f"Asset not found in the library: {source_id or name}"}
+
+            objects = self._load_library_asset(entry, link)
+            if link:
+                # Linked meshes can't be decimated, so the budget can only be reported
+                faces = self._count_faces(objects)
+                polygons = {"faces_before": faces, "faces_after": faces, "decimated": False, "ratio": 1.0}
+                scene_budget = bpy.context.scene.blendermcp_max_scene_faces
+                if scene_budget and self._count_faces(bpy.context.scene.objects) > scene_budget:
+                    polygons["warning"] = "The scene polygon budget is exceeded; append instead of linking to decimate"
+            else:
+                polygons = self._apply_polygon_budget(objects)
+                self._register_imported_asset(entry["source_id"], objects)
+            return {
+                "success": True,
+                "message": f"{'Linked' if link else 'Appended'} {entry['name']} from the library",
+                "source_id": entry["source_id"],
+                "imported_objects": [obj.name for obj in objects],
+                "linked": link,
+                "faces": entry["faces"],
+                "bounds": entry["bounds"],
+                "polygons": polygons,
+            }
+        except Exception as e:
+            traceback.print_exc()
+            return {"error": f"Failed to load from library: {str(e)}"}
+
+    def list_library_assets(self, query=None):
+        """List the assets in the local asset library, optionally filtered by name or source id"""
+        assets = []
+        for source_id, entry in asset_library.entries().items():
+            if asset_library.get(source_id) is None:
+                continue
+            if query and query.lower() not in f"{entry['name']} {source_id}".lower():
+                continue
+            assets.append({
+                **entry,
+                "thumbnail": os.path.join(asset_library.root, entry["thumbnail"]),
+            })
+        assets.sort(key=lambda entry: entry["saved"], reverse=True)
+        return {"library": asset_library.root, "assets": assets}
+    #endregion
+
+    #region Blend library index
+    @staticmethod
+    def _blend_folders():
+        """Folders to index: the panel setting plus BLENDERMCP_BLEND_FOLDERS, both separated by ';'"""
+        configured = f"{bpy.context.scene.blendermcp_blend_folders};{os.environ.get('BLENDERMCP_BLEND_FOLDERS', '')}"
+        return [folder.strip() for folder in configured.replace(os.pathsep, ";").split(";") if folder.strip()]
+
+    def index_blend_library(self, folders=None):
+        """Start (re)indexing folders of .blend files in the background"""
+        folders = folders or self._blend_folders()
+        if not folders:
+            return {"error": "No .blend folders configured. Set them in the BlenderMCP panel or pass folders."}
+        missing = [folder for folder in folders if not os.path.isdir(os.path.expanduser(folder))]
+        if missing:
+            return {"error": f"Folders not found: {', '.join(missing)}"}
+
+        started = blend_index.scan(folders, bpy.app.binary_path)
+        return {"started": started, **blend_index.status}
+
+    def search_blend_library(self, query="", datablock_type=None, object_type=None, limit=50):
+        """Search datablock names in the indexed .blend files"""
+        # Keep the index fresh without making the search wait for it
+        folders = self._blend_folders()
+        last_scan = blend_index.status["last_scan"]
+        if folders and (last_scan is None or time.time() - last_scan > BLEND_INDEX_RESCAN_INTERVAL):
+            blend_index.scan(folders, bpy.app.binary_path)
+
+        return {
+            "matches": blend_index.search(query, datablock_type, object_type, limit),
+            "indexed_files": len(blend_index.files()),
+            "status": dict(blend_index.status),
+        }
+    #endregion
+
+    #region Multi-view renders
+    @contextmanager
+    def _temporary_settings(self, changes):
+        """Apply (owner, attribute, value) changes, restoring the previous values afterwards.
+
+        Attributes the owner doesn't have, like engine settings of other Blender
+        versions, are skipped.
+        """
+        previous = []
+        try:
+            for owner, attribute, value in changes:
+                if owner is None or not hasattr(owner, attribute):
+                    continue
+                old_value = getattr(owner, attribute)
+                try:
+                    setattr(owner, attribute, value)
+                except (TypeError, ValueError, AttributeError):
+                    continue
+                previous.append((owner, attribute, old_value))
+            yield
+        finally:
+            for owner, attribute, old_value in reversed(previous):
+                with suppress(Exception):
+                    setattr(owner, attribute, old_value)
+
+    @staticmethod
+    def _render_engine_id(engine):
+        """Map CYCLES/EEVEE/WORKBENCH to the engine identifier of this Blender version"""
+        available = bpy.types.RenderSettings.bl_rna.properties["engine"].enum_items.keys()
+        candidates = {
+            "CYCLES": ["CYCLES"],
+            "EEVEE": ["BLENDER_EEVEE_NEXT", "BLENDER_EEVEE"],
+            "WORKBENCH": ["BLENDER_WORKBENCH"],
+        }.get(engine.upper(), [engine.upper()])
+        for candidate in candidates:
+            if candidate in available:
+                return candidate
+        raise ValueError(f"Render engine not available: {engine}")
+
+    def _preview_render_changes(self, scene, engine, width, height, samples, filepath, percentage=100,
+                                force_cpu=True):
+        """Settings for a quick low-resolution render of the scene"""
+        render = scene.render
+        changes = [
+            (render, "engine", engine),
+            (render, "resolution_x", width),
+            (render, "resolution_y", height),
+            (render, "resolution_percentage", percentage),
+            (render, "pixel_aspect_x", 1.0),
+            (render, "pixel_aspect_y", 1.0),
+            (render, "use_border", False),
+            (render, "use_compositing", False),
+            (render, "use_sequencer", False),
+            # Keeps the scene loaded in Cycles between the views
+            (render, "use_persistent_data", True),
+            (render, "filepath", filepath),
+            (render.image_settings, "file_format", "PNG"),
+            (render.image_settings, "color_mode", "RGB"),
+            (render.image_settings, "color_depth", "8"),
+        ]
+        if engine == "CYCLES":
+            cycles = getattr(scene, "cycles", None)
+            if force_cpu:
+                changes.append((cycles, "device", "CPU"))
+            changes += [
+                (cycles, "samples", samples),
+                (cycles, "use_adaptive_sampling", True),
+                (cycles, "max_bounces", 4),
+                (cycles, "use_denoising", True),
+                (cycles, "denoiser", "OPENIMAGEDENOISE"),
+                (cycles, "time_limit", 0.0),
+            ]
+        elif engine.startswith("BLENDER_EEVEE"):
+            changes += [
+                (scene.eevee, "taa_render_samples", samples),
+                (scene.eevee, "use_raytracing", False),
+                (scene.eevee, "use_gtao", False),
+                (scene.eevee, "use_bloom", False),
+                (scene.eevee, "use_ssr", False),
+            ]
+        return changes
+
+    @staticmethod
+    def _render_target_bounds(objects):
+        """World space bounding box center and radius of objects"""
+        corners = [
+            obj.matrix_world @ mathutils.Vector(corner)
+            for obj in objects
+            for corner in obj.bound_box
+        ]
+        low = mathutils.Vector(tuple(min(c[i] for c in corners) for i in range(3)))
+        high = mathutils.Vector(tuple(max(c[i] for c in corners) for i in range(3)))
+        return (low + high) / 2, max((high - low).length / 2, 0.01)
+
+    @staticmethod
+    def _load_rendered_pixels(filepath):
+        """Read a rendered PNG as a (height, width, 3) uint8 array, top row first"""
+        image = bpy.data.images.load(filepath)
+        try:
+            width, height = image.size
+            pixels = np.empty(width * height * image.channels, dtype=np.float32)
+            image.pixels.foreach_get(pixels)
+            pixels = pixels.reshape(height, width, image.channels)[::-1, :, :3]
+        finally:
+            bpy.data.images.remove(image)
+        return np.clip(np.rint(pixels * 255), 0, 255).astype(np.uint8)
+
+    def render_views(self, object_names=None, views=None, resolution=256, engine="CYCLES", samples=16,
+                     format="png", quality=85):
+        """
+        Render a target from several directions and return the views as one contact sheet.
+
+        Parameters:
+        - object_names: Objects to frame; defaults to the selection, or all visible objects
+        - views: View names, from front, back, right (or side), left, top, bottom and iso
+        - resolution: Size in pixels of each square view
+        - engine: CYCLES (on the CPU), EEVEE or WORKBENCH
+        - samples: Render samples per view
+        - format, quality: Encoding of the contact sheet, as for get_viewport_screenshot
+
+        The views are rendered one after the other with preview settings, which are
+        restored afterwards. Tiles are laid out left to right, top to bottom, in the
+        order of views.
+        """
+        views = views or ["front", "side", "top", "iso"]
+        unknown = [view for view in views if view not in RENDER_VIEW_DIRECTIONS]
+        if unknown:
+            return {"error": f"Unknown views: {', '.join(unknown)}. Use {', '.join(RENDER_VIEW_DIRECTIONS)}"}
+        scene = bpy.context.scene
+
+        if object_names:
+            objects = [bpy.data.objects.get(name) for name in object_names]
+            missing = [name for name, obj in zip(object_names, objects) if obj is None]
+            if missing:
+                return {"error": f"Objects not found: {', '.join(missing)}"}
+        else:
+            objects = list(bpy.context.selected_objects) or [obj for obj in scene.objects if obj.visible_get()]
+        objects = [obj for obj in objects if obj.type not in ('CAMERA', 'LIGHT', 'LIGHT_PROBE', 'SPEAKER')]
+        if not objects:
+            return {"error": "Nothing to render"}
+
+        try:
+            engine_id = self._render_engine_id(engine)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        center, radius = self._render_target_bounds(objects)
+        temp_dir = tempfile.mkdtemp(prefix="blendermcp_views_")
+        cameras = []
+        tiles = []
+        timings = []
+        try:
+            for view in views:
+                direction = mathutils.Vector(RENDER_VIEW_DIRECTIONS[view]).normalized()
+                camera_data = bpy.data.cameras.new(f"BlenderMCP View {view}")
+                camera_data.type = 'ORTHO'
+                camera_data.ortho_scale = radius * 2.2
+                camera_data.clip_start = radius * 0.01
+                camera_data.clip_end = radius * 8
+                camera = bpy.data.objects.new(camera_data.name, camera_data)
+                camera.location = center + direction * radius * 3
+                if abs(direction.z) > 0.999:
+                    # Looking straight down or up, with world +Y or -Y up on screen
+                    camera.rotation_euler = (0.0, 0.0, 0.0) if direction.z > 0 else (np.pi, 0.0, 0.0)
+                else:
+                    camera.rotation_euler = (-direction).to_track_quat('-Z', 'Y').to_euler()
+                scene.collection.objects.link(camera)
+                cameras.append(camera)
+
+            filepath = os.path.join(temp_dir, "view.png")
+            render_start = time.time()
+            with self._temporary_settings(
+                self._preview_render_changes(scene, engine_id, resolution, resolution, samples, filepath)
+                + [(scene, "camera", cameras[0])]
+            ):
+                for view, camera in zip(views, cameras):
+                    view_start = time.time()
+                    scene.camera = camera
+                    bpy.ops.render.render(write_still=True)
+                    tiles.append(self._load_rendered_pixels(filepath))
+                    timings.append({"view": view, "seconds": round(time.time() - view_start, 3)})
+            render_seconds = time.time() - render_start
+        except Exception as e:
+            traceback.print_exc()
+            return {"error": f"Render failed: {str(e)}"}
+        finally:
+            for camera in cameras:
+                camera_data = camera.data
+                bpy.data.objects.remove(camera)
+                bpy.data.cameras.remove(camera_data)
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        def compose():
+            columns = int(np.ceil(np.sqrt(len(tiles))))
+            rows = int(np.ceil(len(tiles) / columns))
+            gap = 2
+            sheet = np.full(
+                (rows * resolution + (rows - 1) * gap, columns * resolution + (columns - 1) * gap, 3),
+                32, dtype=np.uint8
+            )
+            for index, tile in enumerate(tiles):
+                row, column = divmod(index, columns)
+                top, left = row * (resolution + gap), column * (resolution + gap)
+                tile = _resize_pixels(tile, resolution, resolution)
+                sheet[top:top + resolution, left:left + resolution] = tile
+            data, used_format = _encode_image(sheet, format, quality)
+            return data, used_format, sheet.shape[1], sheet.shape[0], columns
+
+        def finish(encoded):
+            data, used_format, width, height, columns = encoded
+            return {
+                "success": True,
+                "width": width,
+                "height": height,
+                "format": used_format,
+                "columns": columns,
+                "engine": engine_id,
+                "views": [
+                    dict(timing, row=index // columns, column=index % columns)
+                    for index, timing in enumerate(timings)
+                ],
+                "render_seconds": round(render_seconds, 3),
+                "binary": data,
+            }
+
+        return DeferredResult(compose, finish)
+    #endregion
+
+    #region Preview profiles
+    @staticmethod
+    def _preview_work(scene, profile):
+        """Pixels times samples of a profile, the unit render times are calibrated in"""
+        scale = profile["resolution_percentage"] / 100
+        return scene.render.resolution_x * scale * scene.render.resolution_y * scale * profile["samples"]
+
+    def _predict_preview_seconds(self, calibration_key, work):
+        """Predicted render time for an amount of work, from the observed renders; None without any"""
+        observations = self._preview_calibration.get(calibration_key)
+        if not observations:
+            return None
+        works = np.array([w for w, _ in observations])
+        seconds = np.array([t for _, t in observations])
+        if len(set(works.tolist())) >= 2:
+            # Fixed overhead (scene sync, BVH build) plus a cost per sample and pixel
+            cost, overhead = np.polyfit(works, seconds, 1)
+            if cost > 0 and overhead >= 0:
+                return float(overhead + cost * work)
+        # Not enough to separate the two; assume a quarter of the latest render was overhead
+        last_work, last_seconds = observations[-1]
+        return float(last_seconds * 0.25 + last_seconds * 0.75 * work / last_work)
+
+    def _choose_preview_profile(self, scene, calibration_key, target_seconds):
+        """Index of the best profile predicted to render within target_seconds"""
+        chosen = 0
+        for index, profile in enumerate(PREVIEW_PROFILES):
+            predicted = self._predict_preview_seconds(calibration_key, self._preview_work(scene, profile))
+            if predicted is not None and predicted <= target_seconds:
+                chosen = index
+        return chosen
+
+    def _preview_profile_changes(self, scene, engine, profile, filepath):
+        """Render settings of a preview profile, on top of the scene's resolution"""
+        render = scene.render
+        changes = self._preview_render_changes(
+            scene, engine, render.resolution_x, render.resolution_y, profile["samples"], filepath,
+            percentage=profile["resolution_percentage"], force_cpu=False
+        )
+        cycles = getattr(scene, "cycles", None)
+        simplify = profile["simplify_subdivision"] is not None or profile["texture_limit"]
+        changes += [
+            (render, "use_simplify", bool(simplify)),
+            (render, "simplify_subdivision_render", profile["simplify_subdivision"] or 0),
+            (render, "simplify_child_particles_render", 0.25 if simplify else 1.0),
+        ]
+        if engine == "CYCLES":
+            changes += [
+                (cycles, "max_bounces", profile["max_bounces"]),
+                (cycles, "diffuse_bounces", min(profile["max_bounces"], 4)),
+                (cycles, "glossy_bounces", min(profile["max_bounces"], 4)),
+                (cycles, "transmission_bounces", profile["max_bounces"]),
+                (cycles, "volume_bounces", 0 if profile["max_bounces"] < 4 else 1),
+                (cycles, "caustics_reflective", False),
+                (cycles, "caustics_refractive", False),
+                (cycles, "texture_limit_render", str(profile["texture_limit"]) if profile["texture_limit"] else "OFF"),
+            ]
+        return changes
+
+    def _render_with_profile(self, scene, engine, profile, calibration_key, filepath):
+        """Render the scene camera with a profile applied temporarily; returns (pixels, seconds)"""
+        with self._temporary_settings(self._preview_profile_changes(scene, engine, profile, filepath)):
+            started = time.time()
+            bpy.ops.render.render(write_still=True)
+            seconds = time.time() - started
+        observations = self._preview_calibration.setdefault(calibration_key, [])
+        observations.append((self._preview_work(scene, profile), seconds))
+        del observations[:-PREVIEW_CALIBRATION_SAMPLES]
+        return self._load_rendered_pixels(filepath), seconds
+
+    def render_preview(self, target_seconds=2.0, engine=None, camera=None, format="png", quality=85):
+        """
+        Render a quick preview through the scene camera within a target latency.
+
+        Resolution percentage, samples, denoising, Simplify and light path limits come
+        from the best of PREVIEW_PROFILES predicted to finish in target_seconds, using
+        the render times observed for this scene so far. Without any yet, the cheapest
+        profile is rendered first to calibrate, then a better one if the budget allows.
+        All render settings are restored afterwards.
+        """
+        scene = bpy.context.scene
+        if camera and bpy.data.objects.get(camera) is None:
+            return {"error": f"Camera not found: {camera}"}
+        if not camera and scene.camera is None:
+            return {"error": "The scene has no camera. Use render_views to render around objects."}
+        try:
+            engine_id = self._render_engine_id(engine) if engine else scene.render.engine
+        except ValueError as e:
+            return {"error": str(e)}
+        target_seconds = max(0.1, float(target_seconds))
+        calibration_key = (scene.name, engine_id)
+
+        temp_dir = tempfile.mkdtemp(prefix="blendermcp_preview_")
+        filepath = os.path.join(temp_dir, "preview.png")
+        renders = []
+        try:
+            with self._temporary_settings([(scene, "camera", bpy.data.objects.get(camera) if camera else scene.camera)]):
+                if not self._preview_calibration.get(calibration_key):
+                    pixels, seconds = self._render_with_profile(
+                        scene, engine_id, PREVIEW_PROFILES[0], calibration_key, filepath
+                    )
+                    renders.append({"profile": 0, "seconds": round(seconds, 3), "calibration": True})
+                    budget = target_seconds - seconds
+                else:
+                    pixels, budget = None, target_seconds
+
+                index = self._choose_preview_profile(scene, calibration_key, budget)
+                if pixels is None or index > 0:
+                    predicted = self._predict_preview_seconds(
+                        calibration_key, self._preview_work(scene, PREVIEW_PROFILES[index])
+                    )
+                    pixels, seconds = self._render_with_profile(
+                        scene, engine_id, PREVIEW_PROFILES[index], calibration_key, filepath
+                    )
+                    renders.append({
+                        "profile": index,
+                        "seconds": round(seconds, 3),
+                        "predicted_seconds": round(predicted, 3) if predicted is not None else None,
+                    })
+        except Exception as e:
+            traceback.print_exc()
+            return {"error": f"Render failed: {str(e)}"}
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+        profile = PREVIEW_PROFILES[renders[-1]["profile"]]
+
+        def encode():
+            return _encode_image(np.ascontiguousarray(pixels), format, quality)
+
+        def finish(encoded):
+            data, used_format = encoded
             return {
                 "success": True,
-                "message": f"Created new material and applied texture {texture_id} to {object_name}",
-                "material": new_mat.name,
-                "maps": texture_maps,
-                "material_info": material_info
+                "width": pixels.shape[1],
+                "height": pixels.shape[0],
+                "format": used_format,
+                "engine": engine_id,
+                "target_seconds": target_seconds,
+                "seconds": round(sum(render["seconds"] for render in renders), 3),
+                "profile": dict(profile, level=renders[-1]["profile"]),
+                "renders": renders,
+                "binary": data,
             }
-            
+
+        return DeferredResult(encode, finish)
+    #endregion
+
+    #region Render queue
+    def render_scene(self, frame_start=None, frame_end=None, frame_step=1, resolution_x=None, resolution_y=None,
+                     resolution_percentage=None, samples=None, engine=None, camera=None):
+        """
+        Queue a render of the scene as it is now.
+
+        The scene is saved to a snapshot .blend file and rendered by a background
+        Blender process, so the addon keeps answering commands meanwhile. Jobs run
+        one at a time; frames are written as PNG to the job's folder in
+        RENDER_OUTPUT_DIR, each with a small preview. Unset parameters keep the
+        scene's settings.
+        """
+        scene = bpy.context.scene
+        frame_start = scene.frame_current if frame_start is None else int(frame_start)
+        frame_end = frame_start if frame_end is None else int(frame_end)
+        frame_step = max(1, int(frame_step or 1))
+        if frame_end < frame_start:
+            return {"error": "frame_end is before frame_start"}
+        if camera and bpy.data.objects.get(camera) is None:
+            return {"error": f"Camera not found: {camera}"}
+        if not camera and scene.camera is None:
+            return {"error": "The scene has no camera"}
+        try:
+            engine = self._render_engine_id(engine) if engine else None
+        except ValueError as e:
+            return {"error": str(e)}
+
+        job_id = f"render-{len(self.render_jobs) + 1}-{int(time.time())}"
+        output_dir = os.path.join(RENDER_OUTPUT_DIR, job_id)
+        os.makedirs(output_dir, exist_ok=True)
+        snapshot = os.path.join(output_dir, "snapshot.blend")
+        try:
+            bpy.ops.wm.save_as_mainfile(filepath=snapshot, copy=True, check_existing=False)
         except Exception as e:
-            print(f"Error in set_texture: {str(e)}")
-            traceback.print_exc()
-            return {"error": f"Failed to apply texture: {str(e)}"}
+            shutil.rmtree(output_dir, ignore_errors=True)
+            return {"error": f"Could not save the scene snapshot: {str(e)}"}
 
-    def get_polyhaven_status(self):
-        """Get the current status of PolyHaven integration"""
-        enabled = bpy.context.scene.blendermcp_use_polyhaven
-        if enabled:
-            return {"enabled": True, "message": "PolyHaven integration is enabled and ready to use."}
-        else:
-            return {
-                "enabled": False, 
-                "message": """PolyHaven integration is currently disabled. To enable it:
-                            1. In the 3D Viewport, find the BlenderMCP panel in the sidebar (press N if hidden)
-                            2. Check the 'Use assets from Poly Haven' checkbox
-                            3. Restart the connection to Claude"""
+        frames = list(range(frame_start, frame_end + 1, frame_step))
+        job = {
+            "id": job_id,
+            "status": "queued",
+            "frame_start": frame_start,
+            "frame_end": frame_end,
+            "frame_step": frame_step,
+            "frames_total": len(frames),
+            "frames_done": 0,
+            "current_frame": None,
+            "progress": None,
+            "frames": [],
+            "output_dir": output_dir,
+            "submitted": time.time(),
+            "started": None,
+            "finished": None,
+            "failure": None,
+        }
+        params = {
+            "frame_start": frame_start,
+            "frame_end": frame_end,
+            "frame_step": frame_step,
+            "resolution_x": resolution_x,
+            "resolution_y": resolution_y,
+            "resolution_percentage": resolution_percentage,
+            "samples": samples,
+            "engine": engine,
+            "camera": camera,
+            "output_dir": output_dir,
+            "preview_size": RENDER_PREVIEW_SIZE,
         }
+        self.render_jobs[job_id] = job
+        self._render_queue.put((job, snapshot, params, bpy.app.binary_path))
+        with self._render_lock:
+            if self._render_worker is None:
+                self._render_worker = threading.Thread(target=self._run_render_queue, daemon=True)
+                self._render_worker.start()
+
+        queued = sum(1 for other in self.render_jobs.values() if other["status"] in ("queued", "running"))
+        return {"job_id": job_id, "queue_position": queued, **job}
+
+    def _run_render_queue(self):
+        """Worker thread: run queued render jobs one after another. Never touches bpy."""
+        while True:
+            with self._render_lock:
+                try:
+                    job, snapshot, params, blender_binary = self._render_queue.get_nowait()
+                except queue.Empty:
+                    self._render_worker = None
+                    return
+            if job["status"] != "queued":
+                # Cancelled while waiting
+                with suppress(OSError):
+                    os.remove(snapshot)
+                continue
+            try:
+                self._run_render_job(job, snapshot, params, blender_binary)
+            except Exception as e:
+                traceback.print_exc()
+                job.update(status="failed", failure=str(e))
+            finally:
+                job["finished"] = time.time()
+                job["current_frame"] = None
+                self._render_processes.pop(job["id"], None)
+                with suppress(OSError):
+                    os.remove(snapshot)
+
+    def _run_render_job(self, job, snapshot, params, blender_binary):
+        import subprocess
+
+        job.update(status="running", started=time.time())
+        process = subprocess.Popen(
+            [blender_binary, "-b", snapshot, "--python-expr", RENDER_JOB_SCRIPT, "--", json.dumps(params)],
+            stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace"
+        )
+        self._render_processes[job["id"]] = process
+        if job["status"] == "cancelled":
+            process.terminate()
+        log_tail = []
+        done = False
+        for line in process.stdout:
+            if not line.startswith("BLENDERMCP_RENDER"):
+                log_tail = (log_tail + [line.rstrip()])[-20:]
+                continue
+            event = json.loads(line[len("BLENDERMCP_RENDER"):])
+            kind = event.pop("event")
+            if kind == "frame_start":
+                job.update(current_frame=event["frame"], progress=None)
+            elif kind == "stats":
+                job["progress"] = event["text"]
+            elif kind == "frame":
+                job["frames"].append(event)
+                job.update(frames_done=len(job["frames"]), progress=None)
+            elif kind == "done":
+                done = True
+        process.wait()
+
+        if job["status"] == "cancelled":
+            return
+        if process.returncode != 0 or not done:
+            job.update(status="failed", failure="\n".join(log_tail) or f"Blender exited with code {process.returncode}")
+        else:
+            job["status"] = "done"
+
+    def _render_job_summary(self, job):
+        summary = dict(job, frames=list(job["frames"]))
+        end = job["finished"] or time.time()
+        summary["elapsed"] = round(end - job["started"], 3) if job["started"] else 0.0
+        return summary
+
+    def _read_render_frame(self, job, frame=None, full_resolution=False):
+        """DeferredResult sending a finished frame (or its preview) of a job in the binary frame"""
+        finished = job["frames"]
+        if frame is not None:
+            finished = [entry for entry in finished if entry["frame"] == frame]
+        if not finished:
+            return None
+        entry = finished[-1]
+        path = entry["output"] if full_resolution else entry["preview"]
+
+        def read():
+            with open(path, "rb") as f:
+                return f.read()
+
+        return DeferredResult(read, lambda data: {
+            **self._render_job_summary(job),
+            "image_frame": entry["frame"],
+            "image_path": path,
+            "format": "png",
+            "binary": data,
+        })
+
+    def get_render_status(self, job_id=None, include_preview=False):
+        """Status of a render job, with the preview of its latest frame if asked; all jobs without job_id"""
+        if job_id is None:
+            return {"jobs": [self._render_job_summary(job) for job in self.render_jobs.values()]}
+        job = self.render_jobs.get(job_id)
+        if job is None:
+            return {"error": f"Unknown render job {job_id}"}
+        if include_preview:
+            deferred = self._read_render_frame(job)
+            if deferred is not None:
+                return deferred
+        return self._render_job_summary(job)
+
+    def get_render_result(self, job_id, frame=None, full_resolution=False):
+        """Output files of a render job, with one frame (the last by default) as image"""
+        job = self.render_jobs.get(job_id)
+        if job is None:
+            return {"error": f"Unknown render job {job_id}"}
+        deferred = self._read_render_frame(job, frame, full_resolution)
+        if deferred is None:
+            if frame is not None:
+                return {"error": f"Frame {frame} of {job_id} has not been rendered", **self._render_job_summary(job)}
+            return {"error": f"No frames of {job_id} have been rendered yet", **self._render_job_summary(job)}
+        return deferred
+
+    def cancel_render(self, job_id):
+        """Cancel a queued or running render job; frames already written are kept"""
+        job = self.render_jobs.get(job_id)
+        if job is None:
+            return {"error": f"Unknown render job {job_id}"}
+        if job["status"] not in ("queued", "running"):
+            return {"cancelled": False, **self._render_job_summary(job)}
+        job["status"] = "cancelled"
+        process = self._render_processes.get(job_id)
+        if process is not None:
+            process.terminate()
+        else:
+            job["finished"] = time.time()
+        return {"cancelled": True, **self._render_job_summary(job)}
+    #endregion
+
+    #region glTF import
+    def _import_gltf(self, filepath, finish, threaded=False, name=None):
+        """Import a glTF/GLB file through a staging collection and pass the new objects to finish(objects).
+
+        With threaded=True the file is parsed on a worker thread and only the mesh
+        construction runs in Blender's main thread; the handler then returns a
+        DeferredResult. Files using features the parser doesn't handle fall back to
+        the stock importer.
+        """
+        if not threaded:
+            with self._import_staging() as staging:
+                bpy.ops.import_scene.gltf(filepath=filepath)
+            return finish(self._unstage_import(staging, name))
+
+        def work():
+            try:
+                return _parse_gltf(filepath)
+            except GltfUnsupported as e:
+                print(f"Threaded glTF import not possible ({e}), falling back to the glTF importer")
+                return None
+
+        def build(parsed):
+            with self._import_staging() as staging:
+                if parsed is None:
+                    bpy.ops.import_scene.gltf(filepath=filepath)
+                else:
+                    self._build_gltf_objects(parsed)
+            return finish(self._unstage_import(staging, name))
+
+        return DeferredResult(work, build)
+
+    @staticmethod
+    def _build_gltf_image(image):
+        img = bpy.data.images.new(image["name"], 1, 1)
+        img.pack(data=image["data"], data_len=len(image["data"]))
+        img.source = 'FILE'
+        return img
+
+    def _build_gltf_material(self, material, parsed, images):
+        mat = bpy.data.materials.new(name=material.get("name") or "Material")
+        mat.use_nodes = True
+        nodes = mat.node_tree.nodes
+        links = mat.node_tree.links
+        principled = next(node for node in nodes if node.type == 'BSDF_PRINCIPLED')
+        pbr = material.get("pbrMetallicRoughness", {})
+
+        def texture_node(info, color_space, y):
+            texture = parsed["textures"][info["index"]]
+            if texture.get("source") is None:
+                return None
+            img = images.get(texture["source"])
+            if img is None:
+                img = images[texture["source"]] = self._build_gltf_image(parsed["images"][texture["source"]])
+                img.colorspace_settings.name = color_space
+            node = nodes.new(type='ShaderNodeTexImage')
+            node.image = img
+            node.location = (-600, y)
+            return node
+
+        principled.inputs['Base Color'].default_value = pbr.get("baseColorFactor", [1.0, 1.0, 1.0, 1.0])
+        principled.inputs['Metallic'].default_value = pbr.get("metallicFactor", 1.0)
+        principled.inputs['Roughness'].default_value = pbr.get("roughnessFactor", 1.0)
+
+        if "baseColorTexture" in pbr:
+            node = texture_node(pbr["baseColorTexture"], 'sRGB', 300)
+            if node:
+                links.new(node.outputs['Color'], principled.inputs['Base Color'])
+                if material.get("alphaMode", "OPAQUE") != "OPAQUE":
+                    links.new(node.outputs['Alpha'], principled.inputs['Alpha'])
+
+        if "metallicRoughnessTexture" in pbr:
+            node = texture_node(pbr["metallicRoughnessTexture"], 'Non-Color', 0)
+            if node:
+                try:
+                    separate = nodes.new(type='ShaderNodeSeparateColor')
+                except RuntimeError:
+                    separate = nodes.new(type='ShaderNodeSeparateRGB')
+                separate.location = (-300, 0)
+                links.new(node.outputs['Color'], separate.inputs[0])
+                # Roughness is stored in green, metalness in blue
+                links.new(separate.outputs[1], principled.inputs['Roughness'])
+                links.new(separate.outputs[2], principled.inputs['Metallic'])
+
+        if "normalTexture" in material:
+            node = texture_node(material["normalTexture"], 'Non-Color', -300)
+            if node:
+                normal_map = nodes.new(type='ShaderNodeNormalMap')
+                normal_map.location = (-300, -300)
+                links.new(node.outputs['Color'], normal_map.inputs['Color'])
+                links.new(normal_map.outputs['Normal'], principled.inputs['Normal'])
+
+        # Blender 4.0 renamed the emission color input
+        emission = principled.inputs.get('Emission Color') or principled.inputs.get('Emission')
+        if emission is not None and any(material.get("emissiveFactor", [0.0, 0.0, 0.0])):
+            emission.default_value = list(material["emissiveFactor"]) + [1.0]
+            strength = material.get("extensions", {}).get("KHR_materials_emissive_strength", {})
+            if 'Emission Strength' in principled.inputs:
+                principled.inputs['Emission Strength'].default_value = strength.get("emissiveStrength", 1.0)
+            if "emissiveTexture" in material:
+                node = texture_node(material["emissiveTexture"], 'sRGB', -600)
+                if node:
+                    links.new(node.outputs['Color'], emission)
+
+        if material.get("alphaMode", "OPAQUE") != "OPAQUE" and hasattr(mat, "blend_method"):
+            mat.blend_method = 'BLEND' if material["alphaMode"] == "BLEND" else 'CLIP'
+        mat.use_backface_culling = not material.get("doubleSided", False)
+        return mat
+
+    @staticmethod
+    def _build_gltf_mesh(data, materials):
+        """Create a mesh from parsed arrays with foreach_set instead of per-element Python loops"""
+        mesh = bpy.data.meshes.new(data["name"])
+        vertex_count = len(data["vertices"])
+        loop_count = len(data["indices"])
+        face_count = loop_count // 3
+
+        mesh.vertices.add(vertex_count)
+        mesh.vertices.foreach_set("co", data["vertices"].ravel())
+        mesh.loops.add(loop_count)
+        mesh.loops.foreach_set("vertex_index", data["indices"])
+        mesh.polygons.add(face_count)
+        mesh.polygons.foreach_set("loop_start", np.arange(0, loop_count, 3, dtype=np.int32))
+        try:
+            mesh.polygons.foreach_set("loop_total", np.full(face_count, 3, dtype=np.int32))
+        except (AttributeError, TypeError):
+            pass  # Read-only since Blender 4.0, derived from loop_start
+        mesh.polygons.foreach_set("material_index", data["material_indices"])
+        mesh.polygons.foreach_set("use_smooth", np.ones(face_count, dtype=bool))
+
+        for material in materials:
+            mesh.materials.append(material)
+
+        if data["uvs"] is not None:
+            uv_layer = mesh.uv_layers.new(name="UVMap")
+            uv_layer.data.foreach_set("uv", data["uvs"][data["indices"]].ravel())
+
+        mesh.update(calc_edges=True)
+        mesh.validate()
+
+        if data["normals"] is not None:
+            if hasattr(mesh, "use_auto_smooth"):
+                mesh.use_auto_smooth = True  # Needed for custom normals before Blender 4.1
+            mesh.normals_split_custom_set_from_vertices(data["normals"])
+        return mesh
+
+    def _build_gltf_objects(self, parsed):
+        """Create the objects of a parsed glTF file. Runs in Blender's main thread."""
+        images = {}
+        materials = {}
+        meshes = {}
+        created = []
+        collection = bpy.context.collection
+
+        def get_material(index):
+            if index is None:
+                return None
+            if index not in materials:
+                materials[index] = self._build_gltf_material(parsed["materials"][index], parsed, images)
+            return materials[index]
+
+        def get_mesh(index):
+            if index not in meshes:
+                data = parsed["meshes"][index]
+                meshes[index] = None if data is None else self._build_gltf_mesh(
+                    data, [get_material(m) for m in data["materials"]]
+                )
+            return meshes[index]
+
+        def build_node(index, parent):
+            node = parsed["nodes"][index]
+            mesh = get_mesh(node["mesh"]) if node["mesh"] is not None else None
+            obj = bpy.data.objects.new(node["name"], mesh)
+            if mesh is None:
+                obj.empty_display_size = 0.1
+            collection.objects.link(obj)
+            obj.parent = parent
+            obj.matrix_basis = mathutils.Matrix(node["matrix"].tolist())
+            created.append(obj)
+            for child in node["children"]:
+                build_node(child, obj)
+
+        for root in parsed["roots"]:
+            build_node(root, None)
+        return created
+    #endregion
 
     #region Hyper3D
     def get_hyper3d_status(self):
@@ -1133,28 +4669,79 @@ class BlenderMCPServer:
                             3. Restart the connection to Claude"""
             }
 
-    def create_rodin_job(self, *args, **kwargs):
-        match bpy.context.scene.blendermcp_hyper3d_mode:
+    def create_rodin_job(self, *args, auto_import=False, name=None, max_faces=None, generate_lods=False,
+                         save_to_library=False, use_cache=True, **kwargs):
+        mode = bpy.context.scene.blendermcp_hyper3d_mode
+        image_paths = kwargs.pop("image_paths", None)
+        if image_paths:
+            if mode != "MAIN_SITE":
+                return {"error": "Image files can only be uploaded in MAIN_SITE mode; FAL_AI takes image URLs"}
+            missing = [path for path in image_paths if not os.path.isfile(path)]
+            if missing:
+                return {"error": f"Image files not accessible from Blender: {', '.join(missing)}"}
+
+        # The same request was generated before: import the stored model instead of paying again
+        generation_key = self._rodin_generation_key(
+            mode, kwargs.get("text_prompt"), kwargs.get("images"), kwargs.get("bbox_condition"), image_paths
+        )
+        cached_glb = asset_cache.find("hyper3d", "generations", generation_key, "model.glb")
+        if use_cache and cached_glb:
+            result = self._import_gltf(
+                cached_glb,
+                lambda objects: self._finish_generated_asset_import(
+                    objects, max_faces, generate_lods, f"hyper3d:{generation_key}", save_to_library
+                ),
+                name=name or "Generated Model"
+            )
+            return {"cached": True, "generation_key": generation_key, **result}
+
+        match mode:
             case "MAIN_SITE":
-                return self.create_rodin_job_main_site(*args, **kwargs)
+                result = self.create_rodin_job_main_site(*args, image_paths=image_paths, **kwargs)
             case "FAL_AI":
-                return self.create_rodin_job_fal_ai(*args, **kwargs)
+                result = self.create_rodin_job_fal_ai(*args, **kwargs)
             case _:
                 return f"Error: Unknown Hyper3D Rodin mode!"
 
+        # Track the job in the background, so callers can wait for it instead of polling
+        if isinstance(result, dict) and "error" not in result:
+            job = self._track_rodin_job(mode, result, auto_import, name, {
+                "max_faces": max_faces,
+                "generate_lods": generate_lods,
+                "save_to_library": save_to_library,
+            }, generation_key)
+            if job:
+                result["job_id"] = job["id"]
+        return result
+
+    @staticmethod
+    def _rodin_response(response):
+        """JSON of a job creation response; failures also carry the HTTP status under http_status"""
+        try:
+            data = response.json()
+        except ValueError:
+            data = {"error": response.text or response.reason}
+        if not response.ok and isinstance(data, dict):
+            data.setdefault("http_status", response.status_code)
+        return data
+
     def create_rodin_job_main_site(
             self,
             text_prompt: str=None,
             images: list[tuple[str, str]]=None,
-            bbox_condition=None
+            bbox_condition=None,
+            api_key: str=None,
+            image_paths: list[str]=None
         ):
         try:
+            if image_paths:
+                return self._create_rodin_job_from_files(text_prompt, image_paths, bbox_condition, api_key)
             if images is None:
                 images = []
             """Call Rodin API, get the job uuid and subscription key"""
             files = [
                 *[("images", (f"{i:04d}{img_suffix}", img)) for i, (img_suffix, img) in enumerate(images)],
-                ("tier", (None, "Sketch")),
+                ("tier", (None, RODIN_TIER)),
                 ("mesh_mode", (None, "Raw")),
             ]
             if text_prompt:
@@ -1164,24 +4751,49 @@ class BlenderMCPServer:
             response = requests.post(
                 "https://hyperhuman.deemos.com/api/v2/rodin",
                 headers={
-                    "Authorization": f"Bearer {bpy.context.scene.blendermcp_hyper3d_api_key}",
+                    "Authorization": f"Bearer {api_key or bpy.context.scene.blendermcp_hyper3d_api_key}",
                 },
                 files=files
             )
-            data = response.json()
-            return data
+            return self._rodin_response(response)
         except Exception as e:
             return {"error": str(e)}
     
+    def _create_rodin_job_from_files(self, text_prompt, image_paths, bbox_condition, api_key=None):
+        """Create a MAIN_SITE job, streaming the image files into the upload instead of loading them"""
+        missing = [path for path in image_paths if not os.path.isfile(path)]
+        if missing:
+            return {"error": f"Image files not accessible from Blender: {', '.join(missing)}"}
+
+        fields = [
+            ("images", (f"{i:04d}{os.path.splitext(path)[1]}", path)) for i, path in enumerate(image_paths)
+        ]
+        fields += [("tier", RODIN_TIER), ("mesh_mode", "Raw")]
+        if text_prompt:
+            fields.append(("prompt", text_prompt))
+        if bbox_condition:
+            fields.append(("bbox_condition", json.dumps(bbox_condition)))
+        body = MultipartFileStream(fields)
+        response = requests.post(
+            "https://hyperhuman.deemos.com/api/v2/rodin",
+            headers={
+                "Authorization": f"Bearer {api_key or bpy.context.scene.blendermcp_hyper3d_api_key}",
+                "Content-Type": body.content_type,
+            },
+            data=body
+        )
+        return self._rodin_response(response)
+
     def create_rodin_job_fal_ai(
             self,
             text_prompt: str=None,
             images: list[tuple[str, str]]=None,
-            bbox_condition=None
+            bbox_condition=None,
+            api_key: str=None
         ):
         try:
             req_data = {
-                "tier": "Sketch",
+                "tier": RODIN_TIER,
             }
             if images:
                 req_data["input_image_urls"] = images
@@ -1192,176 +4804,488 @@ class BlenderMCPServer:
             response = requests.post(
                 "https://queue.fal.run/fal-ai/hyper3d/rodin",
                 headers={
-                    "Authorization": f"Key {bpy.context.scene.blendermcp_hyper3d_api_key}",
+                    "Authorization": f"Key {api_key or bpy.context.scene.blendermcp_hyper3d_api_key}",
                     "Content-Type": "application/json",
                 },
                 json=req_data
             )
-            data = response.json()
-            return data
+            return self._rodin_response(response)
         except Exception as e:
             return {"error": str(e)}
 
-    def poll_rodin_job_status(self, *args, **kwargs):
-        match bpy.context.scene.blendermcp_hyper3d_mode:
-            case "MAIN_SITE":
-                return self.poll_rodin_job_status_main_site(*args, **kwargs)
-            case "FAL_AI":
-                return self.poll_rodin_job_status_fal_ai(*args, **kwargs)
-            case _:
-                return f"Error: Unknown Hyper3D Rodin mode!"
-
-    def poll_rodin_job_status_main_site(self, subscription_key: str):
-        """Call the job status API to get the job status"""
-        response = requests.post(
-            "https://hyperhuman.deemos.com/api/v2/status",
-            headers={
-                "Authorization": f"Bearer {bpy.context.scene.blendermcp_hyper3d_api_key}",
-            },
-            json={
-                "subscription_key": subscription_key,
-            },
+    def _track_rodin_job(self, mode, created, auto_import, name, import_options, generation_key=None):
+        """Start polling a newly created job on a worker thread"""
+        job = self._start_rodin_job(
+            mode, created, bpy.context.scene.blendermcp_hyper3d_api_key, auto_import, name, import_options,
+            generation_key
         )
-        data = response.json()
-        return {
-            "status_list": [i["status"] for i in data["jobs"]]
+        if job and auto_import:
+            self._ensure_rodin_import_timer()
+        return job
+
+    def _ensure_rodin_import_timer(self):
+        # Importing has to happen in Blender's main thread
+        if not self._rodin_import_timer_running:
+            self._rodin_import_timer_running = True
+            bpy.app.timers.register(self._process_rodin_imports, first_interval=1.0)
+
+    @staticmethod
+    def _rodin_generation_key(mode, text_prompt=None, images=None, bbox_condition=None, image_paths=None):
+        """Content hash of a generation request: prompt, normalized bbox, image bytes, tier and mode"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps([mode, RODIN_TIER, text_prompt or "", bbox_condition]).encode("utf-8"))
+        for image_path in image_paths or []:
+            with open(image_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            digest.update(b"\0")
+        for image in images or []:
+            if isinstance(image, (list, tuple)):
+                # (suffix, base64 data) as sent for MAIN_SITE
+                digest.update(base64.b64decode(image[1]))
+            else:
+                # FAL_AI takes image URLs
+                digest.update(str(image).encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _start_cached_rodin_job(self, generation_key, glb_path, auto_import, name, import_options):
+        """Register a job whose model is already in the generation cache. Never touches bpy."""
+        job = {
+            "id": f"cached-{generation_key[:16]}-{len(self.rodin_jobs)}",
+            "mode": "CACHE",
+            "status": "downloaded",
+            "cached": True,
+            "generation_key": generation_key,
+            "glb_path": glb_path,
+            "auto_import": auto_import,
+            "name": name or "Generated Model",
+            "import_options": import_options,
+            "submitted": time.time(),
+            "polls": 0,
         }
-    
-    def poll_rodin_job_status_fal_ai(self, request_id: str):
-        """Call the job status API to get the job status"""
+        self.rodin_jobs[job["id"]] = job
+        self._rodin_job_events[job["id"]] = threading.Event()
+        if auto_import:
+            self._rodin_import_queue.put(job["id"])
+        else:
+            job["finished"] = time.time()
+            self._rodin_job_events[job["id"]].set()
+        return job
+
+    def _find_rodin_glb(self, job_id):
+        """GLB of a tracked job that was already downloaded, if any"""
+        job = self.rodin_jobs.get(job_id)
+        if job and job.get("glb_path") and os.path.exists(job["glb_path"]):
+            return job["glb_path"]
+        return asset_cache.find("hyper3d", job_id, "model.glb")
+
+    def _start_rodin_job(self, mode, created, api_key, auto_import, name, import_options, generation_key=None):
+        """Register a created job and poll it on a worker thread. Never touches bpy."""
+        if mode == "MAIN_SITE":
+            if not created.get("submit_time"):
+                return None
+            job = {
+                "id": created["uuid"],
+                "task_uuid": created["uuid"],
+                "subscription_key": created["jobs"]["subscription_key"],
+            }
+        else:
+            if "request_id" not in created:
+                return None
+            job = {"id": created["request_id"], "request_id": created["request_id"]}
+
+        job.update({
+            "mode": mode,
+            "status": "generating",
+            "auto_import": auto_import,
+            "name": name or "Generated Model",
+            "import_options": import_options,
+            "generation_key": generation_key,
+            "submitted": time.time(),
+            "polls": 0,
+        })
+        self.rodin_jobs[job["id"]] = job
+        self._rodin_job_events[job["id"]] = threading.Event()
+
+        worker = threading.Thread(target=self._run_rodin_job, args=(job, api_key))
+        worker.daemon = True
+        worker.start()
+        return job
+
+    @staticmethod
+    def _get_rodin_job_state(job, api_key):
+        """Return 'generating', 'done' or 'failed'. Runs on worker threads, so never touches bpy."""
+        if job["mode"] == "MAIN_SITE":
+            response = requests.post(
+                "https://hyperhuman.deemos.com/api/v2/status",
+                headers={"Authorization": f"Bearer {api_key}"},
+                json={"subscription_key": job["subscription_key"]},
+                timeout=30,
+            )
+            statuses = [i["status"] for i in response.json()["jobs"]]
+            job["status_detail"] = statuses
+            if any(status in ("Failed", "Canceled") for status in statuses):
+                return "failed"
+            if statuses and all(status == "Done" for status in statuses):
+                return "done"
+            return "generating"
+
         response = requests.get(
-            f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}/status",
-            headers={
-                "Authorization": f"KEY {bpy.context.scene.blendermcp_hyper3d_api_key}",
-            },
+            f"https://queue.fal.run/fal-ai/hyper3d/requests/{job['request_id']}/status",
+            headers={"Authorization": f"KEY {api_key}"},
+            timeout=30,
         )
-        data = response.json()
-        return data
+        status = response.json().get("status")
+        job["status_detail"] = status
+        if status == "COMPLETED":
+            return "done"
+        if status in ("IN_QUEUE", "IN_PROGRESS"):
+            return "generating"
+        return "failed"
 
     @staticmethod
-    def _clean_imported_glb(filepath, mesh_name=None):
-        # Get the set of existing objects before import
-        existing_objects = set(bpy.data.objects)
+    def _get_rodin_model_url(job, api_key):
+        if job["mode"] == "MAIN_SITE":
+            response = requests.post(
+                "https://hyperhuman.deemos.com/api/v2/download",
+                headers={"Authorization": f"Bearer {api_key}"},
+                json={"task_uuid": job["task_uuid"]},
+                timeout=30,
+            )
+            for i in response.json()["list"]:
+                if i["name"].endswith(".glb"):
+                    return i["url"]
+            raise RuntimeError("The finished task has no GLB file")
 
-        # Import the GLB file
-        bpy.ops.import_scene.gltf(filepath=filepath)
-        
-        # Ensure the context is updated
-        bpy.context.view_layer.update()
-        
-        # Get all imported objects
-        imported_objects = list(set(bpy.data.objects) - existing_objects)
-        # imported_objects = [obj for obj in bpy.context.view_layer.objects if obj.select_get()]
-        
-        if not imported_objects:
-            print("Error: No objects were imported.")
-            return
-        
-        # Identify the mesh object
-        mesh_obj = None
-        
-        if len(imported_objects) == 1 and imported_objects[0].type == 'MESH':
-            mesh_obj = imported_objects[0]
-            print("Single mesh imported, no cleanup needed.")
-        else:
-            if len(imported_objects) == 2:
-                empty_objs = [i for i in imported_objects if i.type == "EMPTY"]
-                if len(empty_objs) != 1:
-                    print("Error: Expected an empty node with one mesh child or a single mesh object.")
-                    return
-                parent_obj = empty_objs.pop()
-                if len(parent_obj.children) == 1:
-                    potential_mesh = parent_obj.children[0]
-                    if potential_mesh.type == 'MESH':
-                        print("GLB structure confirmed: Empty node with one mesh child.")
-                        
-                        # Unparent the mesh from the empty node
-                        potential_mesh.parent = None
-                        
-                        # Remove the empty node
-                        bpy.data.objects.remove(parent_obj)
-                        print("Removed empty node, keeping only the mesh.")
-                        
-                        mesh_obj = potential_mesh
-                    else:
-                        print("Error: Child is not a mesh object.")
-                        return
-                else:
-                    print("Error: Expected an empty node with one mesh child or a single mesh object.")
-                    return
-            else:
-                print("Error: Expected an empty node with one mesh child or a single mesh object.")
-                return
-        
-        # Rename the mesh if needed
+        response = requests.get(
+            f"https://queue.fal.run/fal-ai/hyper3d/requests/{job['request_id']}",
+            headers={"Authorization": f"Key {api_key}"},
+            timeout=30,
+        )
+        return response.json()["model_mesh"]["url"]
+
+    def _run_rodin_job(self, job, api_key):
+        """Worker thread: poll with exponential backoff, then download the GLB into the asset cache"""
+        delay = RODIN_POLL_INITIAL
         try:
-            if mesh_obj and mesh_obj.name is not None and mesh_name:
-                mesh_obj.name = mesh_name
-                if mesh_obj.data.name is not None:
-                    mesh_obj.data.name = mesh_name
-                print(f"Mesh renamed to: {mesh_name}")
+            while True:
+                if time.time() - job["submitted"] > RODIN_JOB_TIMEOUT:
+                    raise TimeoutError(f"Generation did not finish within {RODIN_JOB_TIMEOUT} seconds")
+                time.sleep(delay)
+                try:
+                    state = self._get_rodin_job_state(job, api_key)
+                except (requests.RequestException, ValueError, KeyError) as e:
+                    # Network hiccups and odd responses are retried with the next poll
+                    print(f"Polling Rodin job {job['id']} failed: {str(e)}")
+                    state = "generating"
+                job["polls"] += 1
+                if state == "failed":
+                    raise RuntimeError(f"Generation failed: {job.get('status_detail')}")
+                if state == "done":
+                    break
+                delay = min(delay * 1.5, RODIN_POLL_MAX)
+
+            job["status"] = "downloading"
+            url = self._get_rodin_model_url(job, api_key)
+            # Stored by request content, so identical requests later skip the generation
+            if job.get("generation_key"):
+                parts = ("hyper3d", "generations", job["generation_key"], "model.glb")
+            else:
+                parts = ("hyper3d", job["id"], "model.glb")
+            job["glb_path"] = asset_cache.fetch(url, *parts, timeout=120)
+            job["status"] = "downloaded"
         except Exception as e:
-            print("Having issue with renaming, give up renaming.")
+            job["status"] = "failed"
+            job["error"] = str(e)
+
+        if job["status"] == "downloaded" and job["auto_import"]:
+            self._rodin_import_queue.put(job["id"])
+        else:
+            job["finished"] = time.time()
+            self._rodin_job_events[job["id"]].set()
 
-        return mesh_obj
+    def _process_rodin_imports(self):
+        """Timer callback that imports downloaded jobs created with auto_import"""
+        while True:
+            try:
+                job_id = self._rodin_import_queue.get_nowait()
+            except queue.Empty:
+                break
 
-    def import_generated_asset(self, *args, **kwargs):
+            job = self.rodin_jobs[job_id]
+            options = job["import_options"]
+            try:
+                result = self._import_gltf(
+                    job["glb_path"],
+                    lambda objects: self._finish_generated_asset_import(
+                        objects, options["max_faces"], options["generate_lods"],
+                        f"hyper3d:{job_id}", options["save_to_library"]
+                    ),
+                    name=job["name"]
+                )
+                job["import_result"] = result
+                if result.get("succeed"):
+                    job["status"] = "imported"
+                else:
+                    job["status"] = "failed"
+                    job["error"] = result.get("error")
+            except Exception as e:
+                traceback.print_exc()
+                job["status"] = "failed"
+                job["error"] = str(e)
+            job["finished"] = time.time()
+            self._rodin_job_events[job_id].set()
+
+        # Worker threads add jobs while this runs, so look at snapshots
+        pending = any(
+            job["auto_import"] and job["status"] in ("generating", "downloading", "downloaded")
+            for job in list(self.rodin_jobs.values())
+        ) or any(
+            # Batches keep submitting jobs that will need importing
+            batch["auto_import"] and batch["status"] == "running"
+            for batch in list(self.rodin_batches.values())
+        )
+        if not pending:
+            self._rodin_import_timer_running = False
+            return None
+        return 1.0
+
+    def wait_for_generation(self, job_id, timeout=120):
+        """Wait until a tracked Rodin job is downloaded (or imported, with auto_import) or failed"""
+        job = self.rodin_jobs.get(job_id)
+        if job is None:
+            return {"error": f"Unknown Rodin job {job_id}. Only jobs created since the addon started are tracked."}
+
+        event = self._rodin_job_events[job_id]
+        timeout = max(0.0, min(float(timeout), RODIN_WAIT_MAX))
+        # The wait happens on a worker thread, so Blender stays responsive meanwhile
+        return DeferredResult(
+            lambda: event.wait(timeout),
+            lambda finished: {
+                "finished": finished,
+                "elapsed": time.time() - job["submitted"],
+                **{key: value for key, value in job.items() if key != "import_options"},
+            }
+        )
+
+    @staticmethod
+    def _rodin_error_kind(result):
+        """Why a job creation failed: quota when it was refused for lack of credits, rate_limit
+        when it may be retried later, else None"""
+        if not isinstance(result, dict):
+            return None
+        status = result.get("http_status")
+        # Only the error fields, as prompts echoed back in the payload may contain any words
+        message = " ".join(str(result.get(key) or "") for key in ("error", "detail", "message")).lower()
+        if status == 429 or "rate limit" in message or "too many requests" in message:
+            return "rate_limit"
+        if status == 402 or any(code in message for code in RODIN_QUOTA_ERRORS):
+            return "quota"
+        return None
+
+    def create_rodin_batch(self, items, concurrency=3, rate_limit=10, auto_import=True, max_faces=None,
+                           generate_lods=False, save_to_library=False, use_cache=True):
+        """Submit many text-to-3D jobs from a worker thread, at most concurrency at a time and
+        rate_limit per minute, importing each model as soon as it is done"""
+        if not items:
+            return {"error": "No items given"}
+        mode = bpy.context.scene.blendermcp_hyper3d_mode
+        if mode not in ("MAIN_SITE", "FAL_AI"):
+            return {"error": "Unknown Hyper3D Rodin mode!"}
+
+        batch_id = f"batch-{len(self.rodin_batches) + 1}-{int(time.time())}"
+        batch = {
+            "id": batch_id,
+            "status": "running",
+            "mode": mode,
+            "concurrency": max(1, int(concurrency)),
+            "rate_limit": max(0.0, float(rate_limit or 0)),
+            "auto_import": auto_import,
+            "use_cache": use_cache,
+            "import_options": {
+                "max_faces": max_faces,
+                "generate_lods": generate_lods,
+                "save_to_library": save_to_library,
+            },
+            "quota_exceeded": False,
+            "created": time.time(),
+            "items": [
+                {
+                    "index": index,
+                    "text_prompt": item["text_prompt"],
+                    "bbox_condition": item.get("bbox_condition"),
+                    "name": item.get("name") or f"Generated_{index + 1}",
+                    "status": "queued",
+                }
+                for index, item in enumerate(items)
+            ],
+        }
+        self.rodin_batches[batch_id] = batch
+        self._rodin_batch_events[batch_id] = threading.Event()
+
+        worker = threading.Thread(
+            target=self._run_rodin_batch,
+            args=(batch, bpy.context.scene.blendermcp_hyper3d_api_key),
+        )
+        worker.daemon = True
+        worker.start()
+        if auto_import:
+            self._ensure_rodin_import_timer()
+        return self._rodin_batch_manifest(batch)
+
+    def _run_rodin_batch(self, batch, api_key):
+        """Worker thread: submit queued items within the concurrency and rate limits until all are done"""
+        terminal = ("imported", "failed") if batch["auto_import"] else ("downloaded", "imported", "failed")
+        interval = 60.0 / batch["rate_limit"] if batch["rate_limit"] else 0.0
+        last_submit = 0.0
+        create = self.create_rodin_job_main_site if batch["mode"] == "MAIN_SITE" else self.create_rodin_job_fal_ai
+
+        # Items generated before are taken from the generation cache without a submission
+        for item in batch["items"]:
+            item["generation_key"] = self._rodin_generation_key(
+                batch["mode"], item["text_prompt"], None, item["bbox_condition"]
+            )
+            cached_glb = asset_cache.find("hyper3d", "generations", item["generation_key"], "model.glb")
+            if batch["use_cache"] and cached_glb:
+                job = self._start_cached_rodin_job(
+                    item["generation_key"], cached_glb, batch["auto_import"], item["name"], batch["import_options"]
+                )
+                item["status"] = "submitted"
+                item["job_id"] = job["id"]
+
+        while True:
+            waiting = [item for item in batch["items"] if item["status"] == "queued"]
+            # Items refused by the rate limit wait for their backoff to pass
+            queued = [item for item in waiting if item.get("retry_at", 0.0) <= time.time()]
+            active = [
+                item for item in batch["items"]
+                if item["status"] == "submitted" and self.rodin_jobs[item["job_id"]]["status"] not in terminal
+            ]
+            if batch["quota_exceeded"]:
+                for item in waiting:
+                    item["status"] = "skipped"
+                    item["error"] = "Not submitted: the Hyper3D quota was exhausted"
+                waiting = queued = []
+            if not waiting and not active:
+                break
+
+            if queued and len(active) < batch["concurrency"] and time.time() - last_submit >= interval:
+                item = queued[0]
+                last_submit = time.time()
+                created = create(text_prompt=item["text_prompt"], bbox_condition=item["bbox_condition"], api_key=api_key)
+                job = None
+                if isinstance(created, dict) and "error" not in created:
+                    job = self._start_rodin_job(
+                        batch["mode"], created, api_key, batch["auto_import"], item["name"], batch["import_options"],
+                        item["generation_key"]
+                    )
+                error_kind = None if job else self._rodin_error_kind(created)
+                if job:
+                    item["status"] = "submitted"
+                    item["job_id"] = job["id"]
+                elif error_kind == "quota":
+                    item["status"] = "skipped"
+                    item["error"] = f"Quota exhausted: {created}"
+                    batch["quota_exceeded"] = True
+                elif error_kind == "rate_limit" and item.get("rate_limited", 0) < RODIN_RATE_LIMIT_RETRIES:
+                    # Stays queued, and the whole batch slows down with it
+                    item["rate_limited"] = item.get("rate_limited", 0) + 1
+                    delay = min(RODIN_RATE_LIMIT_BACKOFF * 2 ** (item["rate_limited"] - 1), RODIN_POLL_MAX)
+                    item["retry_at"] = time.time() + delay
+                    last_submit = time.time() + delay - interval
+                else:
+                    item["status"] = "failed"
+                    item["error"] = f"Submission failed: {created}"
+                continue
+            time.sleep(0.5)
+
+        batch["status"] = "finished"
+        batch["finished"] = time.time()
+        self._rodin_batch_events[batch["id"]].set()
+
+    def _rodin_batch_manifest(self, batch):
+        """One entry per item, with the state of its job and the imported object"""
+        entries = []
+        for item in batch["items"]:
+            # The batch worker updates items while this runs, so work from a snapshot
+            entry = {key: value for key, value in dict(item).items() if key != "retry_at"}
+            job = self.rodin_jobs.get(entry.get("job_id"))
+            if job is not None:
+                entry["status"] = job["status"]
+                entry["cached"] = job.get("cached", False)
+                entry["glb_path"] = job.get("glb_path")
+                if job.get("error"):
+                    entry["error"] = job["error"]
+                import_result = job.get("import_result")
+                if import_result and import_result.get("succeed"):
+                    entry["object"] = import_result["name"]
+                    entry["world_bounding_box"] = import_result.get("world_bounding_box")
+            entries.append(entry)
+
+        counts = {}
+        for entry in entries:
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return {
+            "batch_id": batch["id"],
+            "status": batch["status"],
+            "quota_exceeded": batch["quota_exceeded"],
+            "elapsed": (batch.get("finished") or time.time()) - batch["created"],
+            "counts": counts,
+            "items": entries,
+        }
+
+    def wait_for_rodin_batch(self, batch_id, timeout=120):
+        """Wait until every job of a batch is finished (or the timeout passes) and return its manifest"""
+        batch = self.rodin_batches.get(batch_id)
+        if batch is None:
+            return {"error": f"Unknown batch {batch_id}"}
+        event = self._rodin_batch_events[batch_id]
+        timeout = max(0.0, min(float(timeout), RODIN_WAIT_MAX))
+        return DeferredResult(lambda: event.wait(timeout), lambda finished: self._rodin_batch_manifest(batch))
+
+    def poll_rodin_job_status(self, *args, **kwargs):
         match bpy.context.scene.blendermcp_hyper3d_mode:
             case "MAIN_SITE":
-                return self.import_generated_asset_main_site(*args, **kwargs)
+                return self.poll_rodin_job_status_main_site(*args, **kwargs)
             case "FAL_AI":
-                return self.import_generated_asset_fal_ai(*args, **kwargs)
+                return self.poll_rodin_job_status_fal_ai(*args, **kwargs)
             case _:
                 return f"Error: Unknown Hyper3D Rodin mode!"
 
-    def import_generated_asset_main_site(self, task_uuid: str, name: str):
-        """Fetch the generated asset, import into blender"""
+    def poll_rodin_job_status_main_site(self, subscription_key: str):
+        """Call the job status API to get the job status"""
         response = requests.post(
-            "https://hyperhuman.deemos.com/api/v2/download",
+            "https://hyperhuman.deemos.com/api/v2/status",
             headers={
                 "Authorization": f"Bearer {bpy.context.scene.blendermcp_hyper3d_api_key}",
             },
             json={
-                'task_uuid': task_uuid
-            }
+                "subscription_key": subscription_key,
+            },
         )
-        data_ = response.json()
-        temp_file = None
-        for i in data_["list"]:
-            if i["name"].endswith(".glb"):
-                temp_file = tempfile.NamedTemporaryFile(
-                    delete=False,
-                    prefix=task_uuid,
-                    suffix=".glb",
-                )
+        data = response.json()
+        return {
+            "status_list": [i["status"] for i in data["jobs"]]
+        }
     
-                try:
-                    # Download the content
-                    response = requests.get(i["url"], stream=True)
-                    response.raise_for_status()  # Raise an exception for HTTP errors
-                    
-                    # Write the content to the temporary file
-                    for chunk in response.iter_content(chunk_size=8192):
-                        temp_file.write(chunk)
-                        
-                    # Close the file
-                    temp_file.close()
-                    
-                except Exception as e:
-                    # Clean up the file if there's an error
-                    temp_file.close()
-                    os.unlink(temp_file.name)
-                    return {"succeed": False, "error": str(e)}
-                
-                break
-        else:
-            return {"succeed": False, "error": "Generation failed. Please first make sure that all jobs of the task are done and then try again later."}
+    def poll_rodin_job_status_fal_ai(self, request_id: str):
+        """Call the job status API to get the job status"""
+        response = requests.get(
+            f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}/status",
+            headers={
+                "Authorization": f"KEY {bpy.context.scene.blendermcp_hyper3d_api_key}",
+            },
+        )
+        data = response.json()
+        return data
 
+    def _finish_generated_asset_import(self, imported_objects, max_faces, generate_lods, source_id, save_to_library):
         try:
-            obj = self._clean_imported_glb(
-                filepath=temp_file.name,
-                mesh_name=name
-            )
+            # Rodin delivers a single mesh, possibly under an empty that was collapsed while unstaging
+            if len(imported_objects) != 1 or imported_objects[0].type != 'MESH':
+                return {"succeed": False, "error": "Expected an empty node with one mesh child or a single mesh object."}
+            obj = imported_objects[0]
             result = {
                 "name": obj.name,
                 "type": obj.type,
@@ -1373,70 +5297,129 @@ class BlenderMCPServer:
             if obj.type == "MESH":
                 bounding_box = self._get_aabb(obj)
                 result["world_bounding_box"] = bounding_box
+            # The library keeps the full detail model; the budget only applies to this scene
+            if save_to_library:
+                self._save_import_to_library(result, source_id, [obj])
+            result["polygons"] = self._apply_polygon_budget([obj], max_faces, generate_lods)
             
             return {
                 "succeed": True, **result
             }
         except Exception as e:
             return {"succeed": False, "error": str(e)}
-    
-    def import_generated_asset_fal_ai(self, request_id: str, name: str):
+
+    def import_generated_asset(self, *args, **kwargs):
+        match bpy.context.scene.blendermcp_hyper3d_mode:
+            case "MAIN_SITE":
+                return self.import_generated_asset_main_site(*args, **kwargs)
+            case "FAL_AI":
+                return self.import_generated_asset_fal_ai(*args, **kwargs)
+            case _:
+                return f"Error: Unknown Hyper3D Rodin mode!"
+
+    def import_generated_asset_main_site(self, task_uuid: str, name: str, max_faces: int=None, generate_lods: bool=False, threaded_import: bool=False, save_to_library: bool=False):
         """Fetch the generated asset, import into blender"""
-        response = requests.get(
-            f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}",
-            headers={
-                "Authorization": f"Key {bpy.context.scene.blendermcp_hyper3d_api_key}",
-            }
+        # Jobs tracked since creation have already been downloaded by their worker thread
+        glb_path = self._find_rodin_glb(task_uuid)
+        if glb_path is None:
+            response = requests.post(
+                "https://hyperhuman.deemos.com/api/v2/download",
+                headers={
+                    "Authorization": f"Bearer {bpy.context.scene.blendermcp_hyper3d_api_key}",
+                },
+                json={
+                    'task_uuid': task_uuid
+                }
+            )
+            data_ = response.json()
+            temp_file = None
+            for i in data_["list"]:
+                if i["name"].endswith(".glb"):
+                    temp_file = tempfile.NamedTemporaryFile(
+                        delete=False,
+                        prefix=task_uuid,
+                        suffix=".glb",
+                    )
+    
+                    try:
+                        # Download the content
+                        response = requests.get(i["url"], stream=True)
+                        response.raise_for_status()  # Raise an exception for HTTP errors
+                    
+                        # Write the content to the temporary file
+                        for chunk in response.iter_content(chunk_size=8192):
+                            temp_file.write(chunk)
+                        
+                        # Close the file
+                        temp_file.close()
+                    
+                    except Exception as e:
+                        # Clean up the file if there's an error
+                        temp_file.close()
+                        os.unlink(temp_file.name)
+                        return {"succeed": False, "error": str(e)}
+                
+                    break
+            else:
+                return {"succeed": False, "error": "Generation failed. Please first make sure that all jobs of the task are done and then try again later."}
+            glb_path = temp_file.name
+
+        return self._import_gltf(
+            glb_path,
+            lambda objects: self._finish_generated_asset_import(
+                objects, max_faces, generate_lods, f"hyper3d:{task_uuid}", save_to_library
+            ),
+            threaded_import,
+            name=name
         )
-        data_ = response.json()
-        temp_file = None
+    
+    def import_generated_asset_fal_ai(self, request_id: str, name: str, max_faces: int=None, generate_lods: bool=False, threaded_import: bool=False, save_to_library: bool=False):
+        """Fetch the generated asset, import into blender"""
+        # Jobs tracked since creation have already been downloaded by their worker thread
+        glb_path = self._find_rodin_glb(request_id)
+        if glb_path is None:
+            response = requests.get(
+                f"https://queue.fal.run/fal-ai/hyper3d/requests/{request_id}",
+                headers={
+                    "Authorization": f"Key {bpy.context.scene.blendermcp_hyper3d_api_key}",
+                }
+            )
+            data_ = response.json()
+            temp_file = None
         
-        temp_file = tempfile.NamedTemporaryFile(
-            delete=False,
-            prefix=request_id,
-            suffix=".glb",
-        )
+            temp_file = tempfile.NamedTemporaryFile(
+                delete=False,
+                prefix=request_id,
+                suffix=".glb",
+            )
 
-        try:
-            # Download the content
-            response = requests.get(data_["model_mesh"]["url"], stream=True)
-            response.raise_for_status()  # Raise an exception for HTTP errors
+            try:
+                # Download the content
+                response = requests.get(data_["model_mesh"]["url"], stream=True)
+                response.raise_for_status()  # Raise an exception for HTTP errors
             
-            # Write the content to the temporary file
-            for chunk in response.iter_content(chunk_size=8192):
-                temp_file.write(chunk)
+                # Write the content to the temporary file
+                for chunk in response.iter_content(chunk_size=8192):
+                    temp_file.write(chunk)
                 
-            # Close the file
-            temp_file.close()
+                # Close the file
+                temp_file.close()
             
-        except Exception as e:
-            # Clean up the file if there's an error
-            temp_file.close()
-            os.unlink(temp_file.name)
-            return {"succeed": False, "error": str(e)}
-
-        try:
-            obj = self._clean_imported_glb(
-                filepath=temp_file.name,
-                mesh_name=name
-            )
-            result = {
-                "name": obj.name,
-                "type": obj.type,
-                "location": [obj.location.x, obj.location.y, obj.location.z],
-                "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-                "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
-            }
+            except Exception as e:
+                # Clean up the file if there's an error
+                temp_file.close()
+                os.unlink(temp_file.name)
+                return {"succeed": False, "error": str(e)}
+            glb_path = temp_file.name
 
-            if obj.type == "MESH":
-                bounding_box = self._get_aabb(obj)
-                result["world_bounding_box"] = bounding_box
-            
-            return {
-                "succeed": True, **result
-            }
-        except Exception as e:
-            return {"succeed": False, "error": str(e)}
+        return self._import_gltf(
+            glb_path,
+            lambda objects: self._finish_generated_asset_import(
+                objects, max_faces, generate_lods, f"hyper3d:{request_id}", save_to_library
+            ),
+            threaded_import,
+            name=name
+        )
     #endregion
 
     #region Sketchfab API
@@ -1502,58 +5485,139 @@ class BlenderMCPServer:
                             4. Restart the connection to Claude"""
             }
     
-    def search_sketchfab_models(self, query, categories=None, count=20, downloadable=True):
+    @staticmethod
+    def _sketchfab_search_key(query, categories, count, downloadable, cursor):
+        """Normalize search parameters so equivalent queries share a cache entry"""
+        normalized_query = " ".join(str(query or "").lower().split())
+        normalized_categories = ",".join(sorted(
+            c.strip().lower() for c in str(categories or "").split(",") if c.strip()
+        ))
+        return (normalized_query, normalized_categories, int(count), bool(downloadable), cursor or "")
+
+    @staticmethod
+    def _fetch_sketchfab_search(api_key, query, categories, count, downloadable, cursor):
+        """Call the Sketchfab search endpoint; safe to run outside Blender's main thread"""
+        # Build search parameters with exact fields from Sketchfab API docs
+        params = {
+            "type": "models",
+            "q": query,
+            "count": count,
+            "downloadable": downloadable,
+            "archives_flavours": False
+        }
+        
+        if categories:
+            params["categories"] = categories
+        if cursor:
+            params["cursor"] = cursor
+            
+        # Make API request to Sketchfab search endpoint
+        # The proper format according to Sketchfab API docs for API key auth
+        headers = {
+            "Authorization": f"Token {api_key}"
+        }
+        
+        # Use the search endpoint as specified in the API documentation
+        response = requests.get(
+            "https://api.sketchfab.com/v3/search",
+            headers=headers,
+            params=params,
+            timeout=30  # Add timeout of 30 seconds
+        )
+        
+        if response.status_code == 401:
+            return {"error": "Authentication failed (401). Check your API key."}
+            
+        if response.status_code != 200:
+            return {"error": f"API request failed with status code {response.status_code}"}
+            
+        response_data = response.json()
+        
+        # Safety check on the response structure
+        if response_data is None:
+            return {"error": "Received empty response from Sketchfab API"}
+            
+        # Handle 'results' potentially missing from response
+        results = response_data.get("results", [])
+        if not isinstance(results, list):
+            return {"error": f"Unexpected response format from Sketchfab API: {response_data}"}
+
+        # Expose Sketchfab's cursor so the next page can be requested
+        next_cursor = (response_data.get("cursors") or {}).get("next")
+        if not next_cursor and response_data.get("next"):
+            next_cursor = parse_qs(urlparse(response_data["next"]).query).get("cursor", [None])[0]
+        response_data["next_cursor"] = next_cursor
+        return response_data
+
+    def _get_cached_sketchfab_search(self, key):
+        """Return a cached search response that is still fresh, or None"""
+        with self._sketchfab_search_lock:
+            entry = self._sketchfab_search_cache.get(key)
+            if entry and time.time() - entry[0] < SKETCHFAB_SEARCH_TTL:
+                return entry[1]
+            self._sketchfab_search_cache.pop(key, None)
+            return None
+
+    def _store_sketchfab_search(self, key, response_data):
+        """Cache a search response, evicting expired and then oldest entries"""
+        with self._sketchfab_search_lock:
+            now = time.time()
+            for stale_key in [k for k, (t, _) in self._sketchfab_search_cache.items() if now - t >= SKETCHFAB_SEARCH_TTL]:
+                del self._sketchfab_search_cache[stale_key]
+            while len(self._sketchfab_search_cache) >= SKETCHFAB_SEARCH_CACHE_SIZE:
+                oldest = min(self._sketchfab_search_cache, key=lambda k: self._sketchfab_search_cache[k][0])
+                del self._sketchfab_search_cache[oldest]
+            self._sketchfab_search_cache[key] = (now, response_data)
+
+    def _prefetch_sketchfab_search(self, api_key, query, categories, count, downloadable, cursor):
+        """Fetch the next page in the background while the agent reads the current one"""
+        key = self._sketchfab_search_key(query, categories, count, downloadable, cursor)
+        with self._sketchfab_search_lock:
+            if key in self._sketchfab_prefetching:
+                return
+            self._sketchfab_prefetching.add(key)
+        if self._get_cached_sketchfab_search(key) is not None:
+            with self._sketchfab_search_lock:
+                self._sketchfab_prefetching.discard(key)
+            return
+
+        def prefetch():
+            try:
+                response_data = self._fetch_sketchfab_search(api_key, query, categories, count, downloadable, cursor)
+                if "error" not in response_data:
+                    self._store_sketchfab_search(key, response_data)
+            except Exception as e:
+                print(f"Sketchfab prefetch failed: {str(e)}")
+            finally:
+                with self._sketchfab_search_lock:
+                    self._sketchfab_prefetching.discard(key)
+
+        worker = threading.Thread(target=prefetch)
+        worker.daemon = True
+        worker.start()
+
+    def search_sketchfab_models(self, query, categories=None, count=20, downloadable=True, cursor=None):
         """Search for models on Sketchfab based on query and optional filters"""
         try:
             api_key = bpy.context.scene.blendermcp_sketchfab_api_key
             if not api_key:
                 return {"error": "Sketchfab API key is not configured"}
-                
-            # Build search parameters with exact fields from Sketchfab API docs
-            params = {
-                "type": "models",
-                "q": query,
-                "count": count,
-                "downloadable": downloadable,
-                "archives_flavours": False
-            }
-            
-            if categories:
-                params["categories"] = categories
-                
-            # Make API request to Sketchfab search endpoint
-            # The proper format according to Sketchfab API docs for API key auth
-            headers = {
-                "Authorization": f"Token {api_key}"
-            }
-            
-            
-            # Use the search endpoint as specified in the API documentation
-            response = requests.get(
-                "https://api.sketchfab.com/v3/search",
-                headers=headers,
-                params=params,
-                timeout=30  # Add timeout of 30 seconds
-            )
-            
-            if response.status_code == 401:
-                return {"error": "Authentication failed (401). Check your API key."}
-                
-            if response.status_code != 200:
-                return {"error": f"API request failed with status code {response.status_code}"}
-                
-            response_data = response.json()
-            
-            # Safety check on the response structure
-            if response_data is None:
-                return {"error": "Received empty response from Sketchfab API"}
-                
-            # Handle 'results' potentially missing from response
-            results = response_data.get("results", [])
-            if not isinstance(results, list):
-                return {"error": f"Unexpected response format from Sketchfab API: {response_data}"}
-                
-            return response_data
+
+            key = self._sketchfab_search_key(query, categories, count, downloadable, cursor)
+            response_data = self._get_cached_sketchfab_search(key)
+            cached = response_data is not None
+            if not cached:
+                response_data = self._fetch_sketchfab_search(api_key, query, categories, count, downloadable, cursor)
+                if "error" in response_data:
+                    return response_data
+                self._store_sketchfab_search(key, response_data)
+
+            if response_data.get("next_cursor"):
+                self._prefetch_sketchfab_search(
+                    api_key, query, categories, count, downloadable, response_data["next_cursor"]
+                )
+
+            return {**response_data, "cached": cached}
         
         except requests.exceptions.Timeout:
             return {"error": "Request timed out. Check your internet connection."}
@@ -1564,116 +5628,231 @@ class BlenderMCPServer:
             traceback.print_exc()
             return {"error": str(e)}
 
-    def download_sketchfab_model(self, uid):
+    @staticmethod
+    def _get_sketchfab_model_version(uid, headers):
+        """Return a cache-safe version string for a model, from its last update time"""
+        try:
+            response = requests.get(
+                f"https://api.sketchfab.com/v3/models/{uid}",
+                headers=headers,
+                timeout=30
+            )
+            if response.status_code == 200:
+                data = response.json() or {}
+                version = data.get("updatedAt") or data.get("publishedAt")
+                if version:
+                    return "".join(c if c.isalnum() else "-" for c in version)
+        except (requests.exceptions.RequestException, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _find_cached_sketchfab_model(uid, version):
+        """Return (model_dir, main_file) of a cached extraction, or None"""
+        uid_dir = asset_cache.find("sketchfab", uid)
+        if not uid_dir:
+            return None
+        if version:
+            candidates = [version]
+        else:
+            # Version unknown (e.g. offline): fall back to the most recently used copy
+            candidates = sorted(
+                os.listdir(uid_dir),
+                key=lambda name: os.path.getmtime(os.path.join(uid_dir, name)),
+                reverse=True
+            )
+        for candidate in candidates:
+            manifest_path = os.path.join(uid_dir, candidate, SKETCHFAB_MANIFEST)
+            if not os.path.exists(manifest_path):
+                continue
+            with open(manifest_path) as f:
+                manifest = json.load(f)
+            main_file = os.path.join(uid_dir, candidate, manifest["main_file"])
+            if os.path.exists(main_file):
+                # Mark as recently used for eviction
+                with suppress(OSError):
+                    os.utime(os.path.join(uid_dir, candidate))
+                return os.path.join(uid_dir, candidate), main_file
+        return None
+
+    @staticmethod
+    def _gltf_referenced_files(gltf_json, base_dir):
+        """List the archive paths of the buffers and images a glTF document refers to"""
+        referenced = []
+        for item in gltf_json.get("buffers", []) + gltf_json.get("images", []):
+            uri = item.get("uri")
+            if uri and not uri.startswith("data:"):
+                referenced.append(posixpath.normpath(posixpath.join(base_dir, unquote(uri))))
+        return referenced
+
+    @staticmethod
+    def _extract_zip_member(zip_ref, member_name, target_dir):
+        """Stream one archive member to disk, refusing paths that escape target_dir"""
+        if os.path.isabs(member_name) or ".." in member_name.replace("\\", "/").split("/"):
+            raise ValueError(f"Security issue: Zip contains files with directory traversal sequence: {member_name}")
+        target_path = os.path.abspath(os.path.join(target_dir, os.path.normpath(member_name)))
+        if os.path.commonpath([target_path, os.path.abspath(target_dir)]) != os.path.abspath(target_dir):
+            raise ValueError(f"Security issue: Zip contains files with path traversal attempt: {member_name}")
+
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        with zip_ref.open(member_name) as source, open(target_path, "wb") as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+        return target_path
+
+    def _extract_sketchfab_archive(self, zip_path, model_dir):
+        """Extract only the glTF file and the files it references; returns the main file name"""
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            names = [info.filename for info in zip_ref.infolist() if not info.is_dir()]
+            gltf_files = [n for n in names if n.lower().endswith(('.gltf', '.glb'))]
+            if not gltf_files:
+                raise ValueError("No glTF file found in the downloaded model")
+            # Prefer the file closest to the archive root, like Sketchfab's scene.gltf
+            main_name = min(gltf_files, key=lambda n: (n.count("/"), len(n)))
+
+            needed = [main_name]
+            if main_name.lower().endswith(".gltf"):
+                gltf_json = json.loads(zip_ref.read(main_name).decode("utf-8"))
+            else:
+                # A GLB starts with a 12 byte header followed by its JSON chunk
+                with zip_ref.open(main_name) as f:
+                    f.read(12)
+                    chunk_length, _ = struct.unpack("<II", f.read(8))
+                    gltf_json = json.loads(f.read(chunk_length).decode("utf-8"))
+            needed += self._gltf_referenced_files(gltf_json, posixpath.dirname(main_name))
+
+            available = set(names)
+            for member_name in needed:
+                if member_name not in available:
+                    print(f"Referenced file missing from archive: {member_name}")
+                    continue
+                self._extract_zip_member(zip_ref, member_name, model_dir)
+
+        return main_name
+
+    def _download_sketchfab_archive(self, uid, version, headers):
+        """Download a model archive into the cache and extract it; returns (model_dir, main_file)"""
+        # Request download URL using the exact endpoint from the documentation
+        response = requests.get(
+            f"https://api.sketchfab.com/v3/models/{uid}/download",
+            headers=headers,
+            timeout=30  # Add timeout of 30 seconds
+        )
+
+        if response.status_code == 401:
+            raise PermissionError("Authentication failed (401). Check your API key.")
+
+        if response.status_code != 200:
+            raise RuntimeError(f"Download request failed with status code {response.status_code}")
+
+        data = response.json()
+
+        # Safety check for None data
+        if data is None:
+            raise RuntimeError("Received empty response from Sketchfab API for download request")
+
+        # Extract download URL with safety checks
+        gltf_data = data.get("gltf")
+        if not gltf_data:
+            raise RuntimeError("No gltf download URL available for this model. Response: " + str(data))
+
+        download_url = gltf_data.get("url")
+        if not download_url:
+            raise RuntimeError("No download URL available for this model. Make sure the model is downloadable and you have access.")
+
+        model_dir = asset_cache.path("sketchfab", uid, version or "latest", SKETCHFAB_MANIFEST)
+        model_dir = os.path.dirname(model_dir)
+        zip_path = os.path.join(model_dir, f"{uid}.zip.part")
+
+        try:
+            # Stream the archive to disk instead of holding it in memory
+            model_response = requests.get(download_url, stream=True, timeout=60)  # 60 second timeout
+            if model_response.status_code != 200:
+                raise RuntimeError(f"Model download failed with status code {model_response.status_code}")
+            with open(zip_path, "wb") as f:
+                for chunk in model_response.iter_content(chunk_size=1024 * 1024):
+                    f.write(chunk)
+
+            main_name = self._extract_sketchfab_archive(zip_path, model_dir)
+        except Exception:
+            with suppress(Exception):
+                shutil.rmtree(model_dir)
+            raise
+        finally:
+            with suppress(OSError):
+                os.unlink(zip_path)
+
+        # The manifest is written last, so only complete extractions are ever reused
+        with open(os.path.join(model_dir, SKETCHFAB_MANIFEST), "w") as f:
+            json.dump({"uid": uid, "version": version, "main_file": main_name, "downloaded": time.time()}, f)
+
+        asset_cache.trim_dirs("sketchfab", depth=2, max_bytes=SKETCHFAB_CACHE_MAX_BYTES, keep={model_dir})
+        return model_dir, os.path.join(model_dir, main_name)
+
+    def download_sketchfab_model(self, uid, max_faces=None, generate_lods=False, reuse=True, threaded_import=False,
+                                 save_to_library=False):
         """Download a model from Sketchfab by its UID"""
         try:
             api_key = bpy.context.scene.blendermcp_sketchfab_api_key
             if not api_key:
                 return {"error": "Sketchfab API key is not configured"}
+
+            # A model that was imported before is duplicated instead of imported again
+            if reuse:
+                duplicate = self._duplicate_imported_asset(f"sketchfab:{uid}", max_faces)
+                if duplicate:
+                    return {
+                        "success": True,
+                        "message": "Model added as a linked duplicate of the earlier import",
+                        **duplicate
+                    }
+                # Saved in an earlier session: appending from the library skips download and import
+                from_library = self._reuse_library_asset(f"sketchfab:{uid}", max_faces, generate_lods)
+                if from_library:
+                    return {
+                        "success": True,
+                        "message": "Model loaded from the asset library",
+                        **from_library
+                    }
                 
             # Use proper authorization header for API key auth
             headers = {
                 "Authorization": f"Token {api_key}"
             }
+
+            # Extracted models are cached by uid and version, so re-imports skip the download
+            version = self._get_sketchfab_model_version(uid, headers)
+            cached = self._find_cached_sketchfab_model(uid, version)
+            if cached:
+                model_dir, main_file = cached
+                from_cache = True
+            else:
+                try:
+                    model_dir, main_file = self._download_sketchfab_archive(uid, version, headers)
+                except (PermissionError, RuntimeError, ValueError) as e:
+                    return {"error": str(e)}
+                from_cache = False
             
-            # Request download URL using the exact endpoint from the documentation
-            download_endpoint = f"https://api.sketchfab.com/v3/models/{uid}/download"
-            
-            response = requests.get(
-                download_endpoint,
-                headers=headers,
-                timeout=30  # Add timeout of 30 seconds
-            )
-            
-            if response.status_code == 401:
-                return {"error": "Authentication failed (401). Check your API key."}
-                
-            if response.status_code != 200:
-                return {"error": f"Download request failed with status code {response.status_code}"}
-                
-            data = response.json()
-            
-            # Safety check for None data
-            if data is None:
-                return {"error": "Received empty response from Sketchfab API for download request"}
-                
-            # Extract download URL with safety checks
-            gltf_data = data.get("gltf")
-            if not gltf_data:
-                return {"error": "No gltf download URL available for this model. Response: " + str(data)}
-                
-            download_url = gltf_data.get("url")
-            if not download_url:
-                return {"error": "No download URL available for this model. Make sure the model is downloadable and you have access."}
-                
-            # Download the model (already has timeout)
-            model_response = requests.get(download_url, timeout=60)  # 60 second timeout
-            
-            if model_response.status_code != 200:
-                return {"error": f"Model download failed with status code {model_response.status_code}"}
-                
-            # Save to temporary file
-            temp_dir = tempfile.mkdtemp()
-            zip_file_path = os.path.join(temp_dir, f"{uid}.zip")
-            
-            with open(zip_file_path, "wb") as f:
-                f.write(model_response.content)
-                
-            # Extract the zip file with enhanced security
-            with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
-                # More secure zip slip prevention
-                for file_info in zip_ref.infolist():
-                    # Get the path of the file
-                    file_path = file_info.filename
-                    
-                    # Convert directory separators to the current OS style
-                    # This handles both / and \ in zip entries
-                    target_path = os.path.join(temp_dir, os.path.normpath(file_path))
-                    
-                    # Get absolute paths for comparison
-                    abs_temp_dir = os.path.abspath(temp_dir)
-                    abs_target_path = os.path.abspath(target_path)
-                    
-                    # Ensure the normalized path doesn't escape the target directory
-                    if not abs_target_path.startswith(abs_temp_dir):
-                        with suppress(Exception):
-                            shutil.rmtree(temp_dir)
-                        return {"error": "Security issue: Zip contains files with path traversal attempt"}
-                    
-                    # Additional explicit check for directory traversal
-                    if ".." in file_path:
-                        with suppress(Exception):
-                            shutil.rmtree(temp_dir)
-                        return {"error": "Security issue: Zip contains files with directory traversal sequence"}
-                
-                # If all files passed security checks, extract them
-                zip_ref.extractall(temp_dir)
-                
-            # Find the main glTF file
-            gltf_files = [f for f in os.listdir(temp_dir) if f.endswith('.gltf') or f.endswith('.glb')]
-            
-            if not gltf_files:
-                with suppress(Exception):
-                    shutil.rmtree(temp_dir)
-                return {"error": "No glTF file found in the downloaded model"}
-                
-            main_file = os.path.join(temp_dir, gltf_files[0])
-            
+            def finish(objects):
+                try:
+                    # The library keeps the full detail model; the budget only applies to this scene
+                    library = self._save_import_to_library({}, f"sketchfab:{uid}", objects) if save_to_library else {}
+                    polygons = self._apply_polygon_budget(objects, max_faces, generate_lods)
+                    self._register_imported_asset(f"sketchfab:{uid}", objects)
+                    result = {
+                        "success": True,
+                        "message": "Model imported successfully" + (" from cache" if from_cache else ""),
+                        "imported_objects": [obj.name for obj in objects],
+                        "from_cache": from_cache,
+                        "polygons": polygons,
+                        **library
+                    }
+                    return result
+                except Exception as e:
+                    traceback.print_exc()
+                    return {"error": f"Failed to import model: {str(e)}"}
+
             # Import the model
-            bpy.ops.import_scene.gltf(filepath=main_file)
-            
-            # Get the names of imported objects
-            imported_objects = [obj.name for obj in bpy.context.selected_objects]
-            
-            # Clean up temporary files
-            with suppress(Exception):
-                shutil.rmtree(temp_dir)
-            
-            return {
-                "success": True,
-                "message": "Model imported successfully",
-                "imported_objects": imported_objects
-            }
+            return self._import_gltf(main_file, finish, threaded_import)
         
         except requests.exceptions.Timeout:
             return {"error": "Request timed out. Check your internet connection and try again with a simpler model."}
@@ -1698,7 +5877,15 @@ class BLENDERMCP_PT_Panel(bpy.types.Panel):
         scene = context.scene
         
         layout.prop(scene, "blendermcp_port")
+        layout.prop(scene, "blendermcp_transport", text="Transport")
+        if scene.blendermcp_transport == 'UNIX':
+            layout.prop(scene, "blendermcp_socket_path", text="Socket")
         layout.prop(scene, "blendermcp_use_polyhaven", text="Use assets from Poly Haven")
+        if scene.blendermcp_use_polyhaven:
+            layout.prop(scene, "blendermcp_pack_textures", text="Pack downloaded textures")
+        layout.prop(scene, "blendermcp_texture_budget_mb", text="Texture Budget (MB)")
+        layout.prop(scene, "blendermcp_max_scene_faces", text="Polygon Budget")
+        layout.prop(scene, "blendermcp_blend_folders", text=".blend Folders")
 
         layout.prop(scene, "blendermcp_use_hyper3d", text="Use Hyper3D Rodin 3D model generation")
         if scene.blendermcp_use_hyper3d:
@@ -1715,6 +5902,9 @@ class BLENDERMCP_PT_Panel(bpy.types.Panel):
         else:
             layout.operator("blendermcp.stop_server", text="Disconnect from MCP server")
             layout.label(text=f"Running on port {scene.blendermcp_port}")
+            server = getattr(bpy.types, "blendermcp_server", None)
+            if server and server.unix_socket:
+                layout.label(text=f"and {server.socket_path}")
 
 # Operator to set Hyper3D API Key
 class BLENDERMCP_OT_SetFreeTrialHyper3DAPIKey(bpy.types.Operator):
@@ -1738,7 +5928,10 @@ class BLENDERMCP_OT_StartServer(bpy.types.Operator):
         
         # Create a new server instance
         if not hasattr(bpy.types, "blendermcp_server") or not bpy.types.blendermcp_server:
-            bpy.types.blendermcp_server = BlenderMCPServer(port=scene.blendermcp_port)
+            bpy.types.blendermcp_server = BlenderMCPServer(
+                port=scene.blendermcp_port,
+                socket_path=bpy.path.abspath(scene.blendermcp_socket_path) if scene.blendermcp_transport == 'UNIX' else None
+            )
         
         # Start the server
         bpy.types.blendermcp_server.start()
@@ -1774,6 +5967,23 @@ def register():
         max=65535
     )
     
+    bpy.types.Scene.blendermcp_transport = bpy.props.EnumProperty(
+        name="Transport",
+        description="How the MCP server connects. The Unix socket is faster on the same machine; TCP stays available",
+        items=[
+            ("TCP", "TCP", "TCP on the port only"),
+            ("UNIX", "Unix Socket", "Unix domain socket, next to TCP on the port"),
+        ],
+        default="TCP"
+    )
+
+    bpy.types.Scene.blendermcp_socket_path = bpy.props.StringProperty(
+        name="Socket Path",
+        description="Path of the Unix domain socket. Set BLENDER_SOCKET_PATH to the same path for the MCP server",
+        subtype="FILE_PATH",
+        default=os.path.join(tempfile.gettempdir(), "blendermcp.sock")
+    )
+    
     bpy.types.Scene.blendermcp_server_running = bpy.props.BoolProperty(
         name="Server Running",
         default=False
@@ -1785,6 +5995,32 @@ def register():
         default=False
     )
 
+    bpy.types.Scene.blendermcp_pack_textures = bpy.props.BoolProperty(
+        name="Pack Textures",
+        description="Pack downloaded textures into the .blend file instead of referencing the download cache",
+        default=True
+    )
+
+    bpy.types.Scene.blendermcp_texture_budget_mb = bpy.props.IntProperty(
+        name="Texture Budget",
+        description="Decoded texture memory budget in MB. Textures are downscaled when it is exceeded (0 = unlimited)",
+        default=0,
+        min=0
+    )
+
+    bpy.types.Scene.blendermcp_max_scene_faces = bpy.props.IntProperty(
+        name="Polygon Budget",
+        description="Maximum number of faces in the scene. Imported models are decimated to fit (0 = unlimited)",
+        default=0,
+        min=0
+    )
+
+    bpy.types.Scene.blendermcp_blend_folders = bpy.props.StringProperty(
+        name=".blend Folders",
+        description="Folders of .blend asset files to index for search_blend_library, separated by ';'",
+        default=""
+    )
+
     bpy.types.Scene.blendermcp_use_hyper3d = bpy.props.BoolProperty(
         name="Use Hyper3D Rodin",
         description="Enable Hyper3D Rodin generatino integration",
@@ -1821,6 +6057,11 @@ def register():
         default=""
     )
     
+    bpy.app.handlers.depsgraph_update_post.append(_bump_scene_version)
+    bpy.app.handlers.frame_change_post.append(_bump_scene_version)
+    bpy.app.handlers.load_post.append(_record_file_version)
+    bpy.app.handlers.save_post.append(_record_file_version)
+
     bpy.utils.register_class(BLENDERMCP_PT_Panel)
     bpy.utils.register_class(BLENDERMCP_OT_SetFreeTrialHyper3DAPIKey)
     bpy.utils.register_class(BLENDERMCP_OT_StartServer)
@@ -1834,14 +6075,27 @@ def unregister():
         bpy.types.blendermcp_server.stop()
         del bpy.types.blendermcp_server
     
+    for handlers in (bpy.app.handlers.depsgraph_update_post, bpy.app.handlers.frame_change_post):
+        if _bump_scene_version in handlers:
+            handlers.remove(_bump_scene_version)
+    for handlers in (bpy.app.handlers.load_post, bpy.app.handlers.save_post):
+        if _record_file_version in handlers:
+            handlers.remove(_record_file_version)
+
     bpy.utils.unregister_class(BLENDERMCP_PT_Panel)
     bpy.utils.unregister_class(BLENDERMCP_OT_SetFreeTrialHyper3DAPIKey)
     bpy.utils.unregister_class(BLENDERMCP_OT_StartServer)
     bpy.utils.unregister_class(BLENDERMCP_OT_StopServer)
     
     del bpy.types.Scene.blendermcp_port
+    del bpy.types.Scene.blendermcp_transport
+    del bpy.types.Scene.blendermcp_socket_path
     del bpy.types.Scene.blendermcp_server_running
     del bpy.types.Scene.blendermcp_use_polyhaven
+    del bpy.types.Scene.blendermcp_pack_textures
+    del bpy.types.Scene.blendermcp_texture_budget_mb
+    del bpy.types.Scene.blendermcp_max_scene_faces
+    del bpy.types.Scene.blendermcp_blend_folders
     del bpy.types.Scene.blendermcp_use_hyper3d
     del bpy.types.Scene.blendermcp_hyper3d_mode
     del bpy.types.Scene.blendermcp_hyper3d_api_key
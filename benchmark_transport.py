@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Compare the latency and throughput of the BlenderMCP TCP and Unix socket transports.
+
+Against Blender: start the addon server with Transport set to "Unix Socket" (TCP keeps
+listening on the port as well), then run
+
+    python benchmark_transport.py [--port 9876] [--socket-path /tmp/blendermcp.sock]
+
+Without Blender, --standalone runs a stand-in server answering like the addon, which
+measures the transport alone.
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import tempfile
+import threading
+import time
+
+
+def connect(transport, port, socket_path):
+    if transport == "unix":
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+    else:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        sock.connect(("localhost", port))
+    return sock
+
+
+def request(sock, command_type, params=None):
+    """Send a command and read until the response parses, like the MCP server does"""
+    sock.sendall(json.dumps({"type": command_type, "params": params or {}}).encode("utf-8"))
+    chunks = []
+    while True:
+        chunk = sock.recv(65536)
+        if not chunk:
+            raise ConnectionError("Connection closed")
+        chunks.append(chunk)
+        try:
+            return json.loads(b"".join(chunks).decode("utf-8"))
+        except json.JSONDecodeError:
+            continue
+
+
+def run_stand_in_server(port, socket_path, payload_size):
+    """Answer every command with a small status, or payload_size bytes for execute_code"""
+    payload = "x" * payload_size
+
+    def handle(client):
+        buffer = b""
+        with client:
+            while True:
+                data = client.recv(65536)
+                if not data:
+                    return
+                buffer += data
+                try:
+                    command = json.loads(buffer.decode("utf-8"))
+                except json.JSONDecodeError:
+                    continue
+                buffer = b""
+                result = {"result": payload} if command["type"] == "execute_code" else {"enabled": False}
+                client.sendall(json.dumps({"status": "success", "result": result}).encode("utf-8"))
+
+    def serve(listener):
+        listener.listen()
+        while True:
+            client, _ = listener.accept()
+            threading.Thread(target=handle, args=(client,), daemon=True).start()
+
+    tcp = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    tcp.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    tcp.bind(("localhost", port))
+    threading.Thread(target=serve, args=(tcp,), daemon=True).start()
+    if hasattr(socket, "AF_UNIX"):
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        unix = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        unix.bind(socket_path)
+        threading.Thread(target=serve, args=(unix,), daemon=True).start()
+
+
+def benchmark(transport, port, socket_path, requests, bulk_requests, payload_size):
+    sock = connect(transport, port, socket_path)
+    try:
+        # Small messages: the chatty tool-call workload
+        latencies = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            request(sock, "get_polyhaven_status")
+            latencies.append((time.perf_counter() - started) * 1000)
+        latencies.sort()
+
+        # Large responses: a payload_size string printed by execute_code
+        code = f"print('x' * {payload_size})"
+        received = 0
+        started = time.perf_counter()
+        for _ in range(bulk_requests):
+            response = request(sock, "execute_code", {"code": code})
+            received += len(json.dumps(response))
+        seconds = time.perf_counter() - started
+    finally:
+        sock.close()
+
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "throughput_mb_s": received / seconds / (1024 * 1024),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=9876)
+    parser.add_argument("--socket-path", default=os.environ.get("BLENDER_SOCKET_PATH")
+                        or os.path.join(tempfile.gettempdir(), "blendermcp.sock"))
+    parser.add_argument("--requests", type=int, default=2000, help="Small requests per transport")
+    parser.add_argument("--bulk-requests", type=int, default=20, help="Large requests per transport")
+    parser.add_argument("--payload-mb", type=float, default=4.0, help="Size of each large response")
+    parser.add_argument("--standalone", action="store_true", help="Benchmark against a stand-in server")
+    args = parser.parse_args()
+
+    payload_size = int(args.payload_mb * 1024 * 1024)
+    if args.standalone:
+        args.port = 19876
+        args.socket_path = os.path.join(tempfile.gettempdir(), "blendermcp_benchmark.sock")
+        run_stand_in_server(args.port, args.socket_path, payload_size)
+
+    transports = ["tcp"] + (["unix"] if hasattr(socket, "AF_UNIX") else [])
+    results = {}
+    for transport in transports:
+        try:
+            results[transport] = benchmark(
+                transport, args.port, args.socket_path, args.requests, args.bulk_requests, payload_size
+            )
+        except OSError as e:
+            print(f"✗ {transport}: {str(e)}")
+
+    print(f"{'transport':<10} {'p50 (ms)':>10} {'p95 (ms)':>10} {'MB/s':>10}")
+    for transport, result in results.items():
+        print(f"{transport:<10} {result['p50_ms']:>10.3f} {result['p95_ms']:>10.3f} {result['throughput_mb_s']:>10.1f}")
+    if len(results) == 2:
+        speedup = results["tcp"]["p50_ms"] / results["unix"]["p50_ms"]
+        print(f"\nUnix socket round trips are {speedup:.2f}x as fast as TCP at the median")
+
+
+if __name__ == "__main__":
+    main()
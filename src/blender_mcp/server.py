@@ -4,9 +4,13 @@ import socket
 import json
 import asyncio
 import logging
-import tempfile
-from dataclasses import dataclass
-from contextlib import asynccontextmanager
+import math
+import struct
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager, suppress
 from typing import AsyncIterator, Dict, Any, List
 import os
 from pathlib import Path
@@ -18,16 +22,102 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("BlenderMCPServer")
 
+try:
+    from multiprocessing import shared_memory as mp_shared_memory
+except ImportError:
+    mp_shared_memory = None
+
+# struct formats of the array dtypes the addon sends
+ARRAY_FORMATS = {"f4": "f", "f8": "d", "i1": "b", "u1": "B", "i2": "h", "u2": "H", "i4": "i", "u4": "I",
+                 "i8": "q", "u8": "Q", "b1": "?"}
+
+
+def _open_shared_memory(name):
+    """Attach to a segment created by the addon, without taking ownership of it"""
+    try:
+        return mp_shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        segment = mp_shared_memory.SharedMemory(name=name)
+        # Before Python 3.13, attaching registers the segment for removal when this process exits
+        with suppress(Exception):
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(segment._name, "shared_memory")
+        return segment
+
+
+class SharedArray:
+    """An array of a response, viewed in place in a shared memory segment or in the binary frame.
+
+    view is a memoryview with the array's shape, and numpy() wraps the same memory in a numpy array
+    when numpy is installed; neither copies. Pass the result to release_arrays once done with it.
+    """
+
+    def __init__(self, buffer, spec, connection=None):
+        self.dtype = spec["dtype"]
+        self.shape = tuple(spec["shape"])
+        self.segment = spec.get("segment")
+        self.connection = connection
+        if self.dtype[0] == ">":
+            raise ValueError(f"Big-endian arrays are not supported: {self.dtype}")
+        fmt = ARRAY_FORMATS[self.dtype.lstrip("<|=")]
+        count = math.prod(self.shape)
+        self._raw = memoryview(buffer)[spec["offset"]:spec["offset"] + count * struct.calcsize(fmt)]
+        self.view = self._raw.cast(fmt, self.shape) if count else self._raw.cast(fmt)
+
+    def __len__(self):
+        return self.shape[0] if self.shape else 0
+
+    def numpy(self):
+        import numpy as np
+        return np.frombuffer(self._raw, dtype=self.dtype).reshape(self.shape)
+
+    def tolist(self):
+        return self.view.tolist()
+
+    def release(self):
+        self.view.release()
+        self._raw.release()
+
+
+def release_arrays(result: Dict[str, Any]):
+    """Let go of the shared memory behind the SharedArrays of a result, on both sides"""
+    by_connection = {}
+    for value in result.values():
+        if isinstance(value, SharedArray):
+            value.release()
+            if value.segment and value.connection is not None:
+                by_connection.setdefault(id(value.connection), (value.connection, set()))[1].add(value.segment)
+    for connection, names in by_connection.values():
+        connection.release_segments(names)
+
+
 @dataclass
 class BlenderConnection:
     host: str
     port: int
     sock: socket.socket = None  # Changed from 'socket' to 'sock' to avoid naming conflict
+    # Unix domain socket of the addon, tried before TCP when set
+    socket_path: str = None
+    # Shared memory segments of responses, attached by name
+    segments: Dict[str, Any] = field(default_factory=dict)
     
     def connect(self) -> bool:
         """Connect to the Blender addon socket server"""
         if self.sock:
             return True
+        # The addon frees the segments of the previous connection when it notices it's gone
+        self._reclaim_segments()
+
+        if self.socket_path and hasattr(socket, "AF_UNIX"):
+            try:
+                self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.sock.connect(self.socket_path)
+                logger.info(f"Connected to Blender at {self.socket_path}")
+                return True
+            except OSError as e:
+                logger.warning(f"Could not connect to {self.socket_path}, falling back to TCP: {str(e)}")
+                self.sock.close()
+                self.sock = None
             
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -48,12 +138,89 @@ class BlenderConnection:
                 logger.error(f"Error disconnecting from Blender: {str(e)}")
             finally:
                 self.sock = None
+        self._reclaim_segments()
+
+    @property
+    def is_local(self) -> bool:
+        """Whether Blender runs on this machine, so shared memory can be used"""
+        return bool(self.socket_path) or self.host in ("localhost", "127.0.0.1", "::1")
+
+    def _close_segment(self, name):
+        segment = self.segments.pop(name, None)
+        if segment is None:
+            return
+        try:
+            segment.close()
+        except BufferError:
+            # numpy arrays made from it are still around; the mapping goes away with them
+            logger.warning(f"Shared memory segment {name} is still in use")
+
+    def _reclaim_segments(self):
+        """Close and remove the segments of this connection, in case Blender can't anymore"""
+        for name in list(self.segments):
+            segment = self.segments[name]
+            self._close_segment(name)
+            with suppress(Exception):
+                segment.unlink()
+
+    def release_segments(self, names):
+        """Close our mappings of segments and tell the addon to free them"""
+        for name in names:
+            self._close_segment(name)
+        if self.sock:
+            with suppress(Exception):
+                self.send_command("release_shared_memory", {"names": list(names)})
+
+    def _resolve_arrays(self, result, binary):
+        """Replace {"__array__": ...} descriptions in a result by SharedArrays"""
+        for key, value in list(result.items()):
+            if not (isinstance(value, dict) and "__array__" in value):
+                continue
+            spec = value["__array__"]
+            if spec.get("segment"):
+                if spec["segment"] not in self.segments:
+                    self.segments[spec["segment"]] = _open_shared_memory(spec["segment"])
+                result[key] = SharedArray(self.segments[spec["segment"]].buf, spec, self)
+            else:
+                result[key] = SharedArray(binary, spec)
+
+    @staticmethod
+    def parse_response(data: bytes):
+        """Parse a response, which may be a JSON header followed by "binary_length" raw bytes.
+
+        Returns the response dict, with the bytes under result["binary"] if present,
+        or raises json.JSONDecodeError while the response is still incomplete.
+        """
+        # The addon writes ASCII-only JSON, so latin-1 keeps byte offsets intact
+        response, end = json.JSONDecoder().raw_decode(data.decode('latin-1'))
+        binary_length = response.pop("binary_length", None)
+        if binary_length is None:
+            if data[end:].strip():
+                raise json.JSONDecodeError("Extra data", data.decode('latin-1'), end)
+            return response
+        if len(data) < end + binary_length:
+            raise json.JSONDecodeError("Incomplete binary frame", data.decode('latin-1'), len(data))
+        result = response.get("result")
+        if isinstance(result, dict):
+            result["binary"] = data[end:end + binary_length]
+        return response
 
-    def receive_full_response(self, sock, buffer_size=8192):
+    @staticmethod
+    def _binary_frame_size(data: bytes) -> int:
+        """Total size of a binary frame whose JSON header has arrived, else 0"""
+        try:
+            header, end = json.JSONDecoder().raw_decode(data.decode('latin-1'))
+        except json.JSONDecodeError:
+            return 0
+        return end + header.get("binary_length", 0) if isinstance(header, dict) else 0
+
+    def receive_full_response(self, sock, buffer_size=8192, timeout=15.0):
         """Receive the complete response, potentially in multiple chunks"""
         chunks = []
+        received = 0
+        expected = 0
         # Use a consistent timeout value that matches the addon's timeout
-        sock.settimeout(15.0)  # Match the addon's timeout
+        sock.settimeout(timeout)  # Match the addon's timeout
         
         try:
             while True:
@@ -67,15 +234,24 @@ class BlenderConnection:
                     
                     chunks.append(chunk)
                     
-                    # Check if we've received a complete JSON object
+                    received += len(chunk)
+                    if received < expected:
+                        # Still inside the binary frame announced by the header
+                        continue
+
+                    # Check if we've received a complete response
                     try:
                         data = b''.join(chunks)
-                        json.loads(data.decode('utf-8'))
+                        self.parse_response(data)
                         # If we get here, it parsed successfully
                         logger.info(f"Received complete response ({len(data)} bytes)")
                         return data
                     except json.JSONDecodeError:
-                        # Incomplete JSON, continue receiving
+                        # Incomplete, continue receiving; once the header of a binary frame
+                        # is in, skip parsing until all of its bytes have arrived
+                        with_header = self._binary_frame_size(data)
+                        if with_header:
+                            expected = with_header
                         continue
                 except socket.timeout:
                     # If we hit a timeout during receiving, break the loop and try to use what we have
@@ -97,7 +273,7 @@ class BlenderConnection:
             logger.info(f"Returning data after receive completion ({len(data)} bytes)")
             try:
                 # Try to parse what we have
-                json.loads(data.decode('utf-8'))
+                self.parse_response(data)
                 return data
             except json.JSONDecodeError:
                 # If we can't parse it, it's incomplete
@@ -105,8 +281,15 @@ class BlenderConnection:
         else:
             raise Exception("No data received")
 
-    def send_command(self, command_type: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Send a command to Blender and return the response"""
+    def send_command(self, command_type: str, params: Dict[str, Any] = None, timeout: float = 15.0,
+                     shared_memory: bool = False) -> Dict[str, Any]:
+        """Send a command to Blender and return the response.
+
+        Commands that are expected to take long, like waiting for a generation, pass a longer timeout.
+        Arrays in the result come back as SharedArrays; with shared_memory, large ones are passed
+        through shared memory when Blender runs on this machine. Call release_arrays on the result
+        once done with them.
+        """
         if not self.sock and not self.connect():
             raise ConnectionError("Not connected to Blender")
         
@@ -114,6 +297,8 @@ class BlenderConnection:
             "type": command_type,
             "params": params or {}
         }
+        if shared_memory and self.is_local and mp_shared_memory is not None:
+            command["shared_memory"] = True
         
         try:
             # Log the command being sent
@@ -124,20 +309,23 @@ class BlenderConnection:
             logger.info(f"Command sent, waiting for response...")
             
             # Set a timeout for receiving - use the same timeout as in receive_full_response
-            self.sock.settimeout(15.0)  # Match the addon's timeout
+            self.sock.settimeout(timeout)
             
             # Receive the response using the improved receive_full_response method
-            response_data = self.receive_full_response(self.sock)
+            response_data = self.receive_full_response(self.sock, timeout=timeout)
             logger.info(f"Received {len(response_data)} bytes of data")
             
-            response = json.loads(response_data.decode('utf-8'))
+            response = self.parse_response(response_data)
             logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
             
             if response.get("status") == "error":
                 logger.error(f"Blender error: {response.get('message')}")
                 raise Exception(response.get("message", "Unknown error from Blender"))
             
-            return response.get("result", {})
+            result = response.get("result", {})
+            if isinstance(result, dict):
+                self._resolve_arrays(result, result.get("binary", b""))
+            return result
         except socket.timeout:
             logger.error("Socket timeout while waiting for response from Blender")
             # Don't try to reconnect here - let the get_blender_connection handle reconnection
@@ -179,15 +367,12 @@ async def server_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
             logger.warning(f"Could not connect to Blender on startup: {str(e)}")
             logger.warning("Make sure the Blender addon is running before using Blender resources or tools")
         
-        # Return an empty context - we're using the global connection
+        # Return an empty context - we're using the global connection pool
         yield {}
     finally:
-        # Clean up the global connection on shutdown
-        global _blender_connection
-        if _blender_connection:
-            logger.info("Disconnecting from Blender on shutdown")
-            _blender_connection.disconnect()
-            _blender_connection = None
+        # Clean up the connections on shutdown
+        logger.info("Disconnecting from Blender on shutdown")
+        _connections.disconnect_all()
         logger.info("BlenderMCP server shut down")
 
 # Create the MCP server with lifespan support
@@ -199,48 +384,539 @@ mcp = FastMCP(
 
 # Resource endpoints
 
-# Global connection for resources (since resources can't access context)
-_blender_connection = None
-_polyhaven_enabled = False  # Add this global variable
+# Commands that don't change the scene, which may go to a replica of an instance
+READ_ONLY_COMMANDS = {
+    "get_scene_info", "get_object_info", "get_polyhaven_categories", "search_polyhaven_assets",
+    "search_sketchfab_models", "list_library_assets", "search_blend_library", "render_views",
+    "render_preview", "get_mesh_data", "get_object_transforms",
+}
+# Commands that don't change the scene either, but answer for the instance they are sent to (add-on
+# settings, render jobs, downloads, screenshots); any other command counts as an edit of the scene
+NON_MUTATING_COMMANDS = READ_ONLY_COMMANDS | {
+    "get_instance_info", "get_polyhaven_status", "get_hyper3d_status", "get_sketchfab_status",
+    "get_texture_memory_report", "get_texture_upgrade_status", "get_viewport_screenshot", "save_to_library",
+    "index_blend_library", "poll_rodin_job_status", "render_scene", "get_render_status", "get_render_result",
+    "cancel_render",
+}
+# Seconds a successful health check stays valid
+HEALTH_CHECK_INTERVAL = 5.0
 
-def get_blender_connection():
-    """Get or create a persistent Blender connection"""
-    global _blender_connection, _polyhaven_enabled  # Add _polyhaven_enabled to globals
-    
-    # If we have an existing connection, check if it's still valid
-    if _blender_connection is not None:
-        try:
-            # First check if PolyHaven is enabled by sending a ping command
-            result = _blender_connection.send_command("get_polyhaven_status")
-            # Store the PolyHaven status globally
-            _polyhaven_enabled = result.get("enabled", False)
-            return _blender_connection
-        except Exception as e:
-            # Connection is dead, close it and create a new one
-            logger.warning(f"Existing connection is no longer valid: {str(e)}")
+
+class BlenderInstance:
+    """A named Blender instance: a primary addon server plus optional replicas with the same .blend open.
+
+    Commands go to the primary. Read-only commands are spread over replicas, but only while the primary
+    and the replica both have the same version of a saved .blend file open without unsaved changes, so a
+    replica never answers for a scene that has been edited since. Commands that may change the scene
+    count as an edit until the primary's file is saved again, after which replicas take reads again once
+    they have reopened the saved file.
+    """
+
+    def __init__(self, name, host, port, replicas=(), socket_path=None):
+        self.name = name
+        self.primary = self._endpoint(host, port, socket_path)
+        self.replicas = [self._endpoint(replica_host, replica_port) for replica_host, replica_port in replicas]
+        self._next_replica = 0
+        self._replica_lock = threading.Lock()
+
+    @staticmethod
+    def _endpoint(host, port, socket_path=None):
+        return {
+            "host": host,
+            "port": port,
+            "socket_path": socket_path,
+            "connection": BlenderConnection(host=host, port=port, socket_path=socket_path),
+            "lock": threading.Lock(),
+            "healthy": None,
+            "last_check": 0.0,
+            "last_error": None,
+            "failures": 0,
+            "polyhaven_enabled": False,
+            "filepath": None,
+            "is_dirty": None,
+            "file_version": None,
+            # Commands that may have changed the scene were sent since file_version was saved
+            "edited": False,
+            "edited_file_version": None,
+        }
+
+    def endpoints(self):
+        return [self.primary] + self.replicas
+
+    def check(self, endpoint, force=False):
+        """Ping an endpoint unless it was found healthy recently; returns whether it's healthy"""
+        if not force and endpoint["healthy"] and time.time() - endpoint["last_check"] < HEALTH_CHECK_INTERVAL:
+            return True
+        with endpoint["lock"]:
+            connection = endpoint["connection"]
             try:
-                _blender_connection.disconnect()
-            except:
-                pass
-            _blender_connection = None
-    
-    # Create a new connection if needed
-    if _blender_connection is None:
-        _blender_connection = BlenderConnection(host="localhost", port=9876)
-        if not _blender_connection.connect():
-            logger.error("Failed to connect to Blender")
-            _blender_connection = None
-            raise Exception("Could not connect to Blender. Make sure the Blender addon is running.")
-        logger.info("Created new persistent connection to Blender")
-    
-    return _blender_connection
+                if not connection.connect():
+                    raise ConnectionError(f"Could not connect to {endpoint['host']}:{endpoint['port']}")
+                # Ping with a command every addon version has, noting whether PolyHaven is enabled
+                endpoint["polyhaven_enabled"] = connection.send_command("get_polyhaven_status").get("enabled", False)
+                if self.replicas:
+                    info = connection.send_command("get_instance_info")
+                    endpoint.update(filepath=info.get("filepath"), is_dirty=info.get("is_dirty"),
+                                    file_version=info.get("file_version"))
+                    if endpoint["edited"]:
+                        # Scripted edits don't always mark the file dirty, so only a save clears an edit
+                        if endpoint["edited_file_version"] is None:
+                            endpoint["edited_file_version"] = endpoint["file_version"]
+                        elif endpoint["file_version"] != endpoint["edited_file_version"]:
+                            endpoint.update(edited=False, edited_file_version=None)
+                endpoint.update(healthy=True, last_error=None, failures=0)
+            except Exception as e:
+                logger.warning(f"Blender instance {self.name} at {endpoint['host']}:{endpoint['port']} "
+                               f"is not healthy: {str(e)}")
+                connection.disconnect()
+                endpoint.update(healthy=False, last_error=str(e))
+                endpoint["failures"] += 1
+            endpoint["last_check"] = time.time()
+        return endpoint["healthy"]
+
+    def _replica_for(self, command_type):
+        """A replica that can answer a command in place of the primary, round robin, or None"""
+        if command_type not in READ_ONLY_COMMANDS or not self.replicas:
+            return None
+        primary = self.primary
+        if not primary["filepath"] or primary["is_dirty"] or primary["edited"]:
+            return None
+        for _ in range(len(self.replicas)):
+            with self._replica_lock:
+                replica = self.replicas[self._next_replica % len(self.replicas)]
+                self._next_replica += 1
+            if (self.check(replica) and replica["filepath"] == primary["filepath"] and not replica["is_dirty"]
+                    and replica["file_version"] == primary["file_version"]):
+                return replica
+        return None
+
+    def send_command(self, command_type: str, params: Dict[str, Any] = None, timeout: float = 15.0,
+                     shared_memory: bool = False) -> Dict[str, Any]:
+        replica = self._replica_for(command_type)
+        if replica is not None:
+            try:
+                with replica["lock"]:
+                    return replica["connection"].send_command(command_type, params, timeout, shared_memory)
+            except Exception as e:
+                # The primary can answer just as well
+                logger.warning(f"Replica {replica['host']}:{replica['port']} of {self.name} failed: {str(e)}")
+                replica["healthy"] = False
+        if command_type not in NON_MUTATING_COMMANDS and self.replicas and not self.primary["edited"]:
+            # Marked before sending, so reads racing the command don't go to a replica either
+            self.primary.update(edited=True, edited_file_version=self.primary["file_version"])
+        with self.primary["lock"]:
+            return self.primary["connection"].send_command(command_type, params, timeout, shared_memory)
+
+    def disconnect(self):
+        for endpoint in self.endpoints():
+            endpoint["connection"].disconnect()
+
+    def status(self):
+        def describe(endpoint):
+            return {key: value for key, value in endpoint.items() if key not in ("connection", "lock")}
+        return {"name": self.name, "primary": describe(self.primary),
+                "replicas": [describe(replica) for replica in self.replicas]}
+
+
+class BlenderConnectionManager:
+    """Pool of named Blender instances, so one MCP server can drive several scenes.
+
+    Instances are configured as "name=host:port" specs, where extra "+host:port" parts are read-only
+    replicas, or discovered by probing a port range. Tools pick one with their target parameter; without
+    it the default instance (the first one added) is used.
+    """
+
+    def __init__(self):
+        self.instances = {}
+        self.default = None
+        self.lock = threading.Lock()
+
+    def add(self, name, host, port, replicas=(), socket_path=None):
+        with self.lock:
+            if name in self.instances:
+                self.instances[name].disconnect()
+            self.instances[name] = BlenderInstance(name, host, port, replicas, socket_path)
+            if self.default is None:
+                self.default = name
+        return self.instances[name]
+
+    def configure(self, specs):
+        """Add instances from "name=host:port+host:port,..." specs; a bare "host:port" is named after its port"""
+        for spec in specs.split(","):
+            if not spec.strip():
+                continue
+            name, _, addresses = spec.strip().rpartition("=")
+            endpoints = [_parse_endpoint(address) for address in addresses.split("+")]
+            host, port = endpoints[0]
+            self.add(name or f"blender-{port}", host, port, endpoints[1:])
+
+    def discover(self, port_start, port_end, host="localhost", timeout=0.2):
+        """Add every addon server answering on a port range; returns the names of the new instances"""
+        known = {(endpoint["host"], endpoint["port"])
+                 for instance in self.instances.values() for endpoint in instance.endpoints()}
+        found = []
+        for port in range(port_start, port_end + 1):
+            if (host, port) in known:
+                continue
+            try:
+                with socket.create_connection((host, port), timeout=timeout):
+                    pass
+            except OSError:
+                continue
+            name = "default" if not self.instances else f"blender-{port}"
+            instance = self.add(name, host, port)
+            if instance.check(instance.primary, force=True):
+                found.append(name)
+            else:
+                # Something else is listening there
+                with self.lock:
+                    del self.instances[name]
+                    if self.default == name:
+                        self.default = next(iter(self.instances), None)
+        return found
+
+    def ensure_default(self):
+        """Without any configured instance, use localhost:9876, through BLENDER_SOCKET_PATH if it is set"""
+        if not self.instances:
+            self.add("default", "localhost", 9876, socket_path=os.environ.get("BLENDER_SOCKET_PATH") or None)
+
+    def get(self, target=None):
+        name = target or self.default
+        instance = self.instances.get(name) if name else None
+        if instance is None:
+            known = ", ".join(self.instances) or "none"
+            raise Exception(f"Unknown Blender instance {name}. Known instances: {known}")
+        return instance
+
+    def disconnect_all(self):
+        for instance in self.instances.values():
+            instance.disconnect()
+
+
+# Global pool for resources (since resources can't access context)
+_connections = BlenderConnectionManager()
+_polyhaven_enabled = False  # PolyHaven status of the instance used last
+
+def get_blender_connection(target: str = None):
+    """Get the connection to a named Blender instance (the default one without target), checking its health"""
+    global _polyhaven_enabled
+
+    _connections.ensure_default()
+    instance = _connections.get(target)
+    if not instance.check(instance.primary):
+        logger.error(f"Failed to connect to Blender instance {instance.name}")
+        raise Exception(f"Could not connect to Blender instance {instance.name} at "
+                        f"{instance.primary['host']}:{instance.primary['port']}. "
+                        "Make sure the Blender addon is running.")
+    _polyhaven_enabled = instance.primary["polyhaven_enabled"]
+    return instance
+
+
+def _parse_endpoint(endpoint: str) -> tuple:
+    """Split "host:port" (or just "port") into (host, port)"""
+    host, _, port = endpoint.strip().rpartition(":")
+    return host or "localhost", int(port)
+
+# Blender instances to distribute frame renders over, from BLENDER_RENDER_ENDPOINTS
+# ("host:port,host:port") plus the ones registered with register_render_endpoint.
+# Without any, every instance in the connection pool is used.
+_render_endpoints = [
+    _parse_endpoint(endpoint)
+    for endpoint in os.environ.get("BLENDER_RENDER_ENDPOINTS", "").split(",")
+    if endpoint.strip()
+]
+
+def _resolve_render_endpoints(endpoints=None):
+    """(host, port) of each "host:port" or instance name, with all replicas of named instances"""
+    if not endpoints:
+        if _render_endpoints:
+            return list(_render_endpoints)
+        _connections.ensure_default()
+        endpoints = list(_connections.instances)
+    resolved = []
+    for endpoint in endpoints:
+        if endpoint in _connections.instances:
+            addresses = [(e["host"], e["port"]) for e in _connections.instances[endpoint].endpoints()]
+        else:
+            addresses = [_parse_endpoint(endpoint)]
+        resolved += [address for address in addresses if address not in resolved]
+    return resolved
+
+
+class FrameDistributor:
+    """Render a frame range across several Blender instances and gather the frames into one sequence.
+
+    Every instance renders one frame at a time with the addon's render queue and pulls the next frame
+    when it's done, so faster instances render more frames. Near the end of the range, an instance
+    leaves the last frames to instances that are expected to finish them sooner. Frames that fail are
+    retried on other instances, and an instance that keeps failing is dropped.
+
+    connect(host, port) returns an object with send_command(); it defaults to BlenderConnection, and
+    can be swapped for stand-in servers.
+    """
+
+    def __init__(self, endpoints, render_params, output_dir, connect=None, max_attempts=3,
+                 poll_interval=1.0, frame_timeout=3600.0):
+        self.endpoints = [f"{host}:{port}" for host, port in endpoints]
+        self.render_params = render_params
+        self.output_dir = output_dir
+        self.connect = connect or (lambda host, port: BlenderConnection(host=host, port=port))
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.frame_timeout = frame_timeout
+        self.lock = threading.Condition()
+        self.pending = deque()
+        self.frames = {}
+        self.workers = {
+            endpoint: {"status": "idle", "frames_done": 0, "failures": 0, "average_seconds": None,
+                       "current_frame": None, "current_started": None}
+            for endpoint in self.endpoints
+        }
+        self.started = None
+        self.finished = None
+
+    def start(self, frames):
+        """Start rendering frames on a thread per instance; returns immediately"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.started = time.time()
+        for frame in frames:
+            self.frames[frame] = {"frame": frame, "status": "pending", "attempts": [], "output": None}
+            self.pending.append(frame)
+        for endpoint in self.endpoints:
+            threading.Thread(target=self._run_worker, args=(endpoint,), daemon=True).start()
+
+    def wait(self, timeout=None):
+        with self.lock:
+            return self.lock.wait_for(lambda: self.finished is not None, timeout)
+
+    def _live_workers(self):
+        return [endpoint for endpoint, worker in self.workers.items() if worker["status"] != "dropped"]
+
+    def _expected_finish(self, endpoint):
+        """Seconds until an instance could finish one more frame, from its average frame time"""
+        worker = self.workers[endpoint]
+        if worker["average_seconds"] is None:
+            return None
+        remaining = 0.0
+        if worker["current_started"] is not None:
+            remaining = max(0.0, worker["average_seconds"] - (time.time() - worker["current_started"]))
+        return remaining + worker["average_seconds"]
+
+    def _should_leave_to_others(self, endpoint):
+        """Whether faster instances would finish the remaining frames sooner than this one"""
+        own = self.workers[endpoint]["average_seconds"]
+        if own is None:
+            return False
+        # Only instances that may still take the frames, i.e. haven't failed them already
+        tried = {attempt["endpoint"] for frame in self.pending for attempt in self.frames[frame]["attempts"]}
+        faster = [
+            other for other in self._live_workers()
+            if other != endpoint and other not in tried
+            and (self._expected_finish(other) or float("inf")) < own * 0.5
+        ]
+        return len(self.pending) <= len(faster)
+
+    def _next_frame(self, endpoint):
+        """Block until there is a frame for this instance; None when there's nothing left"""
+        with self.lock:
+            while True:
+                if not self.pending:
+                    if all(frame["status"] in ("done", "failed") for frame in self.frames.values()):
+                        return None
+                    # Frames still rendering elsewhere may fail and come back
+                    self.lock.wait(self.poll_interval)
+                    continue
+                live = set(self._live_workers())
+                retry = False
+                for frame in self.pending:
+                    tried = {attempt["endpoint"] for attempt in self.frames[frame]["attempts"]}
+                    if endpoint not in tried:
+                        break
+                    if live <= tried:
+                        # Every instance failed it already, so retry here until max_attempts is reached
+                        retry = True
+                        break
+                else:
+                    frame = None
+                if frame is not None and (retry or not self._should_leave_to_others(endpoint)):
+                    self.pending.remove(frame)
+                    self.frames[frame]["status"] = "rendering"
+                    self.workers[endpoint].update(current_frame=frame, current_started=time.time(), status="busy")
+                    return frame
+                self.lock.wait(self.poll_interval)
+
+    def _render_frame(self, connection, frame):
+        """Render one frame on an instance and return the PNG bytes and the addon's render time"""
+        job = connection.send_command(
+            "render_scene", {**self.render_params, "frame_start": frame, "frame_end": frame}
+        )
+        if "error" in job:
+            raise Exception(job["error"])
+        deadline = time.time() + self.frame_timeout
+        while True:
+            status = connection.send_command("get_render_status", {"job_id": job["id"]})
+            if status.get("status") == "done":
+                break
+            if status.get("status") in ("failed", "cancelled") or "error" in status:
+                raise Exception(status.get("failure") or status.get("error") or status.get("status"))
+            if time.time() > deadline:
+                connection.send_command("cancel_render", {"job_id": job["id"]})
+                raise Exception(f"Frame {frame} timed out")
+            time.sleep(self.poll_interval)
+        result = connection.send_command(
+            "get_render_result", {"job_id": job["id"], "frame": frame, "full_resolution": True}, timeout=120.0
+        )
+        if "error" in result:
+            raise Exception(result["error"])
+        return result["binary"], status["frames"][-1]["seconds"]
+
+    def _run_worker(self, endpoint):
+        connection = self.connect(*_parse_endpoint(endpoint))
+        worker = self.workers[endpoint]
+        while True:
+            frame = self._next_frame(endpoint)
+            if frame is None:
+                break
+            started = time.time()
+            try:
+                data, render_seconds = self._render_frame(connection, frame)
+                output = os.path.join(self.output_dir, f"frame_{frame:04d}.png")
+                with open(output, "wb") as f:
+                    f.write(data)
+            except Exception as e:
+                logger.warning(f"Frame {frame} failed on {endpoint}: {str(e)}")
+                with self.lock:
+                    entry = self.frames[frame]
+                    entry["attempts"].append({"endpoint": endpoint, "error": str(e)})
+                    worker.update(current_frame=None, current_started=None, status="idle")
+                    worker["failures"] += 1
+                    if len(entry["attempts"]) >= self.max_attempts:
+                        entry["status"] = "failed"
+                    else:
+                        # Retried elsewhere first
+                        entry["status"] = "pending"
+                        self.pending.appendleft(frame)
+                    if worker["failures"] >= self.max_attempts and worker["frames_done"] == 0:
+                        worker["status"] = "dropped"
+                    self.lock.notify_all()
+                if worker["status"] == "dropped":
+                    break
+                continue
+
+            seconds = time.time() - started
+            with self.lock:
+                self.frames[frame].update(
+                    status="done", output=output, endpoint=endpoint, seconds=round(seconds, 3),
+                    render_seconds=render_seconds
+                )
+                self.frames[frame]["attempts"].append({"endpoint": endpoint})
+                average = worker["average_seconds"]
+                # Recent frames count more, in case an instance gets busier
+                worker["average_seconds"] = seconds if average is None else 0.7 * average + 0.3 * seconds
+                worker["frames_done"] += 1
+                worker.update(current_frame=None, current_started=None, status="idle")
+                self.lock.notify_all()
 
+        with self.lock:
+            if worker["status"] != "dropped":
+                worker["status"] = "finished"
+            if not self._live_workers():
+                # Nobody left to render the remaining frames
+                for frame in self.pending:
+                    self.frames[frame]["status"] = "failed"
+                self.pending.clear()
+            if all(w["status"] in ("finished", "dropped") for w in self.workers.values()):
+                self.finished = time.time()
+                self._write_manifest()
+            self.lock.notify_all()
+        disconnect = getattr(connection, "disconnect", None)
+        if disconnect:
+            disconnect()
+
+    def manifest(self):
+        with self.lock:
+            counts = {}
+            for frame in self.frames.values():
+                counts[frame["status"]] = counts.get(frame["status"], 0) + 1
+            end = self.finished or time.time()
+            return {
+                "status": "finished" if self.finished else "running",
+                "output_dir": self.output_dir,
+                "elapsed": round(end - self.started, 3) if self.started else 0.0,
+                "counts": counts,
+                "workers": {endpoint: dict(worker) for endpoint, worker in self.workers.items()},
+                "frames": [dict(self.frames[frame]) for frame in sorted(self.frames)],
+            }
+
+    def _write_manifest(self):
+        # Called with the lock held; manifest() takes it again, Condition locks are reentrant
+        with open(os.path.join(self.output_dir, "manifest.json"), "w", encoding="utf-8") as f:
+            json.dump(self.manifest(), f, indent=2)
+
+
+def _format_instances() -> str:
+    lines = []
+    for name, instance in _connections.instances.items():
+        status = instance.status()
+        default = " (default)" if name == _connections.default else ""
+        for role, endpoint in [("primary", status["primary"])] + [("replica", r) for r in status["replicas"]]:
+            health = {True: "healthy", False: "unreachable", None: "not checked"}[endpoint["healthy"]]
+            line = f"- {name}{default} {role} {endpoint['host']}:{endpoint['port']}: {health}"
+            if endpoint["filepath"]:
+                line += f", {endpoint['filepath']}" + (" (unsaved changes)" if endpoint["is_dirty"] else "")
+            if endpoint["last_error"]:
+                line += f" ({endpoint['last_error']})"
+            lines.append(line)
+    return "\n".join(lines) or "No Blender instances configured"
+
+@mcp.tool()
+def list_blender_instances(ctx: Context) -> str:
+    """
+    List the Blender instances this server can drive, with their health. Pass an instance name as the
+    target parameter of any other tool to run it on that instance; without target, the default instance
+    is used. Read-only queries may be answered by a replica that has the same saved .blend file open.
+    """
+    for instance in _connections.instances.values():
+        for endpoint in instance.endpoints():
+            instance.check(endpoint, force=True)
+    return _format_instances()
+
+@mcp.tool()
+def add_blender_instance(ctx: Context, name: str, endpoint: str, replicas: List[str] = None) -> str:
+    """
+    Add a named Blender instance, or replace the one with that name.
+
+    Parameters:
+    - name: Name to use as target in other tools
+    - endpoint: "host:port" of the instance's BlenderMCP addon server
+    - replicas: "host:port" of Blender instances with the same .blend file open, for read-only queries
+    """
+    try:
+        host, port = _parse_endpoint(endpoint)
+        instance = _connections.add(name, host, port, [_parse_endpoint(replica) for replica in replicas or []])
+        for instance_endpoint in instance.endpoints():
+            instance.check(instance_endpoint, force=True)
+        return _format_instances()
+    except ValueError:
+        return "Error: endpoints must be given as host:port"
+
+@mcp.tool()
+def discover_blender_instances(ctx: Context, port_start: int = 9876, port_end: int = 9895, host: str = "localhost") -> str:
+    """
+    Find BlenderMCP addon servers listening on a range of ports and add them as instances.
+
+    Parameters:
+    - port_start, port_end: Port range to probe (default: 9876-9895)
+    - host: Host to probe (default: localhost)
+    """
+    found = _connections.discover(port_start, port_end, host)
+    return (f"Found {len(found)} new instance(s).\n" if found else "No new instances found.\n") + _format_instances()
 
 @mcp.tool()
-def get_scene_info(ctx: Context) -> str:
+def get_scene_info(ctx: Context, target: str = None) -> str:
     """Get detailed information about the current Blender scene"""
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         result = blender.send_command("get_scene_info")
         
         # Just return the JSON representation of what Blender sent us
@@ -250,7 +926,7 @@ def get_scene_info(ctx: Context) -> str:
         return f"Error getting scene info: {str(e)}"
 
 @mcp.tool()
-def get_object_info(ctx: Context, object_name: str) -> str:
+def get_object_info(ctx: Context, object_name: str, target: str = None) -> str:
     """
     Get detailed information about a specific object in the Blender scene.
     
@@ -258,7 +934,7 @@ def get_object_info(ctx: Context, object_name: str) -> str:
     - object_name: The name of the object to get information about
     """
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         result = blender.send_command("get_object_info", {"name": object_name})
         
         # Just return the JSON representation of what Blender sent us
@@ -267,43 +943,145 @@ def get_object_info(ctx: Context, object_name: str) -> str:
         logger.error(f"Error getting object info from Blender: {str(e)}")
         return f"Error getting object info: {str(e)}"
 
+def _write_npy(path: str, array: SharedArray):
+    """Write an array as a .npy file, without needing numpy"""
+    shape = "(" + "".join(f"{size}, " for size in array.shape) + ")"
+    header = f"{{'descr': '{array.dtype}', 'fortran_order': False, 'shape': {shape}, }}"
+    # Magic, version and header length take 10 bytes; the data starts 64-byte aligned
+    header += " " * (-(10 + len(header) + 1) % 64) + "\n"
+    with open(path, "wb") as f:
+        f.write(b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin-1"))
+        f.write(array.view)
+
+@mcp.tool()
+def get_mesh_data(
+    ctx: Context,
+    object_name: str,
+    world_space: bool = True,
+    output_dir: str = None,
+    target: str = None
+) -> str:
+    """
+    Get the mesh of an object with modifiers applied: vertex and triangle counts and bounds, and
+    optionally the buffers themselves as .npy files for analysis with Python.
+
+    Parameters:
+    - object_name: The object to read
+    - world_space: Use world coordinates instead of the object's local ones (default: True)
+    - output_dir: Folder to write positions.npy (float32, V x 3), triangles.npy (int32, T x 3),
+      normals.npy (float32, V x 3) and uvs.npy (float32, T x 3 x 2) to
+    """
+    try:
+        blender = get_blender_connection(target)
+        params = {"object_name": object_name, "world_space": world_space}
+        if not output_dir:
+            # Only the counts and bounds are needed
+            params["attributes"] = ["positions"]
+        result = blender.send_command("get_mesh_data", params, timeout=60.0, shared_memory=True)
+        if "error" in result:
+            return f"Error: {result['error']}"
+        try:
+            output = (f"{result['name']}: {result['vertex_count']} vertices, {result['triangle_count']} triangles "
+                      f"({'world' if result['world_space'] else 'local'} space)")
+            if "bounds" in result:
+                low, high = result["bounds"]
+                output += "\nBounds: min (" + ", ".join(f"{v:.4f}" for v in low) + "), max (" + \
+                          ", ".join(f"{v:.4f}" for v in high) + ")"
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+                written = []
+                for key in ("positions", "triangles", "normals", "uvs"):
+                    if isinstance(result.get(key), SharedArray):
+                        path = os.path.join(output_dir, f"{key}.npy")
+                        _write_npy(path, result[key])
+                        written.append(path)
+                output += "\nWrote " + ", ".join(written)
+            return output
+        finally:
+            release_arrays(result)
+    except Exception as e:
+        logger.error(f"Error getting mesh data: {str(e)}")
+        return f"Error getting mesh data: {str(e)}"
+
+@mcp.tool()
+def get_object_transforms(ctx: Context, object_names: List[str] = None, target: str = None) -> str:
+    """
+    Get the location and dimensions of many objects in one call, as a table. Cheaper than calling
+    get_object_info for each object when checking the layout of a scene.
+
+    Parameters:
+    - object_names: Objects to list (default: every object in the scene)
+    """
+    try:
+        blender = get_blender_connection(target)
+        params = {"object_names": object_names} if object_names else {}
+        result = blender.send_command("get_object_transforms", params, shared_memory=True)
+        if "error" in result:
+            return f"Error: {result['error']}"
+        try:
+            locations = result["locations"].tolist()
+            dimensions = result["dimensions"].tolist()
+            lines = [f"{result['count']} objects (name, type, location, dimensions):"]
+            for name, kind, location, size in zip(result["names"], result["types"], locations, dimensions):
+                lines.append(f"- {name} [{kind}] at ({', '.join(f'{v:.3f}' for v in location)}), "
+                             f"size ({', '.join(f'{v:.3f}' for v in size)})")
+            return "\n".join(lines)
+        finally:
+            release_arrays(result)
+    except Exception as e:
+        logger.error(f"Error getting object transforms: {str(e)}")
+        return f"Error getting object transforms: {str(e)}"
+
 @mcp.tool()
-def get_viewport_screenshot(ctx: Context, max_size: int = 800) -> Image:
+def get_viewport_screenshot(
+    ctx: Context,
+    max_size: int = 800,
+    format: str = "png",
+    quality: int = 85,
+    since_frame: int = None,
+    target: str = None
+) -> Image:
     """
     Capture a screenshot of the current Blender 3D viewport.
     
     Parameters:
     - max_size: Maximum size in pixels for the largest dimension (default: 800)
+    - format: Image format, "png", "jpeg" or "webp" (default: "png"). JPEG and WebP are much
+      smaller; Blender falls back to PNG if it can't encode them.
+    - quality: Compression quality for JPEG and WebP, 1-100 (default: 85)
+    - since_frame: frame_id of a screenshot you already have. If nothing visible changed since,
+      no image is sent, only a short "unchanged" note. Otherwise diff_score (0 = identical,
+      1 = completely different) tells you how much changed.
     
-    Returns the screenshot as an Image.
+    Returns the screenshot as an Image, with a line giving its frame_id.
     """
     try:
-        blender = get_blender_connection()
-        
-        # Create temp file path
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, f"blender_screenshot_{os.getpid()}.png")
+        blender = get_blender_connection(target)
         
-        result = blender.send_command("get_viewport_screenshot", {
+        # The image comes back in memory, as the binary frame of the response
+        params = {
             "max_size": max_size,
-            "filepath": temp_path,
-            "format": "png"
-        })
+            "format": format,
+            "quality": quality
+        }
+        if since_frame is not None:
+            params["since_frame"] = since_frame
+        result = blender.send_command("get_viewport_screenshot", params)
         
         if "error" in result:
             raise Exception(result["error"])
         
-        if not os.path.exists(temp_path):
-            raise Exception("Screenshot file was not created")
+        if result.get("unchanged"):
+            return f"Viewport unchanged since frame {result['frame_id']}"
         
-        # Read the file
-        with open(temp_path, 'rb') as f:
-            image_bytes = f.read()
+        if "binary" not in result:
+            raise Exception("No image data received")
         
-        # Delete the temp file
-        os.remove(temp_path)
-        
-        return Image(data=image_bytes, format="png")
+        info = f"frame_id: {result['frame_id']}"
+        if "diff_score" in result:
+            info += (f", diff_score since frame {result['since_frame']}: {result['diff_score']}"
+                     f" ({result['changed_fraction']:.0%} of the image changed)")
+        return [Image(data=result["binary"], format=result.get("format", "png")), info]
         
     except Exception as e:
         logger.error(f"Error capturing screenshot: {str(e)}")
@@ -311,7 +1089,358 @@ def get_viewport_screenshot(ctx: Context, max_size: int = 800) -> Image:
 
 
 @mcp.tool()
-def execute_blender_code(ctx: Context, code: str) -> str:
+def render_views(
+    ctx: Context,
+    object_names: List[str] = None,
+    views: List[str] = None,
+    resolution: int = 256,
+    engine: str = "CYCLES",
+    samples: int = 16,
+    format: str = "png",
+    target: str = None
+) -> Image:
+    """
+    Render objects from several directions at once, to check placement and proportions
+    without rotating the viewport and taking screenshot after screenshot.
+    
+    Parameters:
+    - object_names: Objects to frame (default: the selection, or everything visible)
+    - views: Any of "front", "back", "right" (or "side"), "left", "top", "bottom", "iso"
+      (default: ["front", "side", "top", "iso"])
+    - resolution: Size in pixels of each square view (default: 256)
+    - engine: "CYCLES" (rendered on the CPU), "EEVEE" or "WORKBENCH" (fastest, no materials)
+    - samples: Render samples per view (default: 16)
+    - format: Image format of the contact sheet, "png", "jpeg" or "webp" (default: "png")
+    
+    Returns a contact sheet of the views, laid out left to right and top to bottom in the
+    order given, with the render time of each view. The views are orthographic.
+    """
+    try:
+        blender = get_blender_connection(target)
+        params = {
+            "resolution": resolution,
+            "engine": engine,
+            "samples": samples,
+            "format": format
+        }
+        if object_names:
+            params["object_names"] = object_names
+        if views:
+            params["views"] = views
+        result = blender.send_command("render_views", params, timeout=300.0)
+        
+        if "error" in result:
+            raise Exception(result["error"])
+        
+        if "binary" not in result:
+            raise Exception("No image data received")
+        
+        lines = [f"{len(result['views'])} views rendered with {result['engine']} in {result['render_seconds']}s:"]
+        for view in result["views"]:
+            lines.append(f"- {view['view']}: row {view['row']}, column {view['column']}, {view['seconds']}s")
+        return [Image(data=result["binary"], format=result.get("format", "png")), "\n".join(lines)]
+        
+    except Exception as e:
+        logger.error(f"Error rendering views: {str(e)}")
+        raise Exception(f"Rendering views failed: {str(e)}")
+
+
+@mcp.tool()
+def render_preview(
+    ctx: Context,
+    target_seconds: float = 2.0,
+    engine: str = None,
+    camera: str = None,
+    format: str = "jpeg",
+    target: str = None
+) -> Image:
+    """
+    Render a quick look through the scene camera, within about target_seconds.
+
+    Resolution, samples, denoising, Simplify and light bounces are chosen to fit the time budget,
+    based on how long earlier previews of this scene took; the first call also calibrates. The
+    scene's render settings are restored afterwards. Use render_scene for the final render.
+
+    Parameters:
+    - target_seconds: Time budget for the render (default: 2.0)
+    - engine: "CYCLES", "EEVEE" or "WORKBENCH" (default: the scene's engine)
+    - camera: Name of the camera object (default: the scene camera)
+    - format: "png", "jpeg" or "webp" (default: "jpeg")
+    """
+    try:
+        blender = get_blender_connection(target)
+        params = {"target_seconds": target_seconds, "format": format}
+        if engine:
+            params["engine"] = engine
+        if camera:
+            params["camera"] = camera
+        result = blender.send_command("render_preview", params, timeout=max(60.0, target_seconds * 10))
+        if "error" in result:
+            raise Exception(result["error"])
+        profile = result["profile"]
+        info = (f"Rendered {result['width']}x{result['height']} with {result['engine']} in {result['seconds']}s "
+                f"(target {result['target_seconds']}s): profile level {profile['level']}, "
+                f"{profile['resolution_percentage']}% resolution, {profile['samples']} samples, "
+                f"{profile['max_bounces']} bounces")
+        if any(render.get("calibration") for render in result["renders"]):
+            info += ". This included a calibration render, later previews will be closer to the target."
+        return [Image(data=result["binary"], format=result.get("format", "png")), info]
+    except Exception as e:
+        logger.error(f"Error rendering preview: {str(e)}")
+        raise Exception(f"Preview render failed: {str(e)}")
+
+def _format_render_job(job: Dict[str, Any]) -> str:
+    """Describe a render job returned by the addon"""
+    output = (f"Render job {job['id']} is {job['status']}: {job['frames_done']}/{job['frames_total']} frames "
+              f"after {job['elapsed']}s.")
+    if job.get("current_frame") is not None:
+        output += f" Rendering frame {job['current_frame']}"
+        output += f" ({job['progress']})." if job.get("progress") else "."
+    if job.get("queue_position"):
+        output += f" Position in the queue: {job['queue_position']}."
+    if job.get("failure"):
+        output += f"\nFailed: {job['failure']}"
+    if job["frames"]:
+        output += "\n\nFrames:\n" + "\n".join(
+            f"- {frame['frame']}: {frame['seconds']}s, {frame['output']}" for frame in job["frames"]
+        )
+    output += f"\n\nOutput folder: {job['output_dir']}"
+    return output
+
+@mcp.tool()
+def render_scene(
+    ctx: Context,
+    frame_start: int = None,
+    frame_end: int = None,
+    frame_step: int = 1,
+    resolution_x: int = None,
+    resolution_y: int = None,
+    resolution_percentage: int = None,
+    samples: int = None,
+    engine: str = None,
+    camera: str = None,
+    target: str = None
+) -> str:
+    """
+    Queue a final render of the scene. It runs in a background Blender process on a snapshot of the
+    scene as it is now, so Blender stays responsive and later changes don't affect it. Use this instead
+    of calling bpy.ops.render.render from execute_blender_code, which blocks and times out.
+
+    Parameters:
+    - frame_start, frame_end, frame_step: Frames to render (default: the current frame only)
+    - resolution_x, resolution_y, resolution_percentage: Output size (default: the scene's)
+    - samples: Render samples (default: the scene's)
+    - engine: "CYCLES", "EEVEE" or "WORKBENCH" (default: the scene's)
+    - camera: Name of the camera object (default: the scene camera)
+
+    Returns the job id. Follow it with get_render_status, get_render_result or cancel_render.
+    """
+    try:
+        blender = get_blender_connection(target)
+        params = {
+            "frame_start": frame_start,
+            "frame_end": frame_end,
+            "frame_step": frame_step,
+            "resolution_x": resolution_x,
+            "resolution_y": resolution_y,
+            "resolution_percentage": resolution_percentage,
+            "samples": samples,
+            "engine": engine,
+            "camera": camera
+        }
+        result = blender.send_command("render_scene", {k: v for k, v in params.items() if v is not None})
+        if "error" in result:
+            return f"Error: {result['error']}"
+        result["elapsed"] = 0.0
+        return _format_render_job(result)
+    except Exception as e:
+        logger.error(f"Error queueing render: {str(e)}")
+        return f"Error queueing render: {str(e)}"
+
+@mcp.tool()
+def get_render_status(ctx: Context, job_id: str = None, include_preview: bool = False, target: str = None):
+    """
+    Check the progress of a render job started with render_scene, with per-frame timings.
+
+    Parameters:
+    - job_id: The render job id (default: list all render jobs)
+    - include_preview: Also return a small preview of the latest rendered frame
+    """
+    try:
+        blender = get_blender_connection(target)
+        params = {"include_preview": include_preview}
+        if job_id:
+            params["job_id"] = job_id
+        result = blender.send_command("get_render_status", params)
+        if "error" in result:
+            return f"Error: {result['error']}"
+        if "jobs" in result:
+            if not result["jobs"]:
+                return "No render jobs"
+            return "\n\n".join(_format_render_job(job) for job in result["jobs"])
+        if "binary" in result:
+            return [Image(data=result["binary"], format="png"), _format_render_job(result)]
+        return _format_render_job(result)
+    except Exception as e:
+        logger.error(f"Error getting render status: {str(e)}")
+        return f"Error getting render status: {str(e)}"
+
+@mcp.tool()
+def get_render_result(ctx: Context, job_id: str, frame: int = None, full_resolution: bool = False, target: str = None) -> Image:
+    """
+    Get a rendered frame of a render job, plus the paths of all its output files.
+
+    Parameters:
+    - job_id: The render job id
+    - frame: Frame number (default: the last rendered frame)
+    - full_resolution: Return the full output image instead of a preview of at most 512 pixels
+    """
+    try:
+        blender = get_blender_connection(target)
+        params = {"job_id": job_id, "full_resolution": full_resolution}
+        if frame is not None:
+            params["frame"] = frame
+        result = blender.send_command("get_render_result", params, timeout=60.0)
+        if "error" in result:
+            return f"Error: {result['error']}"
+        return [
+            Image(data=result["binary"], format="png"),
+            f"Frame {result['image_frame']} ({result['image_path']})\n\n{_format_render_job(result)}"
+        ]
+    except Exception as e:
+        logger.error(f"Error getting render result: {str(e)}")
+        return f"Error getting render result: {str(e)}"
+
+@mcp.tool()
+def cancel_render(ctx: Context, job_id: str, target: str = None) -> str:
+    """
+    Cancel a queued or running render job. Frames that are already rendered are kept.
+
+    Parameters:
+    - job_id: The render job id
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("cancel_render", {"job_id": job_id})
+        if "error" in result:
+            return f"Error: {result['error']}"
+        if not result["cancelled"]:
+            return f"Render job {job_id} already {result['status']}"
+        return _format_render_job(result)
+    except Exception as e:
+        logger.error(f"Error cancelling render: {str(e)}")
+        return f"Error cancelling render: {str(e)}"
+
+# Distributed renders by id
+_distributed_renders = {}
+
+def _format_distributed_render(render_id: str, manifest: Dict[str, Any]) -> str:
+    """Describe the manifest of a distributed render"""
+    counts = ", ".join(f"{count} {status}" for status, count in manifest["counts"].items())
+    output = f"Distributed render {render_id} is {manifest['status']} after {manifest['elapsed']}s ({counts}).\n"
+    output += "\nInstances:\n" + "\n".join(
+        f"- {endpoint}: {worker['status']}, {worker['frames_done']} frames"
+        + (f", {worker['average_seconds']:.1f}s per frame" if worker["average_seconds"] else "")
+        + (f", {worker['failures']} failures" if worker["failures"] else "")
+        for endpoint, worker in manifest["workers"].items()
+    )
+    failed = [frame for frame in manifest["frames"] if frame["status"] == "failed"]
+    if failed:
+        output += "\n\nFailed frames:\n" + "\n".join(
+            f"- {frame['frame']}: {frame['attempts'][-1].get('error')}" for frame in failed
+        )
+    output += f"\n\nFrames are written to {manifest['output_dir']} as frame_####.png"
+    if manifest["status"] != "finished":
+        output += f"\nCall get_distributed_render_status(render_id=\"{render_id}\") to follow it."
+    return output
+
+@mcp.tool()
+def register_render_endpoint(ctx: Context, endpoint: str) -> str:
+    """
+    Add a Blender instance to distribute frame renders over. Each instance needs the BlenderMCP addon
+    server running, with the same scene open.
+
+    Parameters:
+    - endpoint: "host:port" of the instance's BlenderMCP server
+    """
+    try:
+        host, port = _parse_endpoint(endpoint)
+    except ValueError:
+        return f"Error: invalid endpoint {endpoint}, expected host:port"
+    if (host, port) not in _render_endpoints:
+        _render_endpoints.append((host, port))
+    return "Render endpoints: " + ", ".join(f"{h}:{p}" for h, p in _render_endpoints)
+
+@mcp.tool()
+def render_frames_distributed(
+    ctx: Context,
+    frame_start: int,
+    frame_end: int,
+    frame_step: int = 1,
+    output_dir: str = None,
+    resolution_x: int = None,
+    resolution_y: int = None,
+    resolution_percentage: int = None,
+    samples: int = None,
+    engine: str = None,
+    camera: str = None,
+    endpoints: List[str] = None
+) -> str:
+    """
+    Render a frame range across several Blender instances (see register_render_endpoint) and gather
+    the frames into one image sequence. Faster instances get more frames, and failed frames are
+    retried on other instances. Returns right away; follow it with get_distributed_render_status.
+
+    Parameters:
+    - frame_start, frame_end, frame_step: Frames to render
+    - output_dir: Folder for the sequence (default: a new folder in ~/blendermcp_renders)
+    - resolution_x, resolution_y, resolution_percentage, samples, engine, camera: As for render_scene
+    - endpoints: Instance names or "host:port" addresses to use (default: the registered render
+      endpoints, or else every Blender instance, replicas included)
+    """
+    try:
+        targets = _resolve_render_endpoints(endpoints)
+        if not targets:
+            return "Error: no render endpoints registered"
+        params = {
+            "resolution_x": resolution_x,
+            "resolution_y": resolution_y,
+            "resolution_percentage": resolution_percentage,
+            "samples": samples,
+            "engine": engine,
+            "camera": camera
+        }
+        render_id = f"distributed-{len(_distributed_renders) + 1}-{int(time.time())}"
+        output_dir = output_dir or os.path.join(
+            os.environ.get("BLENDERMCP_RENDER_DIR") or os.path.join(os.path.expanduser("~"), "blendermcp_renders"),
+            render_id
+        )
+        distributor = FrameDistributor(targets, {k: v for k, v in params.items() if v is not None}, output_dir)
+        distributor.start(range(frame_start, frame_end + 1, max(1, frame_step)))
+        _distributed_renders[render_id] = distributor
+        return _format_distributed_render(render_id, distributor.manifest())
+    except Exception as e:
+        logger.error(f"Error starting distributed render: {str(e)}")
+        return f"Error starting distributed render: {str(e)}"
+
+@mcp.tool()
+def get_distributed_render_status(ctx: Context, render_id: str, wait_seconds: int = 0) -> str:
+    """
+    Progress of a render started with render_frames_distributed.
+
+    Parameters:
+    - render_id: The distributed render id
+    - wait_seconds: Wait up to this many seconds (at most 600) for the render to finish first
+    """
+    distributor = _distributed_renders.get(render_id)
+    if distributor is None:
+        return f"Error: unknown distributed render {render_id}"
+    if wait_seconds:
+        distributor.wait(min(wait_seconds, 600))
+    return _format_distributed_render(render_id, distributor.manifest())
+
+@mcp.tool()
+def execute_blender_code(ctx: Context, code: str, target: str = None) -> str:
     """
     Execute arbitrary Python code in Blender. Make sure to do it step-by-step by breaking it into smaller chunks.
     
@@ -320,7 +1449,7 @@ def execute_blender_code(ctx: Context, code: str) -> str:
     """
     try:
         # Get the global connection
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         result = blender.send_command("execute_code", {"code": code})
         return f"Code executed successfully: {result.get('result', '')}"
     except Exception as e:
@@ -328,7 +1457,7 @@ def execute_blender_code(ctx: Context, code: str) -> str:
         return f"Error executing code: {str(e)}"
 
 @mcp.tool()
-def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
+def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris", target: str = None) -> str:
     """
     Get a list of categories for a specific asset type on Polyhaven.
     
@@ -336,7 +1465,7 @@ def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
     - asset_type: The type of asset to get categories for (hdris, textures, models, all)
     """
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         if not _polyhaven_enabled:
             return "PolyHaven integration is disabled. Select it in the sidebar in BlenderMCP, then run it again."
         result = blender.send_command("get_polyhaven_categories", {"asset_type": asset_type})
@@ -363,7 +1492,8 @@ def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
 def search_polyhaven_assets(
     ctx: Context,
     asset_type: str = "all",
-    categories: str = None
+    categories: str = None,
+    target: str = None
 ) -> str:
     """
     Search for assets on Polyhaven with optional filtering.
@@ -375,7 +1505,7 @@ def search_polyhaven_assets(
     Returns a list of matching assets with basic information.
     """
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         result = blender.send_command("search_polyhaven_assets", {
             "asset_type": asset_type,
             "categories": categories
@@ -414,7 +1544,14 @@ def download_polyhaven_asset(
     asset_id: str,
     asset_type: str,
     resolution: str = "1k",
-    file_format: str = None
+    file_format: str = None,
+    progressive: bool = False,
+    pack_channels: bool = False,
+    max_faces: int = None,
+    generate_lods: bool = False,
+    reuse: bool = True,
+    save_to_library: bool = False,
+    target: str = None
 ) -> str:
     """
     Download and import a Polyhaven asset into Blender.
@@ -424,16 +1561,33 @@ def download_polyhaven_asset(
     - asset_type: The type of asset (hdris, textures, models)
     - resolution: The resolution to download (e.g., 1k, 2k, 4k)
     - file_format: Optional file format (e.g., hdr, exr for HDRIs; jpg, png for textures; gltf, fbx for models)
+    - progressive: For textures only. If True, 1k maps are applied immediately and the requested
+      resolution is downloaded in the background and swapped in when ready (default False)
+    - pack_channels: For textures only. If True, separate AO, roughness and metallic maps are packed
+      into one RGB image to save memory and texture samples (default False)
+    - max_faces: For models only. Optional face limit; the model is decimated after import if it has more
+    - generate_lods: For models only. If True, hidden _LOD1 and _LOD2 copies at 50% and 25% faces are added
+    - reuse: For models only. If the same model was imported before, add a linked duplicate sharing its
+      mesh and materials instead of downloading it again, or load it from the local asset library if it
+      was saved there (default True)
+    - save_to_library: For models only. If True, the imported model is saved to the local asset library
+      so later sessions can load it without downloading
     
     Returns a message indicating success or failure.
     """
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         result = blender.send_command("download_polyhaven_asset", {
             "asset_id": asset_id,
             "asset_type": asset_type,
             "resolution": resolution,
-            "file_format": file_format
+            "file_format": file_format,
+            "progressive": progressive,
+            "pack_channels": pack_channels,
+            "max_faces": max_faces,
+            "generate_lods": generate_lods,
+            "reuse": reuse,
+            "save_to_library": save_to_library
         })
         
         if "error" in result:
@@ -448,9 +1602,20 @@ def download_polyhaven_asset(
             elif asset_type == "textures":
                 material_name = result.get("material", "")
                 maps = ", ".join(result.get("maps", []))
-                return f"{message}. Created material '{material_name}' with maps: {maps}."
+                output = f"{message}. Created material '{material_name}' with maps: {maps}."
+                packing = result.get("channel_packing")
+                if packing and packing.get("packed"):
+                    output += f" Packed {', '.join(packing['replaced_maps'])} into '{packing['image']}'."
+                progressive_info = result.get("progressive")
+                if progressive_info and progressive_info.get("status") == "downloading":
+                    output += (f" Showing {progressive_info.get('preview_resolution', '1k')} maps now; "
+                               f"{progressive_info.get('target_resolution')} maps are downloading in the background. "
+                               "Use get_texture_upgrade_status() to check progress.")
+                return output
             elif asset_type == "models":
-                return f"{message}. The model has been imported into the current scene."
+                objects = ", ".join(result.get("imported_objects", [])) or "none"
+                return (f"{message}. Created objects: {objects}." + _format_polygons(result.get("polygons"))
+                        + _format_library(result))
             else:
                 return message
         else:
@@ -463,23 +1628,34 @@ def download_polyhaven_asset(
 def set_texture(
     ctx: Context,
     object_name: str,
-    texture_id: str
+    texture_id: str,
+    resolution: str = None,
+    progressive: bool = False,
+    pack_channels: bool = False,
+    target: str = None
 ) -> str:
     """
     Apply a previously downloaded Polyhaven texture to an object.
     
     Parameters:
     - object_name: Name of the object to apply the texture to
-    - texture_id: ID of the Polyhaven texture to apply (must be downloaded first)
+    - texture_id: ID of the Polyhaven texture to apply (must be downloaded first, unless progressive is True)
+    - resolution: Target resolution for progressive mode (e.g., 2k, 4k)
+    - progressive: If True, the texture is downloaded at 1k if needed and applied immediately,
+      then upgraded to the target resolution in the background (default False)
+    - pack_channels: If True, separate AO, roughness and metallic maps are packed into one RGB image (default False)
     
     Returns a message indicating success or failure.
     """
     try:
         # Get the global connection
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         result = blender.send_command("set_texture", {
             "object_name": object_name,
-            "texture_id": texture_id
+            "texture_id": texture_id,
+            "resolution": resolution,
+            "progressive": progressive,
+            "pack_channels": pack_channels
         })
         
         if "error" in result:
@@ -511,6 +1687,15 @@ def set_texture(
             else:
                 output += "No texture nodes found in the material.\n"
             
+            packing = result.get("channel_packing")
+            if packing and packing.get("packed"):
+                output += f"\nPacked {', '.join(packing['replaced_maps'])} into '{packing['image']}' (R=AO, G=roughness, B=metallic).\n"
+            
+            progressive_info = result.get("progressive")
+            if progressive_info and progressive_info.get("status") == "downloading":
+                output += (f"\n{progressive_info.get('target_resolution')} maps are downloading in the background "
+                           "and will replace the current maps when ready. Use get_texture_upgrade_status() to check progress.\n")
+            
             return output
         else:
             return f"Failed to apply texture: {result.get('message', 'Unknown error')}"
@@ -519,13 +1704,137 @@ def set_texture(
         return f"Error applying texture: {str(e)}"
 
 @mcp.tool()
-def get_polyhaven_status(ctx: Context) -> str:
+def get_texture_upgrade_status(ctx: Context, asset_id: str = None, target: str = None) -> str:
+    """
+    Check progressive texture loading started by download_polyhaven_asset or set_texture.
+    
+    Parameters:
+    - asset_id: Optional ID of the Polyhaven texture to check. All jobs are listed if omitted.
+    
+    Returns which maps are still downloading and which materials are still using low resolution maps.
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("get_texture_upgrade_status", {"asset_id": asset_id})
+        
+        if "error" in result:
+            return f"Error: {result['error']}"
+        
+        jobs = result.get("jobs", [])
+        if not jobs:
+            return "No progressive texture loading jobs."
+        
+        output = ""
+        for job in jobs:
+            output += f"- {job['asset_id']}: {job['status']} (target {job['target_resolution']}, {job['elapsed']}s)\n"
+            if job["pending_maps"]:
+                output += f"  Pending maps: {', '.join(job['pending_maps'])}\n"
+            if job["upgraded_maps"]:
+                output += f"  Upgraded maps: {', '.join(job['upgraded_maps'])}\n"
+            if job["upgrading_materials"]:
+                output += f"  Materials still upgrading: {', '.join(job['upgrading_materials'])}\n"
+            for map_type, error in job["errors"].items():
+                output += f"  Failed {map_type}: {error}\n"
+        return output
+    except Exception as e:
+        logger.error(f"Error checking texture upgrade status: {str(e)}")
+        return f"Error checking texture upgrade status: {str(e)}"
+
+@mcp.tool()
+def get_texture_memory_report(ctx: Context, target: str = None) -> str:
+    """
+    Report the decoded memory used by every image in the Blender file, the total, and the
+    current texture budget. Images with the lowest screen coverage are downscaled first when
+    a budget is enforced.
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("get_texture_memory_report")
+
+        if "error" in result:
+            return f"Error: {result['error']}"
+
+        budget = result.get("budget_mb")
+        output = f"Total decoded texture memory: {result['total_memory_mb']} MB"
+        output += f" (budget: {budget} MB{', OVER BUDGET' if result.get('over_budget') else ''})\n\n" if budget else " (no budget set)\n\n"
+        for image in result.get("images", []):
+            width, height = image["size"]
+            output += f"- {image['name']}: {width}x{height}, {image['memory_mb']} MB"
+            output += f", coverage {image['screen_coverage']:.1%}"
+            output += ", packed\n" if image["packed"] else "\n"
+        return output
+    except Exception as e:
+        logger.error(f"Error getting texture memory report: {str(e)}")
+        return f"Error getting texture memory report: {str(e)}"
+
+@mcp.tool()
+def set_texture_budget(ctx: Context, budget_mb: int, enforce: bool = True, target: str = None) -> str:
+    """
+    Set a total decoded texture memory budget for the scene.
+
+    Parameters:
+    - budget_mb: The budget in MB. Use 0 to remove the budget.
+    - enforce: If True, downscale textures (or swap to lower resolution cached downloads) right away,
+      lowest screen coverage first, until the scene fits the budget (default True)
+
+    New Polyhaven textures are automatically kept within the budget once it is set.
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("set_texture_budget", {"budget_mb": budget_mb, "enforce": enforce})
+
+        if "error" in result:
+            return f"Error: {result['error']}"
+
+        if not result.get("budget_mb"):
+            return "Texture budget removed."
+        output = f"Texture budget set to {result['budget_mb']} MB."
+        if "after_mb" in result:
+            output += f" Texture memory: {result['before_mb']} MB -> {result['after_mb']} MB."
+            if result.get("reduced"):
+                output += "\nReduced images:\n"
+                for image in result["reduced"]:
+                    output += f"- {image['name']}: {image['size'][0]}x{image['size'][1]}\n"
+            if not result.get("within_budget", True):
+                output += "\nWarning: the scene is still over budget; remaining images are already at their minimum size."
+        return output
+    except Exception as e:
+        logger.error(f"Error setting texture budget: {str(e)}")
+        return f"Error setting texture budget: {str(e)}"
+
+@mcp.tool()
+def pack_material_channels(ctx: Context, material_name: str, target: str = None) -> str:
+    """
+    Pack a material's separate grayscale AO, roughness and metallic image textures into a single
+    RGB image (R=AO, G=roughness, B=metallic) and rewire the material to use it.
+    Works for Polyhaven materials as well as imported models such as Sketchfab downloads.
+
+    Parameters:
+    - material_name: Name of the material to optimize
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("pack_material_channels", {"material_name": material_name})
+
+        if "error" in result:
+            return f"Error: {result['error']}"
+        if not result.get("packed"):
+            return f"Material '{material_name}' was not changed: {result.get('reason', 'nothing to pack')}"
+        source = "reused from cache" if result.get("cached") else "newly packed"
+        return (f"Packed {', '.join(result['replaced_maps'])} of material '{result['material']}' "
+                f"into '{result['image']}' ({source}).")
+    except Exception as e:
+        logger.error(f"Error packing material channels: {str(e)}")
+        return f"Error packing material channels: {str(e)}"
+
+@mcp.tool()
+def get_polyhaven_status(ctx: Context, target: str = None) -> str:
     """
     Check if PolyHaven integration is enabled in Blender.
     Returns a message indicating whether PolyHaven features are available.
     """
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         result = blender.send_command("get_polyhaven_status")
         enabled = result.get("enabled", False)
         message = result.get("message", "")
@@ -537,7 +1846,7 @@ def get_polyhaven_status(ctx: Context) -> str:
         return f"Error checking PolyHaven status: {str(e)}"
 
 @mcp.tool()
-def get_hyper3d_status(ctx: Context) -> str:
+def get_hyper3d_status(ctx: Context, target: str = None) -> str:
     """
     Check if Hyper3D Rodin integration is enabled in Blender.
     Returns a message indicating whether Hyper3D Rodin features are available.
@@ -545,7 +1854,7 @@ def get_hyper3d_status(ctx: Context) -> str:
     Don't emphasize the key type in the returned message, but sliently remember it. 
     """
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         result = blender.send_command("get_hyper3d_status")
         enabled = result.get("enabled", False)
         message = result.get("message", "")
@@ -557,13 +1866,13 @@ def get_hyper3d_status(ctx: Context) -> str:
         return f"Error checking Hyper3D status: {str(e)}"
 
 @mcp.tool()
-def get_sketchfab_status(ctx: Context) -> str:
+def get_sketchfab_status(ctx: Context, target: str = None) -> str:
     """
     Check if Sketchfab integration is enabled in Blender.
     Returns a message indicating whether Sketchfab features are available.
     """
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         result = blender.send_command("get_sketchfab_status")
         enabled = result.get("enabled", False)
         message = result.get("message", "")
@@ -580,7 +1889,9 @@ def search_sketchfab_models(
     query: str,
     categories: str = None,
     count: int = 20,
-    downloadable: bool = True
+    downloadable: bool = True,
+    cursor: str = None,
+    target: str = None
 ) -> str:
     """
     Search for models on Sketchfab with optional filtering.
@@ -590,18 +1901,20 @@ def search_sketchfab_models(
     - categories: Optional comma-separated list of categories
     - count: Maximum number of results to return (default 20)
     - downloadable: Whether to include only downloadable models (default True)
+    - cursor: Optional continuation token from a previous search to get the next page of results
     
-    Returns a formatted list of matching models.
+    Returns a formatted list of matching models, and a cursor for the next page when more results exist.
     """
     try:
         
-        blender = get_blender_connection()
-        logger.info(f"Searching Sketchfab models with query: {query}, categories: {categories}, count: {count}, downloadable: {downloadable}")
+        blender = get_blender_connection(target)
+        logger.info(f"Searching Sketchfab models with query: {query}, categories: {categories}, count: {count}, downloadable: {downloadable}, cursor: {cursor}")
         result = blender.send_command("search_sketchfab_models", {
             "query": query,
             "categories": categories,
             "count": count,
-            "downloadable": downloadable
+            "downloadable": downloadable,
+            "cursor": cursor
         })
         
         if "error" in result:
@@ -644,6 +1957,10 @@ def search_sketchfab_models(
             formatted_output += f"  Face count: {face_count}\n"
             formatted_output += f"  Downloadable: {is_downloadable}\n\n"
         
+        next_cursor = result.get("next_cursor")
+        if next_cursor:
+            formatted_output += f"More results available. Call search_sketchfab_models again with the same query and cursor=\"{next_cursor}\" to get the next page.\n"
+        
         return formatted_output
     except Exception as e:
         logger.error(f"Error searching Sketchfab models: {str(e)}")
@@ -654,24 +1971,45 @@ def search_sketchfab_models(
 @mcp.tool()
 def download_sketchfab_model(
     ctx: Context,
-    uid: str
+    uid: str,
+    max_faces: int = None,
+    generate_lods: bool = False,
+    reuse: bool = True,
+    threaded_import: bool = False,
+    save_to_library: bool = False,
+    target: str = None
 ) -> str:
     """
     Download and import a Sketchfab model by its UID.
     
     Parameters:
     - uid: The unique identifier of the Sketchfab model
+    - max_faces: Optional face limit; the model is decimated after import if it has more.
+      Search results list each model's face count.
+    - generate_lods: If True, hidden _LOD1 and _LOD2 copies at 50% and 25% faces are added
+    - reuse: If the same model was imported before, add a linked duplicate sharing its mesh and
+      materials instead of importing it again, or load it from the local asset library if it was
+      saved there (default True)
+    - threaded_import: If True, the file is parsed off Blender's main thread so the UI stays
+      responsive for large models. Falls back to Blender's glTF importer for unsupported files.
+    - save_to_library: If True, the imported model is saved to the local asset library so later
+      sessions can load it without downloading
     
     Returns a message indicating success or failure.
     The model must be downloadable and you must have proper access rights.
     """
     try:
         
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         logger.info(f"Attempting to download Sketchfab model with UID: {uid}")
         
         result = blender.send_command("download_sketchfab_model", {
-            "uid": uid
+            "uid": uid,
+            "max_faces": max_faces,
+            "generate_lods": generate_lods,
+            "reuse": reuse,
+            "threaded_import": threaded_import,
+            "save_to_library": save_to_library
         })
         
         if result is None:
@@ -685,7 +2023,13 @@ def download_sketchfab_model(
         if result.get("success"):
             imported_objects = result.get("imported_objects", [])
             object_names = ", ".join(imported_objects) if imported_objects else "none"
-            return f"Successfully imported model. Created objects: {object_names}"
+            if result.get("linked_duplicate"):
+                return (f"Model was already imported, so linked duplicates sharing its mesh data were created: {object_names}. "
+                        "Move them to where they belong.")
+            if result.get("from_library"):
+                return f"Loaded model from the asset library. Created objects: {object_names}." + _format_polygons(result.get("polygons"))
+            return (f"Successfully imported model. Created objects: {object_names}" + _format_polygons(result.get("polygons"))
+                    + _format_library(result))
         else:
             return f"Failed to download model: {result.get('message', 'Unknown error')}"
     except Exception as e:
@@ -694,6 +2038,211 @@ def download_sketchfab_model(
         logger.error(traceback.format_exc())
         return f"Error downloading Sketchfab model: {str(e)}"
 
+@mcp.tool()
+def set_polygon_budget(ctx: Context, max_scene_faces: int, target: str = None) -> str:
+    """
+    Set a scene-wide polygon budget. Models imported from Sketchfab, PolyHaven or Hyper3D
+    are decimated so the scene stays within it.
+
+    Parameters:
+    - max_scene_faces: Maximum number of faces in the scene. Use 0 to remove the budget.
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("set_polygon_budget", {"max_scene_faces": max_scene_faces})
+
+        if "error" in result:
+            return f"Error: {result['error']}"
+        if not result.get("max_scene_faces"):
+            return f"Polygon budget removed. The scene currently has {result['scene_faces']} faces."
+        return f"Polygon budget set to {result['max_scene_faces']} faces. The scene currently has {result['scene_faces']} faces."
+    except Exception as e:
+        logger.error(f"Error setting polygon budget: {str(e)}")
+        return f"Error setting polygon budget: {str(e)}"
+
+@mcp.tool()
+def save_to_library(ctx: Context, object_names: list[str], source_id: str = None, name: str = None, target: str = None) -> str:
+    """
+    Save objects to the local asset library as a .blend file, so they can be loaded in later
+    sessions with load_from_library() instead of being downloaded or generated again.
+
+    Parameters:
+    - object_names: Names of the objects to save (children must be listed too)
+    - source_id: Optional id to save them under; defaults to "scene:<name>"
+    - name: Optional display name; defaults to the name of the root object
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("save_to_library", {
+            "object_names": object_names,
+            "source_id": source_id,
+            "name": name,
+        })
+
+        if "error" in result:
+            return f"Error: {result['error']}"
+        return (f"Saved {result['name']} ({result['faces']} faces) to the asset library "
+                f"as {result['source_id']}: {result['file']}")
+    except Exception as e:
+        logger.error(f"Error saving to library: {str(e)}")
+        return f"Error saving to library: {str(e)}"
+
+@mcp.tool()
+def load_from_library(ctx: Context, source_id: str = None, name: str = None, link: bool = False, target: str = None) -> str:
+    """
+    Load an asset from the local asset library. Much faster than downloading or generating it again.
+
+    Parameters:
+    - source_id: Id of the asset, as listed by list_library_assets() (e.g. "sketchfab:<uid>")
+    - name: Asset name, used when no source_id is given
+    - link: If True, the objects are linked from the library file instead of appended.
+      Linked objects can't be edited.
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("load_from_library", {
+            "source_id": source_id,
+            "name": name,
+            "link": link,
+        })
+
+        if "error" in result:
+            return f"Error: {result['error']}"
+        objects = ", ".join(result.get("imported_objects", [])) or "none"
+        return f"{result['message']}. Created objects: {objects}. Bounds: {result['bounds']}." + _format_polygons(result.get("polygons"))
+    except Exception as e:
+        logger.error(f"Error loading from library: {str(e)}")
+        return f"Error loading from library: {str(e)}"
+
+@mcp.tool()
+def list_library_assets(ctx: Context, query: str = None, target: str = None) -> str:
+    """
+    List the assets saved in the local asset library, with their face counts, bounds and thumbnails.
+
+    Parameters:
+    - query: Optional text to filter by name or source id
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("list_library_assets", {"query": query})
+
+        if "error" in result:
+            return f"Error: {result['error']}"
+        assets = result.get("assets", [])
+        if not assets:
+            return f"No matching assets in the library at {result.get('library')}"
+
+        output = f"{len(assets)} assets in the library at {result['library']}:\n\n"
+        for asset in assets:
+            output += f"- {asset['name']} (source id: {asset['source_id']})\n"
+            output += f"  Objects: {', '.join(asset['objects'])}\n"
+            output += f"  Faces: {asset['faces']}, bounds: {asset['bounds']}\n"
+            output += f"  Thumbnail: {asset['thumbnail']}\n\n"
+        return output
+    except Exception as e:
+        logger.error(f"Error listing library assets: {str(e)}")
+        return f"Error listing library assets: {str(e)}"
+
+@mcp.tool()
+def index_blend_library(ctx: Context, folders: list[str] = None, target: str = None) -> str:
+    """
+    Index folders of .blend files in the background, so search_blend_library() can find their
+    datablocks. Only new and changed files are read again.
+
+    Parameters:
+    - folders: Optional folders to index; defaults to the folders configured in the BlenderMCP panel
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("index_blend_library", {"folders": folders})
+
+        if "error" in result:
+            return f"Error: {result['error']}"
+        state = "Started indexing" if result.get("started") else "Indexing is already running for"
+        return (f"{state} {', '.join(result['folders'])}. "
+                f"{result['scanned']} of {result['total']} files checked so far; search with search_blend_library().")
+    except Exception as e:
+        logger.error(f"Error indexing .blend library: {str(e)}")
+        return f"Error indexing .blend library: {str(e)}"
+
+@mcp.tool()
+def search_blend_library(
+    ctx: Context,
+    query: str = "",
+    datablock_type: str = None,
+    object_type: str = None,
+    limit: int = 50,
+    target: str = None
+) -> str:
+    """
+    Search the datablocks (objects, materials, node groups, collections, ...) of the indexed
+    folders of .blend files, without opening them.
+
+    Parameters:
+    - query: Text to match in datablock or file names
+    - datablock_type: Optional bpy.data collection name to restrict to, e.g. "objects", "materials",
+      "node_groups", "collections"
+    - object_type: Optional object type for objects, e.g. "MESH", "LIGHT", "CAMERA"
+    - limit: Maximum number of results (default 50)
+
+    Append a result with bpy.data.libraries.load(file) in execute_blender_code.
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command("search_blend_library", {
+            "query": query,
+            "datablock_type": datablock_type,
+            "object_type": object_type,
+            "limit": limit,
+        })
+
+        if "error" in result:
+            return f"Error: {result['error']}"
+
+        status = result.get("status", {})
+        note = ""
+        if status.get("running"):
+            note = f" (indexing in progress: {status['scanned']} of {status['total']} files checked)"
+        matches = result.get("matches", [])
+        if not matches:
+            return f"No matches in {result['indexed_files']} indexed .blend files{note}"
+
+        by_file = {}
+        for match in matches:
+            by_file.setdefault(match["file"], []).append(match)
+        output = f"Found {len(matches)} datablocks in {result['indexed_files']} indexed .blend files{note}:\n\n"
+        for file, file_matches in by_file.items():
+            output += f"{file}\n"
+            for match in file_matches:
+                kind = match["object_type"] or match["datablock_type"]
+                output += f"  - {match['datablock_type']}: {match['name']} ({kind})\n"
+        return output
+    except Exception as e:
+        logger.error(f"Error searching .blend library: {str(e)}")
+        return f"Error searching .blend library: {str(e)}"
+
+def _format_polygons(polygons: Dict[str, Any] | None) -> str:
+    """Describe the face counts of an import, as reported by the addon's polygon budget"""
+    if not polygons:
+        return ""
+    output = f" Faces: {polygons['faces_before']}"
+    if polygons.get("decimated"):
+        output += f" -> {polygons['faces_after']} after decimation (ratio {polygons['ratio']})"
+    output += "."
+    if polygons.get("warning"):
+        output += f" Warning: {polygons['warning']}."
+    for lod in polygons.get("lods", []):
+        output += f" LODs: {', '.join(lod.values())}."
+    return output
+
+def _format_library(result: Dict[str, Any]) -> str:
+    """Describe whether an import was saved to the local asset library"""
+    if result.get("library"):
+        return f" Saved to the asset library as {result['library']['source_id']}."
+    if result.get("library_error"):
+        return f" Saving to the asset library failed: {result['library_error']}."
+    return ""
+
 def _process_bbox(original_bbox: list[float] | list[int] | None) -> list[int] | None:
     if original_bbox is None:
         return None
@@ -707,7 +2256,11 @@ def _process_bbox(original_bbox: list[float] | list[int] | None) -> list[int] |
 def generate_hyper3d_model_via_text(
     ctx: Context,
     text_prompt: str,
-    bbox_condition: list[float]=None
+    bbox_condition: list[float]=None,
+    auto_import: bool=False,
+    name: str=None,
+    use_cache: bool=True,
+    target: str = None
 ) -> str:
     """
     Generate 3D asset using Hyper3D by giving description of the desired asset, and import the asset into Blender.
@@ -717,21 +2270,32 @@ def generate_hyper3d_model_via_text(
     Parameters:
     - text_prompt: A short description of the desired model in **English**.
     - bbox_condition: Optional. If given, it has to be a list of floats of length 3. Controls the ratio between [Length, Width, Height] of the model.
+    - auto_import: If True, the model is imported as soon as it is generated, under the given name
+    - name: Name of the imported object when auto_import is True
+    - use_cache: If the identical request was generated before, import the stored model right away
+      instead of generating it again (default True)
 
+    The job is tracked in the background; use wait_for_generation() with the returned job_id instead of polling.
     Returns a message indicating success or failure.
     """
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         result = blender.send_command("create_rodin_job", {
             "text_prompt": text_prompt,
             "images": None,
             "bbox_condition": _process_bbox(bbox_condition),
+            "auto_import": auto_import,
+            "name": name,
+            "use_cache": use_cache,
         })
+        if result.get("cached"):
+            return _format_cached_generation(result)
         succeed = result.get("submit_time", False)
         if succeed:
             return json.dumps({
                 "task_uuid": result["uuid"],
                 "subscription_key": result["jobs"]["subscription_key"],
+                "job_id": result.get("job_id"),
             })
         else:
             return json.dumps(result)
@@ -744,7 +2308,11 @@ def generate_hyper3d_model_via_images(
     ctx: Context,
     input_image_paths: list[str]=None,
     input_image_urls: list[str]=None,
-    bbox_condition: list[float]=None
+    bbox_condition: list[float]=None,
+    auto_import: bool=False,
+    name: str=None,
+    use_cache: bool=True,
+    target: str = None
 ) -> str:
     """
     Generate 3D asset using Hyper3D by giving images of the wanted asset, and import the generated asset into Blender.
@@ -755,7 +2323,12 @@ def generate_hyper3d_model_via_images(
     - input_image_paths: The **absolute** paths of input images. Even if only one image is provided, wrap it into a list. Required if Hyper3D Rodin in MAIN_SITE mode.
     - input_image_urls: The URLs of input images. Even if only one image is provided, wrap it into a list. Required if Hyper3D Rodin in FAL_AI mode.
     - bbox_condition: Optional. If given, it has to be a list of ints of length 3. Controls the ratio between [Length, Width, Height] of the model.
+    - auto_import: If True, the model is imported as soon as it is generated, under the given name
+    - name: Name of the imported object when auto_import is True
+    - use_cache: If the identical request was generated before, import the stored model right away
+      instead of generating it again (default True)
 
+    The job is tracked in the background; use wait_for_generation() with the returned job_id instead of polling.
     Only one of {input_image_paths, input_image_urls} should be given at a time, depending on the Hyper3D Rodin's current mode.
     Returns a message indicating success or failure.
     """
@@ -763,31 +2336,47 @@ def generate_hyper3d_model_via_images(
         return f"Error: Conflict parameters given!"
     if input_image_paths is None and input_image_urls is None:
         return f"Error: No image given!"
+    images = None
+    image_paths = None
     if input_image_paths is not None:
         if not all(os.path.exists(i) for i in input_image_paths):
             return "Error: not all image paths are valid!"
-        images = []
-        for path in input_image_paths:
-            with open(path, "rb") as f:
-                images.append(
-                    (Path(path).suffix, base64.b64encode(f.read()).decode("ascii"))
-                )
+        # Blender reads the files itself and streams them into the upload
+        image_paths = [str(Path(path).resolve()) for path in input_image_paths]
     elif input_image_urls is not None:
-        if not all(urlparse(i) for i in input_image_paths):
+        if not all(urlparse(i) for i in input_image_urls):
             return "Error: not all image URLs are valid!"
         images = input_image_urls.copy()
     try:
-        blender = get_blender_connection()
-        result = blender.send_command("create_rodin_job", {
+        blender = get_blender_connection(target)
+        params = {
             "text_prompt": None,
             "images": images,
+            "image_paths": image_paths,
             "bbox_condition": _process_bbox(bbox_condition),
-        })
+            "auto_import": auto_import,
+            "name": name,
+            "use_cache": use_cache,
+        }
+        result = blender.send_command("create_rodin_job", params)
+        if image_paths and "not accessible from Blender" in str(result.get("error", "")):
+            # Blender runs on another machine or in a sandbox, so send the image data instead
+            images = []
+            for path in image_paths:
+                with open(path, "rb") as f:
+                    images.append(
+                        (Path(path).suffix, base64.b64encode(f.read()).decode("ascii"))
+                    )
+            params.update(images=images, image_paths=None)
+            result = blender.send_command("create_rodin_job", params)
+        if result.get("cached"):
+            return _format_cached_generation(result)
         succeed = result.get("submit_time", False)
         if succeed:
             return json.dumps({
                 "task_uuid": result["uuid"],
                 "subscription_key": result["jobs"]["subscription_key"],
+                "job_id": result.get("job_id"),
             })
         else:
             return json.dumps(result)
@@ -795,11 +2384,155 @@ def generate_hyper3d_model_via_images(
         logger.error(f"Error generating Hyper3D task: {str(e)}")
         return f"Error generating Hyper3D task: {str(e)}"
 
+@mcp.tool()
+def wait_for_generation(ctx: Context, job_id: str, timeout: int = 120, target: str = None) -> str:
+    """
+    Wait until a Hyper3D Rodin job is finished, instead of calling poll_rodin_job_status() repeatedly.
+    The addon polls the job in the background and downloads the model as soon as it is done.
+
+    Parameters:
+    - job_id: The job_id returned by generate_hyper3d_model_via_text() or generate_hyper3d_model_via_images()
+    - timeout: Maximum number of seconds to wait (up to 600). If the job isn't finished by then,
+      its current status is returned and you can wait again.
+
+    If the job was created with auto_import, the result includes the imported object; otherwise
+    import it with import_generated_asset(), which reuses the downloaded file.
+    """
+    try:
+        blender = get_blender_connection(target)
+        result = blender.send_command(
+            "wait_for_generation",
+            {"job_id": job_id, "timeout": timeout},
+            timeout=min(timeout, 600) + 15.0
+        )
+
+        if "error" in result:
+            return f"Error: {result['error']}"
+        status = result["status"]
+        elapsed = int(result.get("elapsed", 0))
+        if status == "failed":
+            return f"Generation job {job_id} failed after {elapsed}s: {result.get('error')}"
+        if status == "imported":
+            return f"Generation job {job_id} finished and was imported after {elapsed}s: {json.dumps(result.get('import_result'))}"
+        if status == "downloaded":
+            return (f"Generation job {job_id} finished after {elapsed}s and the model is downloaded. "
+                    "Import it with import_generated_asset().")
+        return (f"Generation job {job_id} is still {status} after {elapsed}s "
+                f"({result.get('polls', 0)} status checks). Call wait_for_generation() again to keep waiting.")
+    except Exception as e:
+        logger.error(f"Error waiting for Hyper3D generation: {str(e)}")
+        return f"Error waiting for Hyper3D generation: {str(e)}"
+
+def _format_cached_generation(result: Dict[str, Any]) -> str:
+    """Describe an import served from the addon's generation cache"""
+    if not result.get("succeed"):
+        return f"Found this model in the generation cache, but importing it failed: {result.get('error')}"
+    return ("This request was generated before, so the stored model was imported without a new generation task: "
+            + json.dumps({key: value for key, value in result.items() if key not in ("cached", "succeed")}))
+
+def _format_rodin_batch(manifest: Dict[str, Any]) -> str:
+    """Describe a batch manifest returned by the addon"""
+    counts = ", ".join(f"{count} {status}" for status, count in manifest.get("counts", {}).items())
+    output = f"Batch {manifest['batch_id']} is {manifest['status']} after {int(manifest['elapsed'])}s ({counts}).\n"
+    if manifest.get("quota_exceeded"):
+        output += "The Hyper3D quota was exhausted, so the remaining prompts were not submitted.\n"
+    output += "\nManifest:\n" + json.dumps(manifest["items"], indent=2)
+    if manifest["status"] != "finished":
+        output += f"\n\nCall wait_for_generation_batch(batch_id=\"{manifest['batch_id']}\") to keep waiting."
+    return output
+
+@mcp.tool()
+def generate_hyper3d_models_batch(
+    ctx: Context,
+    items: list[dict],
+    concurrency: int = 3,
+    rate_limit_per_minute: float = 10,
+    auto_import: bool = True,
+    max_faces: int = None,
+    timeout: int = 300,
+    use_cache: bool = True,
+    target: str = None
+) -> str:
+    """
+    Generate many 3D models with Hyper3D Rodin at once. The prompts are submitted concurrently,
+    and each model is imported as soon as it is generated. Much faster than generating them one by one.
+
+    Parameters:
+    - items: List of {"text_prompt": str, "bbox_condition": [Length, Width, Height] (optional), "name": str (optional)}.
+      Prompts must be in **English**.
+    - concurrency: Maximum number of jobs generating at the same time (default 3)
+    - rate_limit_per_minute: Maximum number of job submissions per minute (default 10)
+    - auto_import: Import each model when it is done (default True)
+    - max_faces: Optional face limit per imported model
+    - timeout: Seconds to wait for the whole batch (up to 600). If it isn't done by then, the
+      current manifest is returned and you can wait again with wait_for_generation_batch().
+    - use_cache: Take prompts that were generated before from the generation cache (default True)
+
+    Stops submitting when the API reports that the quota or credits are exhausted.
+    Returns a manifest with the status, job id and imported object of every item.
+    """
+    try:
+        normalized = []
+        for item in items:
+            if not item.get("text_prompt"):
+                return "Error: every item needs a text_prompt"
+            normalized.append({
+                "text_prompt": item["text_prompt"],
+                "bbox_condition": _process_bbox(item.get("bbox_condition")),
+                "name": item.get("name"),
+            })
+
+        blender = get_blender_connection(target)
+        result = blender.send_command("create_rodin_batch", {
+            "items": normalized,
+            "concurrency": concurrency,
+            "rate_limit": rate_limit_per_minute,
+            "auto_import": auto_import,
+            "max_faces": max_faces,
+            "use_cache": use_cache,
+        })
+        if "error" in result:
+            return f"Error: {result['error']}"
+
+        manifest = blender.send_command(
+            "wait_for_rodin_batch",
+            {"batch_id": result["batch_id"], "timeout": timeout},
+            timeout=min(timeout, 600) + 15.0
+        )
+        return _format_rodin_batch(manifest)
+    except Exception as e:
+        logger.error(f"Error generating Hyper3D batch: {str(e)}")
+        return f"Error generating Hyper3D batch: {str(e)}"
+
+@mcp.tool()
+def wait_for_generation_batch(ctx: Context, batch_id: str, timeout: int = 300, target: str = None) -> str:
+    """
+    Wait for a batch started with generate_hyper3d_models_batch() and return its manifest.
+
+    Parameters:
+    - batch_id: The batch id from generate_hyper3d_models_batch()
+    - timeout: Maximum number of seconds to wait (up to 600)
+    """
+    try:
+        blender = get_blender_connection(target)
+        manifest = blender.send_command(
+            "wait_for_rodin_batch",
+            {"batch_id": batch_id, "timeout": timeout},
+            timeout=min(timeout, 600) + 15.0
+        )
+        if "error" in manifest:
+            return f"Error: {manifest['error']}"
+        return _format_rodin_batch(manifest)
+    except Exception as e:
+        logger.error(f"Error waiting for Hyper3D batch: {str(e)}")
+        return f"Error waiting for Hyper3D batch: {str(e)}"
+
 @mcp.tool()
 def poll_rodin_job_status(
     ctx: Context,
     subscription_key: str=None,
     request_id: str=None,
+    target: str=None
 ):
     """
     Check if the Hyper3D Rodin generation task is completed.
@@ -822,7 +2555,7 @@ def poll_rodin_job_status(
         This is a polling API, so only proceed if the status are finally determined ("COMPLETED" or some failed state).
     """
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         kwargs = {}
         if subscription_key:
             kwargs = {
@@ -844,6 +2577,11 @@ def import_generated_asset(
     name: str,
     task_uuid: str=None,
     request_id: str=None,
+    max_faces: int=None,
+    generate_lods: bool=False,
+    threaded_import: bool=False,
+    save_to_library: bool=False,
+    target: str = None
 ):
     """
     Import the asset generated by Hyper3D Rodin after the generation task is completed.
@@ -852,14 +2590,23 @@ def import_generated_asset(
     - name: The name of the object in scene
     - task_uuid: For Hyper3D Rodin mode MAIN_SITE: The task_uuid given in the generate model step.
     - request_id: For Hyper3D Rodin mode FAL_AI: The request_id given in the generate model step.
+    - max_faces: Optional face limit; the mesh is decimated after import if it has more
+    - generate_lods: If True, hidden _LOD1 and _LOD2 copies at 50% and 25% faces are added
+    - threaded_import: If True, the GLB is parsed off Blender's main thread so the UI stays responsive
+    - save_to_library: If True, the imported asset is saved to the local asset library under the
+      source id "hyper3d:<task_uuid or request_id>", so it can be loaded again in later sessions
 
     Only give one of {task_uuid, request_id} based on the Hyper3D Rodin Mode!
     Return if the asset has been imported successfully.
     """
     try:
-        blender = get_blender_connection()
+        blender = get_blender_connection(target)
         kwargs = {
-            "name": name
+            "name": name,
+            "max_faces": max_faces,
+            "generate_lods": generate_lods,
+            "threaded_import": threaded_import,
+            "save_to_library": save_to_library,
         }
         if task_uuid:
             kwargs["task_uuid"] = task_uuid
@@ -877,6 +2624,8 @@ def asset_creation_strategy() -> str:
     return """When creating 3D content in Blender, always start by checking if integrations are available:
 
     0. Before anything, always check the scene from get_scene_info()
+       Use list_library_assets() to see assets saved in earlier sessions; load_from_library() is
+       much faster than downloading or generating them again.
     1. First use the following tools to verify if the following integrations are enabled:
         1. PolyHaven
             Use get_polyhaven_status() to verify its status
@@ -909,13 +2658,16 @@ def asset_creation_strategy() -> str:
                     - Wait for another day and try again
                     - Go to hyper3d.ai to find out how to get their own API key
                     - Go to fal.ai to get their own private API key
-                2. Poll the status
-                    - Use poll_rodin_job_status() to check if the generation task has completed or failed
+                2. Wait for the generation
+                    - Use wait_for_generation() with the job_id to wait until the task has completed or failed
+                    - Pass auto_import=True when creating the task to have the model imported as soon as it is done
                 3. Import the asset
                     - Use import_generated_asset() to import the generated GLB model the asset
                 4. After importing the asset, ALWAYS check the world_bounding_box of the imported mesh, and adjust the mesh's location and size
                     Adjust the imported mesh's location, scale, rotation, so that the mesh is on the right spot.
 
+                To generate several models, use generate_hyper3d_models_batch() instead of generating them one by one.
+
                 You can reuse assets previous generated by running python code to duplicate the object, without creating another generation task.
 
     3. Always check the world_bounding_box for each item so that:
@@ -941,6 +2693,28 @@ def asset_creation_strategy() -> str:
 
 def main():
     """Run the MCP server"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="BlenderMCP server")
+    parser.add_argument(
+        "--instance", action="append", default=[], metavar="NAME=HOST:PORT[+HOST:PORT...]",
+        help="Blender instance to drive, with optional read-only replicas. Can be repeated."
+    )
+    parser.add_argument(
+        "--discover", metavar="START-END",
+        help="Probe this port range on localhost for more instances"
+    )
+    args = parser.parse_args()
+
+    # BLENDER_INSTANCES takes the same specs, comma separated
+    for specs in [os.environ.get("BLENDER_INSTANCES", "")] + args.instance:
+        _connections.configure(specs)
+    port_range = args.discover or os.environ.get("BLENDER_DISCOVER_PORTS")
+    if port_range:
+        start, _, end = port_range.partition("-")
+        found = _connections.discover(int(start), int(end or start))
+        logger.info(f"Discovered Blender instances: {', '.join(found) or 'none'}")
+
     mcp.run()
 
 if __name__ == "__main__":
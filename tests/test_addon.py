@@ -0,0 +1,29 @@
+"""Checks of addon helpers; these need Blender's Python (blender -b --python-expr "import pytest; pytest.main(['tests'])")"""
+
+import base64
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("bpy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from addon import BlenderMCPServer  # noqa: E402
+
+
+def test_generation_key_hashes_base64_images_like_files(tmp_path):
+    image = tmp_path / "input.png"
+    image.write_bytes(b"\x89PNG\r\n\x1a\n not really a png")
+
+    from_path = BlenderMCPServer._rodin_generation_key("MAIN_SITE", image_paths=[str(image)])
+    # MAIN_SITE requests carry (suffix, base64 data) pairs
+    from_base64 = BlenderMCPServer._rodin_generation_key(
+        "MAIN_SITE", images=[(".png", base64.b64encode(image.read_bytes()).decode("ascii"))]
+    )
+    assert from_base64 == from_path
+
+    other = BlenderMCPServer._rodin_generation_key(
+        "MAIN_SITE", images=[(".png", base64.b64encode(b"other bytes").decode("ascii"))]
+    )
+    assert other != from_base64
@@ -0,0 +1,134 @@
+"""FrameDistributor against stand-in addon servers speaking the addon's socket protocol"""
+
+import json
+import os
+import socket
+import sys
+import threading
+
+import pytest
+
+pytest.importorskip("mcp")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from blender_mcp.server import FrameDistributor  # noqa: E402
+
+
+class StandInAddon:
+    """Answers render_scene, get_render_status and get_render_result like the addon's render queue"""
+
+    def __init__(self, failing_frames=()):
+        self.failing_frames = set(failing_frames)
+        self.rendered = []
+        self.jobs = {}
+        self.listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.listener.bind(("127.0.0.1", 0))
+        self.listener.listen()
+        self.port = self.listener.getsockname()[1]
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    def _serve(self):
+        while True:
+            try:
+                client, _ = self.listener.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(client,), daemon=True).start()
+
+    def _handle(self, client):
+        buffer = b""
+        with client:
+            while True:
+                data = client.recv(65536)
+                if not data:
+                    return
+                buffer += data
+                try:
+                    command = json.loads(buffer.decode("utf-8"))
+                except json.JSONDecodeError:
+                    continue
+                buffer = b""
+                client.sendall(self._execute(command["type"], command.get("params", {})))
+
+    def _execute(self, command_type, params):
+        if command_type == "render_scene":
+            job_id = f"job{len(self.jobs)}"
+            self.jobs[job_id] = params["frame_start"]
+            return self._response({"id": job_id, "status": "queued"})
+        if command_type == "get_render_status":
+            frame = self.jobs[params["job_id"]]
+            if frame in self.failing_frames:
+                return self._response({"id": params["job_id"], "status": "failed", "failure": "Render crashed"})
+            return self._response({"id": params["job_id"], "status": "done",
+                                   "frames": [{"frame": frame, "seconds": 0.01}]})
+        if command_type == "get_render_result":
+            self.rendered.append(params["frame"])
+            data = f"frame {params['frame']}".encode("ascii")
+            header = json.dumps({"status": "success", "result": {"frame": params["frame"]},
+                                 "binary_length": len(data)})
+            return header.encode("utf-8") + data
+        if command_type == "cancel_render":
+            return self._response({"cancelled": True})
+        return json.dumps({"status": "error", "message": f"Unknown command type: {command_type}"}).encode("utf-8")
+
+    @staticmethod
+    def _response(result):
+        return json.dumps({"status": "success", "result": result}).encode("utf-8")
+
+    def close(self):
+        self.listener.close()
+
+
+@pytest.fixture
+def addons():
+    started = []
+
+    def start(*failing):
+        started.extend(StandInAddon(frames) for frames in failing)
+        return started
+
+    yield start
+    for addon in started:
+        addon.close()
+
+
+def _distribute(tmp_path, instances, frames, **options):
+    distributor = FrameDistributor(
+        [("127.0.0.1", addon.port) for addon in instances], {"engine": "EEVEE"}, str(tmp_path),
+        poll_interval=0.01, **options
+    )
+    distributor.start(frames)
+    assert distributor.wait(10), "distributed render did not finish"
+    return distributor.manifest()
+
+
+def test_frames_are_gathered_from_every_instance(tmp_path, addons):
+    instances = addons((), ())
+    manifest = _distribute(tmp_path, instances, range(1, 21))
+
+    assert manifest["counts"] == {"done": 20}
+    assert sorted(instances[0].rendered + instances[1].rendered) == list(range(1, 21))
+    for frame in range(1, 21):
+        with open(tmp_path / f"frame_{frame:04d}.png", "rb") as f:
+            assert f.read() == f"frame {frame}".encode("ascii")
+    assert os.path.exists(tmp_path / "manifest.json")
+
+
+def test_failed_frame_is_retried_on_another_instance(tmp_path, addons):
+    instances = addons({3}, ())
+    manifest = _distribute(tmp_path, instances, range(1, 7))
+
+    assert manifest["counts"] == {"done": 6}
+    frame = manifest["frames"][2]
+    assert frame["endpoint"] == f"127.0.0.1:{instances[1].port}"
+
+
+def test_frame_failing_everywhere_is_marked_failed(tmp_path, addons):
+    instances = addons({3}, {3})
+    manifest = _distribute(tmp_path, instances, range(1, 7), max_attempts=3)
+
+    assert manifest["counts"] == {"done": 5, "failed": 1}
+    frame = manifest["frames"][2]
+    assert frame["status"] == "failed"
+    assert len(frame["attempts"]) == 3
+    assert all(worker["status"] == "finished" for worker in manifest["workers"].values())